@@ -0,0 +1,80 @@
+import concurrent.futures
+import itertools
+import os
+from collections.abc import Mapping
+import numpy
+import EC0
+from EC0 import Glossary
+from Settings import DesignEquation, UnitConversion
+"""
+Evaluates one EC0 equation over many input tuples across a process pool.
+
+	inputs = ((E_d, R_d) for E_d, R_d in elements)
+	utilisations = Batch("Eq8_1", inputs, chunksize=2000)
+
+Inputs are sharded into chunks which are evaluated in worker processes and
+returned in input order, either as a NumPy array of the result numbers
+(output="array") or as a list of equation objects (output="objects"). Each
+item is a tuple of positional arguments or a mapping of keyword arguments.
+"""
+
+
+def _resolve(equation):
+	if isinstance(equation, str):
+		resolved = getattr(EC0, equation.rsplit(".", 1)[-1], None)
+		if not (isinstance(resolved, type) and issubclass(resolved, DesignEquation)):
+			raise ValueError(f"Argument 'equation' must name an EC0 equation; got '{equation}'.")
+		return resolved
+	return equation
+
+
+def _chunks(inputs, size: int):
+	iterator = iter(inputs)
+	while True:
+		chunk = list(itertools.islice(iterator, size))
+		if not chunk:
+			return
+		yield chunk
+
+
+def Preload():
+	"""Loads the unit and glossary tables, once per worker process."""
+	UnitConversion.Registry()
+	Glossary.Definitions()
+
+
+def _evaluate(equation, chunk: list, output: str):
+	results = [
+	    equation(**arguments) if isinstance(arguments, Mapping) else equation(*arguments)
+	    for arguments in chunk
+	]
+	if output == "array":
+		return numpy.fromiter((result.number for result in results), float, len(results))
+	return results
+
+
+def Batch(equation, inputs, workers: int = None, chunksize: int = 1000,
+          output: str = "array"):
+	equation = _resolve(equation)
+	if output not in ("array", "objects"):
+		raise ValueError(f"Argument 'output' must be 'array' or 'objects'; got '{output}'.")
+	if chunksize < 1:
+		raise ValueError(f"Argument 'chunksize' must be at least 1; got {chunksize}.")
+	if workers is None:
+		workers = os.cpu_count() or 1
+
+	chunks = _chunks(inputs, chunksize)
+	if workers == 1:
+		# Small batches are not worth the start-up cost of a pool
+		Preload()
+		results = [_evaluate(equation, chunk, output) for chunk in chunks]
+	else:
+		with concurrent.futures.ProcessPoolExecutor(max_workers=workers,
+		                                            initializer=Preload) as executor:
+			results = list(
+			    executor.map(_evaluate, itertools.repeat(equation), chunks,
+			                 itertools.repeat(output)))
+
+	if output == "array":
+		return numpy.concatenate(results) if results else numpy.empty(0)
+	return [result for chunk in results for result in chunk]
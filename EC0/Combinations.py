@@ -0,0 +1,155 @@
+import numpy
+from Settings import DesignValue, DesignFactor, DesignValueArray, DesignFactorArray
+from Settings.UnitConversion import Scale
+from EC0 import Eq6_1
+from EC0 import Eq6_2
+from EC0 import Eq6_3
+from EC0 import Eq8_10
+"""
+Enumerates the combinations of variable actions from BS EN 1990:2023, with each
+action taken in turn as the leading action:
+
+ULS:             gamma_{Q,1} * Q_{k,1} + sum gamma_{Q,i} * psi_{0,i} * Q_{k,i}
+Characteristic:  Q_{k,1} + sum psi_{0,i} * Q_{k,i}
+Frequent:        psi_{1,1} * Q_{k,1} + sum psi_{2,i} * Q_{k,i}
+Quasi-permanent: sum psi_{2,i} * Q_{k,i}
+
+Inputs:
+	Q_k     (list of DesignValue or DesignValueArray): Characteristic actions 'Q_{k}'
+	psi_0   (list of DesignFactor or DesignFactorArray): Combination factors 'psi_{0}'
+	psi_1   (list of DesignFactor or DesignFactorArray): Frequent factors 'psi_{1}'
+	psi_2   (list of DesignFactor or DesignFactorArray): Quasi-permanent factors 'psi_{2}'
+	gamma_Q (list of DesignFactor or DesignFactorArray): Partial factors 'gamma_{Q}'
+
+	A single DesignFactor may be given instead of a list to apply it to every action.
+	All actions are treated as unfavourable and converted to the units of the first.
+
+Output:
+	ULS, characteristic, frequent, quasiPermanent (DesignValueArray): Total 'E_{d}'
+	for each choice of leading action.
+"""
+
+
+def Actions(actions, argument: str, abbreviation: str) -> tuple:
+	"""Joins DesignValues and DesignValueArrays with the expected abbreviation into
+	one DesignValueArray in the units of the first, returning it and the name of
+	each action (array items numbered from 1 after the array's name)."""
+	actions = [actions] if isinstance(actions, DesignValue) else list(actions)
+	if not actions:
+		raise ValueError(f"Argument '{argument}' must contain at least one action.")
+
+	units = None
+	numbers = []
+	names = []
+	for action in actions:
+		if not isinstance(action, DesignValue):
+			raise TypeError(
+			    f"Argument '{argument}' must contain DesignValue objects, not {type(action).__name__}."
+			)
+		if action.abbreviation != abbreviation:
+			raise ValueError(
+			    f"Argument '{argument}' must have abbreviation '{abbreviation}'; got '{action.abbreviation}'."
+			)
+		if units is None:
+			units = action.units
+		factor = 1.0 if action.units == units else Scale(action.units, units)
+		numbers.append(numpy.atleast_1d(action.number) * factor)
+		if isinstance(action, DesignValueArray):
+			names += [f"{action.name}{index + 1}" for index in range(len(action))]
+		else:
+			names.append(action.name)
+
+	return DesignValueArray(abbreviation, numpy.concatenate(numbers), units), names
+
+
+class Combinations(object):
+	standard = "BS EN 1990:2023"
+	section = "8 Verification by the partial factor method"
+	combinations = ("ULS", "characteristic", "frequent", "quasi-permanent")
+
+	def __init__(self, Q_k, psi_0, psi_1, psi_2, gamma_Q):
+		Q_k, self.names = Actions(Q_k, "Q_k", "Q_{k}")
+		count = len(Q_k)
+		psi_0 = self._factors("psi_0", "psi_{0}", psi_0, count)
+		psi_1 = self._factors("psi_1", "psi_{1}", psi_1, count)
+		psi_2 = self._factors("psi_2", "psi_{2}", psi_2, count)
+		gamma_Q = self._factors("gamma_Q", "gamma_{Q}", gamma_Q, count)
+
+		# Representative values of every action, one vectorised equation each
+		Q_comb = Eq6_1(psi_0, Q_k)
+		Q_freq = Eq6_2(psi_1, Q_k)
+		Q_qper = Eq6_3(psi_2, Q_k)
+
+		# (leading, accompanying) contribution of each action to each combination
+		contributions = {
+		    "ULS": (Eq8_10(gamma_Q, Q_k).number, Eq8_10(gamma_Q, Q_comb).number),
+		    "characteristic": (Q_k.number, Q_comb.number),
+		    "frequent": (Q_freq.number, Q_qper.number),
+		    "quasi-permanent": (Q_qper.number, Q_qper.number),
+		}
+
+		self.Q_k = Q_k
+		self.psi_0 = psi_0
+		self.psi_1 = psi_1
+		self.psi_2 = psi_2
+		self.gamma_Q = gamma_Q
+		self.contributions = contributions
+		self.results = {}
+		for combination, (leading, accompanying) in contributions.items():
+			# When action i leads, its accompanying contribution is replaced by its leading one
+			total = accompanying.sum() - accompanying + leading
+			self.results[combination] = DesignValueArray("E_{d}", total, Q_k.units, combination)
+
+		self.ULS = self.results["ULS"]
+		self.characteristic = self.results["characteristic"]
+		self.frequent = self.results["frequent"]
+		self.quasiPermanent = self.results["quasi-permanent"]
+
+	@staticmethod
+	def _factors(argument, abbreviation, factors, count) -> DesignFactorArray:
+		# A single factor (or factor array) applies to every action
+		factors = [factors] if isinstance(factors, DesignFactor) else list(factors)
+
+		numbers = []
+		for factor in factors:
+			if not isinstance(factor, DesignFactor):
+				raise TypeError(
+				    f"Argument '{argument}' must contain DesignFactor objects, not {type(factor).__name__}."
+				)
+			if factor.abbreviation != abbreviation:
+				raise ValueError(
+				    f"Argument '{argument}' must have abbreviation '{abbreviation}'; got '{factor.abbreviation}'."
+				)
+			numbers.append(numpy.atleast_1d(factor.number))
+		number = numpy.concatenate(numbers)
+
+		if len(number) == 1:
+			number = numpy.repeat(number, count)
+		if len(number) != count:
+			raise ValueError(
+			    f"Argument '{argument}' must have one factor per action; got {len(number)} for {count}."
+			)
+		return DesignFactorArray(abbreviation, number)
+
+	def governing(self, combination: str = "ULS") -> DesignValue:
+		"""Returns the largest total of a combination, named after its leading action."""
+		if combination not in self.results:
+			raise ValueError(
+			    f"Argument 'combination' must be one of {self.combinations}; got '{combination}'."
+			)
+		result = self.results[combination]
+		index = int(numpy.argmax(result.number))
+		name = combination
+		if self.names[index] != "" and combination != "quasi-permanent":
+			name += "," + self.names[index]
+		return DesignValue(result.abbreviation, float(result.number[index]), result.units,
+		                   name)
+
+	def __str__(self):
+		output = self.standard + ":\n  "
+		output += "Section: " + self.section + "\n  "
+		output += "Actions: " + str(len(self.Q_k)) + "\n  "
+		output += "Governing:\n"
+		for combination in self.combinations:
+			output += "	" + str(self.governing(combination)) + "\n"
+		return output
@@ -0,0 +1,24 @@
+# Generated by 'python -m Settings.BuildTables' from definitions.csv.
+# Do not edit; rebuild after changing the tables.
+# (source, size, CRC-32) of each source when built
+signature = (('definitions.csv', 1470, 4246132025),)
+TABLE = {
+	'E_{d}': 'Design value of effect of actions',
+	'Q_{comb}': 'Combination value of a variable action.',
+	'Q_{d}': 'Design value of a variable action.',
+	'Q_{k}': 'Characteristic value of a variable action.',
+	'Q_{rep}': 'Representative value of a variable action.',
+	'R_{d}': 'Design value of the resistance',
+	'gamma_{Q}': 'Partial factor for variable actions',
+	'psi': 'Combination factor applied to a characteristic variable action',
+	'psi_{j}': 'Reduction coefficient taking into account the probability that the footfall frequency (jogging) approaches the critical range of natural frequencies under consideration',
+	'psi_{W}': 'Reduction coefficient taking into account the probability that the footfall frequency (walking) approaches the critical range of natural frequencies under consideration',
+	'psi_{0}': 'Combination factor applied to a variable action to determine its combination value.',
+	'psi_{1}': 'Combination factor applied to a variable action to determine its frequent value',
+	'psi_{2}': 'Combination factor applied to a variable action to determine its quasi-permanent value',
+	'psi_{0,j}': 'Combination factor applied to variable action j to determine its combination value',
+	'psi_{1,j}': 'Combination factor applied to variable action j to determine its frequent value',
+	'psi_{2,j}': 'Combination factor applied to variable action j to determine its quasi-permanent value',
+	'omega_{Cd}': 'Tilt',
+	'Utilisation': 'Factor of efficiency (or capacity) that represents the effort being used.',
+}
@@ -0,0 +1,202 @@
+import heapq
+from collections import namedtuple
+import numpy
+from Settings import DesignEquation
+from Settings.UnitConversion import Scale
+"""
+Streaming envelope of equation results, such as the utilisations of Eq8_1 and
+Eq8_2, kept without holding on to the results themselves.
+
+	envelope = Envelope(k=10)
+	for case, E_d in cases:                            # one batch per load case
+		envelope.add(Eq8_1(E_d, R_d), case=case)       # elements by position
+	envelope.maximum                                   # per element, over all cases
+	envelope.governing()[0].inputs                     # E_d and R_d of the worst
+
+Every result added updates, per element, the maximum and minimum numbers and
+the case giving the maximum, plus the k largest results overall. Memory is
+O(elements + k) whatever the number of results added.
+
+A result is an equation object or a DesignValue/DesignFactor, scalar or batch.
+Elements are identified either by position (an int for a scalar result, None
+or integer indices for a batch) or by key (any other hashable, one per batch
+item; a scalar result defaults to the name of its result); an envelope uses
+one or the other. Numbers with units are converted to the units of the first
+result added.
+"""
+
+# One of the k largest results, with the inputs of the equation that gave it
+Governing = namedtuple("Governing", ["number", "element", "case", "inputs"])
+
+
+class Envelope(object):
+
+	def __init__(self, k: int = 10):
+		if k < 0:
+			raise ValueError(f"Argument 'k' must not be negative; got {k}.")
+		self.k = k
+		self.count = 0
+		self.units = None
+		self.cases = []
+		# Element keys in index order, when elements are keyed
+		self.elements = []
+		self._index = {}
+		self._keyed = None
+		self._size = 0
+		self._maximum = numpy.empty(0)
+		self._minimum = numpy.empty(0)
+		self._maximumCase = numpy.empty(0, int)
+		self._caseIndex = {}
+		self._heap = []
+		self._sequence = 0
+
+	@property
+	def maximum(self) -> numpy.ndarray:
+		return self._maximum[:self._size]
+
+	@property
+	def minimum(self) -> numpy.ndarray:
+		return self._minimum[:self._size]
+
+	@property
+	def maximumCase(self) -> list:
+		"""The case giving the maximum of each element."""
+		return [self.cases[index] for index in self._maximumCase[:self._size]]
+
+	def __len__(self):
+		return self._size
+
+	def _numbers(self, result):
+		number = result.number
+		units = getattr(result, "units", None)
+		if self.count == 0:
+			self.units = units
+		elif units != self.units:
+			if units is None or self.units is None:
+				raise ValueError(
+				    f"Argument 'result' must have units '{self.units}'; got '{units}'.")
+			number = number * Scale(units, self.units)
+		return numpy.atleast_1d(numpy.asarray(number, float))
+
+	def _mode(self, keyed: bool):
+		if self._keyed is None:
+			self._keyed = keyed
+		elif self._keyed != keyed:
+			raise ValueError("Argument 'elements' must be all positions or all keys.")
+
+	def _indices(self, elements, result, count: int, batch: bool) -> numpy.ndarray:
+		if elements is None:
+			if batch:
+				self._mode(False)
+				return numpy.arange(count)
+			elements = result.name
+		if batch:
+			indices = numpy.asarray(elements)
+			if indices.dtype.kind in "iu":
+				self._mode(False)
+			else:
+				self._mode(True)
+				indices = numpy.fromiter((self._key(key) for key in elements), int, count)
+		elif isinstance(elements, (int, numpy.integer)):
+			self._mode(False)
+			indices = numpy.array([elements])
+		else:
+			self._mode(True)
+			indices = numpy.array([self._key(elements)])
+		if len(indices) != count:
+			raise ValueError(
+			    f"Argument 'elements' must have one element per result; got {len(indices)} for {count}."
+			)
+		if count and indices.min() < 0:
+			raise ValueError("Argument 'elements' must not contain negative positions.")
+		return indices
+
+	def _key(self, key) -> int:
+		index = self._index.get(key)
+		if index is None:
+			index = self._index[key] = len(self.elements)
+			self.elements.append(key)
+		return index
+
+	def _grow(self, size: int):
+		if size <= self._size:
+			return
+		if size > len(self._maximum):
+			capacity = max(size, 2 * len(self._maximum))
+			grown = capacity - len(self._maximum)
+			self._maximum = numpy.concatenate([self._maximum, numpy.full(grown, -numpy.inf)])
+			self._minimum = numpy.concatenate([self._minimum, numpy.full(grown, numpy.inf)])
+			self._maximumCase = numpy.concatenate(
+			    [self._maximumCase, numpy.zeros(grown, int)])
+		self._size = size
+
+	def add(self, result, elements=None, case=None):
+		"""Adds a scalar or batch result, returning the envelope."""
+		numbers = self._numbers(result)
+		batch = getattr(result.number, "ndim", 0) > 0
+		indices = self._indices(elements, result, len(numbers), batch)
+		if len(numbers) == 0:
+			return self
+		self._grow(int(indices.max()) + 1)
+
+		caseIndex = self._caseIndex.get(case)
+		if caseIndex is None:
+			caseIndex = self._caseIndex[case] = len(self.cases)
+			self.cases.append(case)
+		# ufunc.at applies repeated elements of a batch in turn
+		numpy.maximum.at(self._maximum, indices, numbers)
+		numpy.minimum.at(self._minimum, indices, numbers)
+		attained = numbers == self._maximum[indices]
+		self._maximumCase[indices[attained]] = caseIndex
+
+		self._governing(result, numbers, indices, case, batch)
+		self.count += len(numbers)
+		return self
+
+	def _governing(self, result, numbers, indices, case, batch: bool):
+		if self.k == 0:
+			return
+		# Only the k largest of the batch can enter the heap
+		candidates = numpy.arange(len(numbers))
+		if len(numbers) > self.k:
+			candidates = numpy.argpartition(numbers, -self.k)[-self.k:]
+		for position in candidates:
+			number = float(numbers[position])
+			if len(self._heap) == self.k and number <= self._heap[0][0]:
+				continue
+			element = int(indices[position])
+			if self._keyed:
+				element = self.elements[element]
+			governing = Governing(number, element, case,
+			                      self._inputs(result, position if batch else None))
+			self._sequence += 1
+			if len(self._heap) < self.k:
+				heapq.heappush(self._heap, (number, self._sequence, governing))
+			else:
+				heapq.heapreplace(self._heap, (number, self._sequence, governing))
+
+	@staticmethod
+	def _inputs(result, position) -> dict:
+		# The scalar inputs that produced one result of a batch
+		if not isinstance(result, DesignEquation) or result.schema is None:
+			return {}
+		inputs = {}
+		for name in result.schema.inputs:
+			value = getattr(result, name)
+			if position is not None and getattr(value.number, "ndim", 0):
+				value = value[position]
+			inputs[name] = value
+		return inputs
+
+	def governing(self) -> list:
+		"""Returns the k largest results added, largest first."""
+		return [entry[2] for entry in sorted(self._heap, reverse=True)]
+
+	def __str__(self):
+		output = f"Envelope of {self.count} results over {self._size} elements:\n"
+		for governing in self.governing():
+			output += f"\t{governing.number:.4} at {governing.element!r}"
+			if governing.case is not None:
+				output += f" ({governing.case})"
+			output += "\n"
+		return output
@@ -1,5 +1,5 @@
 import logging
-from Settings import DesignValue, DesignFactor, DesignEquation
+from Settings import DesignValue, DesignFactor, DesignEquation, Trace
 from EC0.Glossary import Glossary
 """
 Implements Equation (6.1) from BS EN 1990:2023, Clause 6.1.2.3 (3):
@@ -20,8 +20,7 @@ being implemented. The metadata ensures any engineer (new or experienced) can ve
 the formula.
 """
 
-# Configure basic logging
-logging.basicConfig(level=logging.DEBUG)
+# Traces are emitted here when Settings.Trace is enabled
 logger = logging.getLogger(__name__)
 
 
@@ -36,6 +35,12 @@ class Eq6_1(DesignEquation):
 	equation = "(6.1)"
 	formula = "Q_{comb} = psi_{0} * Q_{k}"
 
+	# Schema: result, expected abbreviations and units behaviour
+	output = "Q_comb"
+	Q_comb: DesignValue
+	abbreviations = {"psi_0": "psi_{0}", "Q_k": "Q_{k}", "Q_comb": "Q_{comb}"}
+	unitsFrom = "Q_k"
+
 	def __init__(self, psi_0: DesignFactor, Q_k: DesignValue):
 		# Input validation
 		""" Principle 2: Validate Inputs Early
@@ -45,31 +50,17 @@ class Eq6_1(DesignEquation):
 			flag mistakes at once. 
 			Input validation helps ensure that the data being processed is accurate and free 
 			from errors, which is crucial in safety-critical calculations.
+			The expected types come from the annotations of __init__ and the expected 
+			abbreviations from the class attributes above; both are collected once into 
+			the class schema when the class is created.
 		"""
-		if not isinstance(psi_0, DesignFactor):
-			raise TypeError(
-				f"Argument 'psi_0' must be of type DesignFactor, not {type(psi_0).__name__}."
-			)
-		if psi_0.abbreviation != "psi_{0}":
-			raise ValueError(
-				f"Argument 'psi_0' must have abbreviation 'psi_0'; got '{psi_0.abbreviation}'."
-			)
+		self.schema.validate(psi_0, Q_k)
 		""" Principle 3: Use Meaningful Errors and Exceptions
-			The code above raises explicit 'TypeError' or 'ValueError' with clear messages. 
+			The schema raises explicit 'TypeError' or 'ValueError' with clear messages. 
 			This makes debugging straightforward. 
 			For a new engineer, a message like “must be of type DesignValue” pinpoints 
 			the problem immediately. 
 		"""
-		if Q_k.abbreviation != "Q_{k}":
-			raise ValueError("Argument 'Q_k' must have abbreviation 'Q_{k}'")
-
-		# Log validated inputs
-		""" Principle 4: Log Key Steps for Traceability 
-			In this example, this function uses logger.debug to record both the validated inputs 
-			and the final result.
-		"""
-		logger.debug(
-			f"Eq6_1 input: psi_0=%s, Q_k=%s {psi_0:value}, {Q_k:value}")
 
 		# Pre-Calculation Unit Conversion
 		""" Principle 5: Enfore Unit Consistency
@@ -98,15 +89,21 @@ class Eq6_1(DesignEquation):
 
 		"""
 		abbreviation = "Q_{comb}"
-		units = Q_k.units  #Inherits units from Q_k
+		units = self.schema.units(psi_0, Q_k)  #Inherits units from Q_k (unitsFrom)
 		name = Q_k.name
-		Q_comb = DesignValue(abbreviation, number, units, name)
+		Q_comb = self._designValue(abbreviation, number, units, name)
 
 		# Post-Calcualtion Unit Conversion
 		# No unit conversion required here
 
-		# Log calculated result
-		logger.debug(f"Eq6_1 result: Q_comb=%s{Q_comb:value}")
+		# Log validated inputs and calculated result
+		""" Principle 4: Log Key Steps for Traceability 
+			In this example, this function traces both the validated inputs and the final 
+			result in one structured record. The record is only built while Settings.Trace 
+			is enabled, so an untraced calculation does no string formatting at all.
+		"""
+		if Trace.enabled:
+			Trace.Record(logger, "Eq6_1", {"psi_0": psi_0, "Q_k": Q_k}, {"Q_comb": Q_comb})
 
 		# Store attributes
 		self.psi_0 = psi_0
@@ -121,8 +118,8 @@ class Eq6_1(DesignEquation):
 		Most people using this equation will do so like this:
 		Load = Eq6_1(psi_0, Q_k) 
 		
-		The class’s use of __getattr__ to forward any attributes of the object 
-		to Q_comb makes it easy to access the result for example if the script 
+		DesignEquation's use of __getattr__ to forward any attributes of the object 
+		to the schema output, Q_comb, makes it easy to access the result for example if the script 
 		was used. Without the __getattr__ the result would have to be accessed as:
 		Load.Q_comb.number
 		
@@ -134,19 +131,6 @@ class Eq6_1(DesignEquation):
 		Load.Q_k.number
 	"""
 
-	def __getattr__(self, name):
-		if hasattr(self.Q_comb, name):
-			return getattr(self.Q_comb, name)
-		raise AttributeError(
-			f"{self.__class__.__name__} has no attribute '{name}'.")
-
-	def __format__(self, format_spec):
-		if format_spec == "value":
-			return str(self.Q_comb)
-		if format_spec == "short":
-			return self.parameters()
-		return str(self)
-
 	# Printable string output
 	""" Principle 9: Provide a clear output interface
 		Our example uses a custom __str__ method that inherits from the DesignCalculation class. 
@@ -1,5 +1,5 @@
 import logging
-from Settings import DesignValue, DesignFactor, DesignEquation
+from Settings import DesignValue, DesignFactor, DesignEquation, Trace
 from EC0.Glossary import Glossary
 """
 Implements Equation (6.2) from BS EN 1990:2023, Clause 6.1.2.3 (3):
@@ -14,8 +14,7 @@ Output:
 	Q_freq (DesignValue): Frequent value of a variable action 'Q_{freq}'
 """
 
-# Configure basic logging
-logging.basicConfig(level=logging.DEBUG)
+# Traces are emitted here when Settings.Trace is enabled
 logger = logging.getLogger(__name__)
 
 
@@ -27,29 +26,18 @@ class Eq6_2(DesignEquation):
 	equation = "(6.2)"
 	formula = "Q_{freq} = psi_{1} * Q_{k}"
 
+	# Schema: result, expected abbreviations and units behaviour
+	output = "Q_freq"
+	Q_freq: DesignValue
+	abbreviations = {"psi_1": "psi_{1}", "Q_k": "Q_{k}", "Q_freq": "Q_{freq}"}
+	unitsFrom = "Q_k"
+
 	def __init__(self, psi_1: DesignFactor, Q_k: DesignValue):
 		# Input validation
-		if not isinstance(psi_1, DesignFactor):
-			raise TypeError(
-				f"Argument 'psi_1' must be of type DesignFactor, not {type(psi_1).__name__}."
-			)
-		if not isinstance(Q_k, DesignValue):
-			raise TypeError(
-				f"Argument 'Q_k' must be of type DesignValue, not {type(psi_1).__name__}."
-			)
-		if psi_1.abbreviation != "psi_{1}":
-			raise ValueError(
-				f"Argument 'psi_1' must have abbreviation 'psi_1'; got '{psi_1.abbreviation}'."
-			)
-		if Q_k.abbreviation != "Q_{k}":
-			raise ValueError("Argument 'Q_k' must have abbreviation 'Q_{k}'")
-
-		# Log validated inputs
-		logger.debug(
-			f"Eq6_2 input: {psi_1:value}, {Q_k:value}")
+		self.schema.validate(psi_1, Q_k)
 
 		# Pre-Calculation Unit Conversion
-		units = Q_k.units  #Inherits units from Q_k
+		units = self.schema.units(psi_1, Q_k)  #Inherits units from Q_k (unitsFrom)
 
 		# Core calculation
 		number = psi_1.number * Q_k.number
@@ -57,13 +45,14 @@ class Eq6_2(DesignEquation):
 		# Encapsulate
 		abbreviation = "Q_{freq}"
 		name = Q_k.name
-		Q_freq = DesignValue(abbreviation, number, units, name)
+		Q_freq = self._designValue(abbreviation, number, units, name)
 
 		# Post-Calcualtion Unit Conversion
 		# No unit conversion required here
 
-		# Log calculated result
-		logger.debug(f"Eq6_2 result: {Q_freq:value}")
+		# Log validated inputs and calculated result
+		if Trace.enabled:
+			Trace.Record(logger, "Eq6_2", {"psi_1": psi_1, "Q_k": Q_k}, {"Q_freq": Q_freq})
 
 		# Store attributes
 		self.psi_1 = psi_1
@@ -73,20 +62,6 @@ class Eq6_2(DesignEquation):
 		# Add glossary definitions
 		self = Glossary(self)
 
-	# Forward attribute access to the calculated value
-	def __getattr__(self, name):
-		if hasattr(self.Q_freq, name):
-			return getattr(self.Q_freq, name)
-		raise AttributeError(
-			f"{self.__class__.__name__} has no attribute '{name}'.")
-
-	def __format__(self, format_spec):
-		if format_spec == "value":
-			return str(self.Q_freq)
-		if format_spec == "short":
-			return self.parameters()
-		return str(self)
-
 	# Printable string output
 	def __str__(self):
 		output = self.reference(self.formula)
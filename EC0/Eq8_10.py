@@ -1,6 +1,6 @@
 import logging
 from os import name
-from Settings import DesignValue, DesignFactor, DesignEquation
+from Settings import DesignValue, DesignFactor, DesignEquation, Trace
 from EC0.Glossary import Glossary
 """
 Implements Equation (8.10) from BS EN 1990:2023, Clause 8.3.3.3 (1):
@@ -16,8 +16,7 @@ Output:
 		Q_d (DesignValue): Design value of the variable action with abbreviation 'Q_{d}'
 """
 
-# Configure basic logging
-logging.basicConfig(level=logging.DEBUG)
+# Traces are emitted here when Settings.Trace is enabled
 logger = logging.getLogger(__name__)
 
 
@@ -30,31 +29,18 @@ class Eq8_10(DesignEquation):
 	equation = "(8.10)"
 	formula = "Q_{d} = gamma_{Q} * Q_{rep}"
 
+	valid_prefixes = ("Q_{rep}", "Q_{k}", "Q_{comb}", "Q_{freq}", "Q_{qper}")
+
+	# Schema: result, expected abbreviations and units behaviour
+	output = "Q_d"
+	Q_d: DesignValue
+	abbreviations = {"gamma_Q": "gamma_{Q}", "Q_comb": valid_prefixes, "Q_d": "Q_{d}"}
+	unitsFrom = "Q_comb"
+
 	def __init__(self, gamma_Q: DesignFactor, Q_comb: DesignValue):
 		#Principle 2: Validate Inputs Early
-		if not isinstance(gamma_Q, DesignFactor):
-			raise TypeError(
-				f"Argument 'gamma_Q' must be of type DesignFactor, not {type(gamma_Q).__name__}."
-			)
 		#Principle 3: Use Meaningful Errors and Exceptions
-		if gamma_Q.abbreviation != "gamma_{Q}":
-			raise ValueError(
-				f"Argument 'gamma_Q' must have abbreviation 'gamma_{{Q}}'; got '{gamma_Q.abbreviation}'."
-			)
-		if not isinstance(Q_comb, DesignValue):
-			raise TypeError(
-				f"Argument 'Q_comb' must be of type DesignValue, not {type(Q_comb).__name__}."
-			)
-
-		valid_prefixes = ("Q_{rep}", "Q_{k}", "Q_{comb}", "Q_{freq}", "Q_{qper}")
-		if not Q_comb.abbreviation.startswith(valid_prefixes):
-			raise ValueError(
-				f"Argument 'Q_comb' must start with one of {valid_prefixes}; got '{Q_comb.abbreviation}'."
-			)
-
-		#Principle 4: Log Key Steps for Traceability
-		logger.debug(
-			f"Eq8_10 input: gamma_Q=%s, Q_comb=%s {gamma_Q:value}, {Q_comb:value}")
+		self.schema.validate(gamma_Q, Q_comb)
 
 		#Principle 5: Enforce Unit Consistency
 		#No unit conversion required
@@ -64,9 +50,9 @@ class Eq8_10(DesignEquation):
 
 		#Principle 7: Encapsulate Outputs in Domain Classes
 		abbreviation = "Q_{d}"
-		units = Q_comb.units
+		units = self.schema.units(gamma_Q, Q_comb)
 		name = Q_comb.name
-		Q_d = DesignValue(abbreviation, number, units, name)
+		Q_d = self._designValue(abbreviation, number, units, name)
 		self.gamma_Q = gamma_Q
 		self.Q_comb = Q_comb
 		self.Q_d = Q_d
@@ -74,21 +60,11 @@ class Eq8_10(DesignEquation):
 		self = Glossary(self)
 
 		#Principle 4: Log Key Steps for Traceability
-		logger.debug(f"Eq8_10 result: Q_d=%s{Q_d:value}")
+		if Trace.enabled:
+			Trace.Record(logger, "Eq8_10", {"gamma_Q": gamma_Q, "Q_comb": Q_comb}, {"Q_d": Q_d})
 
 	#Principle 8: Make it easier to get the right information
-	def __getattr__(self, name):
-		if hasattr(self.Q_d, name):
-			return getattr(self.Q_d, name)
-		raise AttributeError(
-			f"{self.__class__.__name__} has no attribute '{name}'.")
-
-	def __format__(self, format_spec):
-		if format_spec == "value":
-			return str(self.Q_d)
-		if format_spec == "short":
-			return self.parameters()
-		return str(self)
+	#DesignEquation forwards attribute access to the schema output, Q_d
 
 	#Principle 9: Provide a clear output interface
 	def __str__(self):
@@ -1,5 +1,5 @@
 import logging
-from Settings import DesignValue, DesignFactor, DesignEquation
+from Settings import DesignValue, DesignFactor, DesignEquation, Trace
 from EC0.Glossary import Glossary
 """
 Implements Equation (8.2) from BS EN 1990:2023, Clause 8.3.1 (1):
@@ -14,8 +14,7 @@ Output:
 	Utilisation (DesignFactor): Decimal value representing E_d / C_d_ULS
 """
 
-# Configure basic logging
-logging.basicConfig(level=logging.DEBUG)
+# Traces are emitted here when Settings.Trace is enabled
 logger = logging.getLogger(__name__)
 
 
@@ -27,69 +26,46 @@ class Eq8_2(DesignEquation):
 	equation = "(8.2)"
 	formula = "E_{d} <= C_{d,ULS}"
 
+	# Schema: result, expected abbreviations and units behaviour
+	output = "utilisation"
+	utilisation: DesignFactor
+	abbreviations = {"E_d": "E_{d}", "C_d_ULS": "C_{d,ULS}", "utilisation": "Utilisation"}
+	unitsFrom = None
+	conversions = {"C_d_ULS": "E_d"}
+
 	def __init__(self, E_d: DesignValue, C_d_ULS: DesignValue):
 		# Input validation
-		if not isinstance(E_d, DesignValue):
-			raise TypeError(
-				f"Argument 'E_d' must be of type DesignValue, not {type(E_d).__name__}."
-			)
-		if not isinstance(C_d_ULS, DesignValue):
-			raise TypeError(
-				f"Argument 'C_{d,ULS}' must be of type DesignValue, not {type(E_d).__name__}."
-			)
-		if E_d.abbreviation != "E_{d}":
-			raise ValueError(
-				f"Argument 'E_d' must have abbreviation 'E_d'; got '{E_d.abbreviation}'."
-			)
-		if C_d_ULS.abbreviation != "C_{d,ULS}":
-			raise ValueError("Argument 'C_{d,ULS}' must have abbreviation 'C_{d,ULS}'")
-
-		# Log validated inputs
-		logger.debug(
-			f"Eq8_1 input: {E_d:value}, {C_d_ULS:value}")
+		self.schema.validate(E_d, C_d_ULS)
 
 		# Pre-Calculation Unit Conversion
-		C_d_ULS_out = C_d_ULS.Units(E_d.units) 
-		
+		# C_d_ULS is converted to the units of E_d within the ratio below (conversions)
+
 		# Core calculation
-		number = E_d.number / C_d_ULS_out.number
+		number = self.schema.ratio(E_d, C_d_ULS)
 
 		# Encapsulate
 		abbreviation = "Utilisation"
-		if number > 1.0:
+		if self._exceeds(number, 1.0):
 			abbreviation += " [FAIL]"
 		name = E_d.name
-		utilisation = DesignFactor(abbreviation, number, name)
+		utilisation = self._designFactor(abbreviation, number, name)
 		
 
 		# Post-Calcualtion Unit Conversion
 		# No unit conversion required here
 
-		# Log calculated result
-		logger.debug(f"Eq6_3 result: {utilisation:value}")
+		# Log validated inputs and calculated result
+		if Trace.enabled:
+			Trace.Record(logger, "Eq8_2", {"E_d": E_d, "C_d_ULS": C_d_ULS}, {"utilisation": utilisation})
 
 		# Store attributes
 		self.E_d = E_d
-		self.C_d_ULS = C_d_ULS_out
+		self.C_d_ULS = C_d_ULS
 		self.utilisation = utilisation
 
 		# Add glossary definitions
 		self = Glossary(self)
 
-	# Forward attribute access to the calculated value
-	def __getattr__(self, name):
-		if hasattr(self.utilisation, name):
-			return getattr(self.utilisation, name)
-		raise AttributeError(
-			f"{self.__class__.__name__} has no attribute '{name}'.")
-
-	def __format__(self, format_spec):
-		if format_spec == "value":
-			return str(self.utilisation)
-		if format_spec == "short":
-			return self.parameters()
-		return str(self)
-
 	# Printable string output
 	def __str__(self):
 		output = self.reference(self.formula)
@@ -1,10 +1,39 @@
-import csv
-import importlib.resources
-from Settings import DesignEquation, DesignFactor, DesignValue
+import functools
+from Settings import DesignEquation, DesignFactor, DesignValue, Profile, Tables
 
-def Dict() -> dict:
+# Process-wide glossary tables, loaded on first lookup.
+_definitions = None
+_index = None
+
+
+# Source of the definitions and its compiled form, EC0/DefinitionTable.py
+_source = "definitions.csv"
+_compiled = "DefinitionTable"
+
+
+def Load() -> dict:
+    """Reads the definitions, from the compiled table while it is up to date."""
+    result = Tables.Read(__package__, _compiled, [_source])
+    if result is None:
+        result = _readTable()
+    return result
+
+
+def Compile():
+    """Rebuilds the compiled table from definitions.csv."""
+    Tables.Write(__package__, _compiled, _readTable(), [_source])
+
+
+def _readTable() -> dict:
+    import csv
+    import importlib.resources
     result = {}
-    with importlib.resources.open_text('EC0', 'definitions.csv') as file:
+    try:
+        file = importlib.resources.files(__package__).joinpath(_source).open(
+            "r", encoding="utf-8")
+    except AttributeError:  # Python < 3.9
+        file = importlib.resources.open_text(__package__, _source, encoding="utf-8")
+    with file:
         reader = csv.reader(file)
         for row in reader:
             if len(row) >= 2:
@@ -13,16 +42,54 @@ def Dict() -> dict:
                 result[key] = value
     return result
 
-def Glossary(equation: DesignEquation) -> DesignEquation:
-    definitions = Dict()  # Load once
 
+def Definitions() -> dict:
+    """Returns the cached definitions table, loading it on first use."""
+    global _definitions, _index
+    if _definitions is None:
+        _definitions = Load()
+        # A key matches any abbreviation starting with the key less its closing
+        # brace, e.g. 'psi_{0}' -> 'psi_{0'. Earlier rows take precedence.
+        _index = {}
+        for order, (prefix, definition) in enumerate(_definitions.items()):
+            _index.setdefault(prefix[:-1], (order, definition))
+    return _definitions
+
+
+def Invalidate():
+    """Drops the cached definitions; they are reloaded on the next lookup."""
+    global _definitions, _index
+    _definitions = None
+    _index = None
+    Lookup.cache_clear()
+
+
+def Dict() -> dict:
+    return dict(Definitions())
+
+
+@functools.lru_cache(maxsize=None)
+def Lookup(abbreviation: str) -> str:
+    """Returns the definition of the first row whose prefix matches the abbreviation."""
+    Definitions()
+    matches = [
+        _index[abbreviation[:length]]
+        for length in range(len(abbreviation) + 1)
+        if abbreviation[:length] in _index
+    ]
+    if not matches:
+        return ""
+    return min(matches)[1]
+
+
+def Glossary(equation: DesignEquation) -> DesignEquation:
+    # Descriptions are resolved on first access, nothing is loaded here
+    start = Profile.Clock() if Profile.enabled else None
     parameters = equation._getEquationParameters()
     for parameter in parameters:
         if isinstance(parameter, (DesignValue, DesignFactor)):
-            if parameter.description == "":
-                for prefix, definition in definitions.items():
-                    if parameter.abbreviation.startswith(prefix[:-1]):
-                        parameter.description = definition
-                        break  # Stop after first match
+            parameter._glossary = Lookup
+    if start is not None:
+        Profile.Add("Glossary", start)
 
     return equation
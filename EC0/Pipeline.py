@@ -0,0 +1,126 @@
+import contextlib
+import csv
+import itertools
+import numpy
+from Settings import DesignValue, DesignFactor, DesignValueArray, DesignFactorArray
+"""
+Streams load cases from a CSV file through a declared chain of equations.
+
+	pipeline = Pipeline(
+		columns={"Q_k": ("Q", "Q_{k}", "kN"), "R_d": ("R", "R_{d}", "kN")},
+		steps=[
+			("Q_comb", Eq6_1, {"psi_0": psi_0, "Q_k": "Q_k"}),
+			("Q_d", Eq8_10, {"gamma_Q": gamma_Q, "Q_comb": "Q_comb"}),
+			("utilisation", Eq8_1, {"E_d": ("Q_d", "E_{d}"), "R_d": "R_d"}),
+		],
+		keep=["element"])
+	rows = pipeline.run("cases.csv", "results.csv", chunksize=100000)
+
+columns maps an input name to (CSV column, abbreviation, units); units of None
+reads the column as a DesignFactorArray. Each step names its result and maps
+the equation's arguments to a column input or earlier step by name, to
+(name, abbreviation) to relabel it, or to a constant DesignValue/DesignFactor.
+
+The file is read chunksize rows at a time, every step runs once per chunk over
+DesignValueArray inputs, and the chunk's results are appended to the output
+file before the next chunk is read, so memory is bounded by the chunk size.
+"""
+
+
+class Pipeline(object):
+
+	def __init__(self, columns: dict, steps: list, outputs: list = None,
+	             keep: list = ()):
+		self.columns = dict(columns)
+		self.steps = list(steps)
+		self.keep = list(keep)
+		names = set(self.columns)
+		for name, equation, arguments in self.steps:
+			schema = getattr(equation, "schema", None)
+			if schema is not None and set(arguments) != set(schema.inputs):
+				raise ValueError(
+				    f"Step '{name}' must give the arguments {schema.inputs}; got {tuple(arguments)}."
+				)
+			for parameter, source in arguments.items():
+				reference = source[0] if isinstance(source, tuple) else source
+				if isinstance(reference, str) and reference not in names:
+					raise ValueError(
+					    f"Step '{name}' argument '{parameter}' refers to unknown input '{reference}'."
+					)
+			names.add(name)
+		self.outputs = list(outputs) if outputs is not None else [
+		    name for name, equation, arguments in self.steps
+		]
+		for name in self.outputs:
+			if name not in names:
+				raise ValueError(f"Output '{name}' is not an input or step of the pipeline.")
+
+	def _read(self, rows: list, header: list) -> dict:
+		values = {}
+		for name, (column, abbreviation, units) in self.columns.items():
+			index = header.index(column)
+			number = numpy.array([row[index] for row in rows], dtype=float)
+			if units is None:
+				values[name] = DesignFactorArray(abbreviation, number)
+			else:
+				values[name] = DesignValueArray(abbreviation, number, units)
+		return values
+
+	@staticmethod
+	def _argument(values: dict, source):
+		if isinstance(source, tuple):
+			name, abbreviation = source
+			value = values[name]
+			if isinstance(value, DesignFactor):
+				return DesignFactorArray(abbreviation, value.number, value.name)
+			return DesignValueArray(abbreviation, value.number, value.units, value.name)
+		if isinstance(source, str):
+			return values[source]
+		return source
+
+	def evaluate(self, values: dict) -> dict:
+		"""Runs every step over one chunk of inputs, returning all named values."""
+		values = dict(values)
+		for name, equation, arguments in self.steps:
+			values[name] = equation(**{
+			    parameter: self._argument(values, source)
+			    for parameter, source in arguments.items()
+			})
+		return values
+
+	def run(self, source, target, chunksize: int = 100000) -> int:
+		"""Streams source to target, returning the number of rows processed."""
+		if chunksize < 1:
+			raise ValueError(f"Argument 'chunksize' must be at least 1; got {chunksize}.")
+		with _open(source, "r") as infile, _open(target, "w") as outfile:
+			reader = csv.reader(infile)
+			writer = csv.writer(outfile)
+			header = [column.strip() for column in next(reader)]
+			kept = [header.index(column) for column in self.keep]
+			count = 0
+			while True:
+				rows = list(itertools.islice(reader, chunksize))
+				if not rows:
+					break
+				values = self.evaluate(self._read(rows, header))
+				if count == 0:
+					writer.writerow(self.keep + [
+					    f"{name} [{values[name].units}]"
+					    if isinstance(values[name], DesignValue) else name
+					    for name in self.outputs
+					])
+				numbers = [
+				    numpy.broadcast_to(values[name].number, len(rows)) for name in self.outputs
+				]
+				writer.writerows(
+				    [row[index] for index in kept] + [repr(float(number)) for number in result]
+				    for row, result in zip(rows, zip(*numbers)))
+				count += len(rows)
+		return count
+
+
+def _open(file, mode: str):
+	# Accepts a path or an already open file, closing only what it opened
+	if hasattr(file, "read") or hasattr(file, "write"):
+		return contextlib.nullcontext(file)
+	return open(file, mode, newline="")
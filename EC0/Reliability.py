@@ -0,0 +1,125 @@
+import numpy
+from Settings import DesignValueArray
+from EC0 import Pipeline
+"""
+Monte Carlo reliability of a chain of equations, sampling the inputs from the
+tolerances of their design values.
+
+	steps = [
+		("Q_comb", Eq6_1, {"psi_0": psi_0, "Q_k": "Q_k"}),
+		("Q_d", Eq8_10, {"gamma_Q": gamma_Q, "Q_comb": "Q_comb"}),
+		("utilisation", Eq8_1, {"E_d": ("Q_d", "E_{d}"), "R_d": "R_d"}),
+	]
+	Q_k = DesignValue("Q_{k}", 532, "kN", tolerance=80, lowerLimit=300)
+	R_d = DesignValue("R_{d}", 1.2, "MN", tolerance=0.1)
+	result = Reliability(steps, {"Q_k": Q_k, "R_d": R_d}, samples=10**7, seed=1)
+	result.probability, result.mean, result.std, result.histogram
+
+Each input with a tolerance is sampled from a normal distribution with its
+number as the mean and its tolerance as the standard deviation, in its units,
+truncated to [lowerLimit, upperLimit]. A limit of 0 leaves that side unbounded,
+as 0 is the default of both. Inputs without a tolerance, and DesignFactors,
+are used as they are.
+
+The steps are those of a Pipeline, referring to the inputs by name. Samples are
+drawn and evaluated chunksize at a time, so memory is bounded by the chunk size.
+A sample fails when the output exceeds limit. The histogram counts the outputs
+between edges (by default 0 to twice the limit), with minimum and maximum
+giving the full range. The generator is numpy's default_rng(seed), so a seed
+repeats a run.
+"""
+
+
+def Sample(value, size: int, generator: numpy.random.Generator) -> numpy.ndarray:
+	"""Draws size numbers from the truncated normal distribution of a value."""
+	lower = value.lowerLimit if value.lowerLimit != 0 else -numpy.inf
+	upper = value.upperLimit if value.upperLimit != 0 else numpy.inf
+	if not lower < upper:
+		raise ValueError(
+		    f"Input '{value.abbreviation}' must have lowerLimit below upperLimit; got {lower} and {upper}."
+		)
+	numbers = generator.normal(value.number, value.tolerance, size)
+	# Redraw the samples outside the limits, a shrinking fraction each time
+	for _ in range(100):
+		outside = numpy.flatnonzero((numbers < lower) | (numbers > upper))
+		if len(outside) == 0:
+			return numbers
+		numbers[outside] = generator.normal(value.number, value.tolerance, len(outside))
+	raise ValueError(
+	    f"Input '{value.abbreviation}' has too little probability between its limits to sample."
+	)
+
+
+class Reliability(object):
+
+	def __init__(self, steps: list, inputs: dict, output: str = None, samples: int = 10**6,
+	             chunksize: int = 10**6, seed=None, limit: float = 1.0, edges=None):
+		if samples < 1:
+			raise ValueError(f"Argument 'samples' must be at least 1; got {samples}.")
+		if chunksize < 1:
+			raise ValueError(f"Argument 'chunksize' must be at least 1; got {chunksize}.")
+		columns = {
+		    name: (name, value.abbreviation, getattr(value, "units", None))
+		    for name, value in inputs.items()
+		}
+		pipeline = Pipeline(columns, steps)
+		if output is None:
+			output = pipeline.steps[-1][0]
+		for name, value in inputs.items():
+			if getattr(value, "tolerance", 0) < 0:
+				raise ValueError(f"Input '{name}' must not have a negative tolerance.")
+
+		self.samples = samples
+		self.limit = limit
+		self.edges = numpy.linspace(0, 2 * limit, 81) if edges is None else numpy.asarray(
+		    edges, float)
+		self.histogram = numpy.zeros(len(self.edges) - 1, int)
+		self.failures = 0
+		self.minimum = numpy.inf
+		self.maximum = -numpy.inf
+		generator = numpy.random.default_rng(seed)
+
+		mean = 0.0
+		squares = 0.0
+		count = 0
+		for start in range(0, samples, chunksize):
+			size = min(chunksize, samples - start)
+			values = pipeline.evaluate(self._sample(inputs, size, generator))
+			numbers = numpy.broadcast_to(values[output].number, size)
+
+			self.failures += int(numpy.count_nonzero(numbers > limit))
+			self.histogram += numpy.histogram(numbers, self.edges)[0]
+			self.minimum = min(self.minimum, float(numbers.min()))
+			self.maximum = max(self.maximum, float(numbers.max()))
+			# Running mean and sum of squared deviations, merged chunk by chunk
+			chunkMean = float(numbers.mean())
+			chunkSquares = float(((numbers - chunkMean)**2).sum())
+			delta = chunkMean - mean
+			total = count + size
+			mean += delta * size / total
+			squares += chunkSquares + delta**2 * count * size / total
+			count = total
+
+		self.mean = mean
+		self.std = (squares / (count - 1))**0.5 if count > 1 else 0.0
+		self.probability = self.failures / samples
+
+	@staticmethod
+	def _sample(inputs: dict, size: int, generator) -> dict:
+		values = {}
+		for name, value in inputs.items():
+			# Only DesignValues carry a tolerance
+			if getattr(value, "tolerance", 0):
+				values[name] = DesignValueArray(value.abbreviation,
+				                                Sample(value, size, generator), value.units,
+				                                value.name)
+			else:
+				values[name] = value
+		return values
+
+	def __str__(self):
+		output = f"Reliability over {self.samples} samples:\n"
+		output += f"\tP(failure) = {self.probability:.4} ({self.failures} failures)\n"
+		output += f"\tmean = {self.mean:.4}, std = {self.std:.4}\n"
+		output += f"\trange = [{self.minimum:.4} .. {self.maximum:.4}]\n"
+		return output
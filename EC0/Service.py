@@ -0,0 +1,281 @@
+import asyncio
+import json
+import math
+import numpy
+from Settings import DesignValue, DesignFactor, DesignValueArray, DesignFactorArray
+from EC0.Batch import _resolve, Preload
+"""
+JSON-lines socket service evaluating EC0 equations for other tools.
+
+	python -m EC0.Service --port 8765
+
+Each request is one line of JSON naming an equation and a list of calls, each
+call mapping the equation's arguments to values; a value without units is read
+as a DesignFactor:
+
+	{"id": 1, "equation": "Eq8_1", "reference": true, "calls": [
+		{"E_d": {"abbreviation": "E_{d}", "number": 400, "units": "kN"},
+		 "R_d": {"abbreviation": "R_{d}", "number": 0.5, "units": "MN"}}]}
+
+and each response is one line holding the result (or error) of every call, in
+order, plus the equation's reference metadata when "reference" is true:
+
+	{"id": 1, "results": [{"abbreviation": "Utilisation", "number": 0.8,
+		"name": ""}], "reference": {"standard": "BS EN 1990:2023", ...}}
+
+Connections are served by one asyncio event loop. Calls arriving within delay
+seconds of each other, from any request or connection, are grouped by equation
+and by the abbreviations, units and names of their inputs, and each group is
+evaluated once over DesignValueArray inputs. A group whose batch result differs
+from what the calls would give one at a time (a failure flag or a non-finite
+number) is evaluated call by call instead, as is any call with a number that
+is not a JSON number, so every result matches a scalar call.
+"""
+
+metadata = ("standard", "section", "subsection", "clause", "equation", "formula")
+
+
+def Reference(equation) -> dict:
+	"""Returns the reference metadata of an equation class."""
+	return {field: getattr(equation, field, "") for field in metadata}
+
+
+def _encode(value) -> dict:
+	result = {"abbreviation": value.abbreviation, "number": value.number}
+	if hasattr(value, "units"):
+		result["units"] = value.units
+	result["name"] = value.name
+	return result
+
+
+def _number(value):
+	# JSON has no infinity or NaN
+	return value if math.isfinite(value) else str(value)
+
+
+class Service(object):
+
+	def __init__(self, delay: float = 0.002, maxbatch: int = 10000):
+		if delay < 0:
+			raise ValueError(f"Argument 'delay' must not be negative; got {delay}.")
+		if maxbatch < 1:
+			raise ValueError(f"Argument 'maxbatch' must be at least 1; got {maxbatch}.")
+		self.delay = delay
+		self.maxbatch = maxbatch
+		# Statistics: calls received and vectorised evaluations made
+		self.calls = 0
+		self.batches = 0
+		self._pending = []
+		self._timer = None
+
+	def _key(self, equation, call: dict) -> tuple:
+		key = [equation]
+		for name in equation.schema.inputs:
+			value = call[name]
+			key.append((value["abbreviation"], value.get("units"), value.get("name", "")))
+		return tuple(key)
+
+	@staticmethod
+	def check(equation, call: dict):
+		"""Raises an error if a call cannot be queued for the equation."""
+		if not isinstance(call, dict):
+			raise TypeError(f"Call must be a JSON object, not {type(call).__name__}.")
+		missing = set(equation.schema.inputs) - set(call)
+		if missing:
+			raise ValueError(f"Missing arguments {sorted(missing)} for {equation.__name__}.")
+		for name in equation.schema.inputs:
+			value = call[name]
+			if not isinstance(value, dict) or "abbreviation" not in value or "number" not in value:
+				raise ValueError(
+				    f"Argument '{name}' must be an object with 'abbreviation' and 'number'.")
+
+	def submit(self, equation, call: dict) -> asyncio.Future:
+		"""Queues one call, returning a future of its encoded result."""
+		self.check(equation, call)
+		future = asyncio.get_running_loop().create_future()
+		self._pending.append((self._key(equation, call), equation, call, future))
+		self.calls += 1
+		if len(self._pending) >= self.maxbatch:
+			self.flush()
+		elif self._timer is None:
+			self._timer = asyncio.get_running_loop().call_later(self.delay, self.flush)
+		return future
+
+	def flush(self):
+		"""Evaluates every queued call, one vectorised evaluation per group."""
+		if self._timer is not None:
+			self._timer.cancel()
+			self._timer = None
+		pending, self._pending = self._pending, []
+		groups = {}
+		for key, equation, call, future in pending:
+			groups.setdefault(key, []).append((equation, call, future))
+		for group in groups.values():
+			self._evaluate(group)
+
+	@staticmethod
+	def _numeric(equation, call: dict) -> bool:
+		# JSON numbers only: numpy would also read strings such as "5" and booleans,
+		# which a scalar call rejects
+		for name in equation.schema.inputs:
+			number = call[name].get("number")
+			if isinstance(number, bool) or not isinstance(number, (int, float)):
+				return False
+		return True
+
+	def _evaluate(self, group: list):
+		equation = group[0][0]
+		batch = []
+		single = []
+		for entry in group:
+			(batch if self._numeric(equation, entry[1]) else single).append(entry)
+		results = None
+		if len(batch) > 1:
+			try:
+				results = self._vectorised(equation, [call for _, call, _ in batch])
+			except Exception:
+				results = None
+		if results is None:
+			single += batch
+		else:
+			for (_, _, future), result in zip(batch, results):
+				if not future.done():
+					future.set_result(result)
+		# One at a time, so that errors stay with their call
+		for _, call, future in single:
+			try:
+				result = self._scalar(equation, call)
+			except Exception as error:
+				result = {"error": f"{type(error).__name__}: {error}"}
+			if not future.done():
+				future.set_result(result)
+
+	@staticmethod
+	def _argument(equation, name: str, values: list, batch: bool):
+		first = values[0]
+		number = first["number"]
+		if batch:
+			number = numpy.array([value["number"] for value in values], float)
+		if equation.schema.types.get(name) is DesignFactor or "units" not in first:
+			factor = DesignFactorArray if batch else DesignFactor
+			return factor(first["abbreviation"], number, first.get("name", ""))
+		value = DesignValueArray if batch else DesignValue
+		return value(first["abbreviation"], number, first["units"], first.get("name", ""))
+
+	def _scalar(self, equation, call: dict) -> dict:
+		arguments = {
+		    name: self._argument(equation, name, [call[name]], False)
+		    for name in equation.schema.inputs
+		}
+		result = _encode(getattr(equation(**arguments), equation.schema.output))
+		result["number"] = _number(result["number"])
+		return result
+
+	def _vectorised(self, equation, calls: list):
+		arguments = {
+		    name: self._argument(equation, name, [call[name] for call in calls], True)
+		    for name in equation.schema.inputs
+		}
+		with numpy.errstate(all="ignore"):
+			output = getattr(equation(**arguments), equation.schema.output)
+		self.batches += 1
+		expected = equation.schema.abbreviations.get(equation.schema.output)
+		if not numpy.isfinite(output.number).all() or (expected is not None and
+		                                               output.abbreviation != expected):
+			return None
+		template = _encode(output)
+		results = []
+		for number in output.number.tolist():
+			result = dict(template)
+			result["number"] = number
+			results.append(result)
+		return results
+
+	async def request(self, request: dict) -> dict:
+		"""Evaluates every call of a decoded request, returning the response."""
+		response = {"id": request.get("id")}
+		try:
+			equation = _resolve(request["equation"])
+			calls = request["calls"]
+			if not isinstance(calls, list):
+				raise TypeError(f"'calls' must be a list, not {type(calls).__name__}.")
+			# Every call is checked before any is queued, so a bad call queues none
+			for call in calls:
+				self.check(equation, call)
+			futures = [self.submit(equation, call) for call in calls]
+		except Exception as error:
+			response["error"] = f"{type(error).__name__}: {error}"
+			return response
+		response["results"] = list(await asyncio.gather(*futures))
+		if request.get("reference"):
+			response["reference"] = Reference(equation)
+		return response
+
+	async def _respond(self, line: bytes, writer: asyncio.StreamWriter):
+		# Every line gets a response line, whatever goes wrong
+		try:
+			request = json.loads(line)
+		except ValueError as error:
+			response = {"id": None, "error": f"Invalid JSON: {error}"}
+		else:
+			if not isinstance(request, dict):
+				response = {
+				    "id": None,
+				    "error": f"Request must be a JSON object, not {type(request).__name__}."
+				}
+			else:
+				try:
+					response = await self.request(request)
+				except Exception as error:
+					response = {"id": request.get("id"), "error": f"{type(error).__name__}: {error}"}
+		try:
+			line = json.dumps(response)
+		except (TypeError, ValueError) as error:
+			line = json.dumps({"id": None, "error": f"{type(error).__name__}: {error}"})
+		writer.write(line.encode() + b"\n")
+
+	async def _connection(self, reader: asyncio.StreamReader,
+	                      writer: asyncio.StreamWriter):
+		# Requests on one connection are answered as they complete, matched by id
+		tasks = set()
+		try:
+			while True:
+				line = await reader.readline()
+				if not line:
+					break
+				if not line.strip():
+					continue
+				task = asyncio.ensure_future(self._respond(line, writer))
+				tasks.add(task)
+				task.add_done_callback(tasks.discard)
+				await writer.drain()
+			if tasks:
+				await asyncio.gather(*tasks)
+			await writer.drain()
+		finally:
+			writer.close()
+
+	async def start(self, host: str = "127.0.0.1", port: int = 8765) -> asyncio.AbstractServer:
+		"""Starts listening, returning the asyncio server."""
+		Preload()
+		return await asyncio.start_server(self._connection, host, port, limit=2**24,
+	                                  backlog=4096)
+
+
+async def Serve(host: str = "127.0.0.1", port: int = 8765, delay: float = 0.002,
+                maxbatch: int = 10000):
+	server = await Service(delay, maxbatch).start(host, port)
+	async with server:
+		await server.serve_forever()
+
+
+if __name__ == "__main__":
+	import argparse
+	parser = argparse.ArgumentParser(description="Serves EC0 equations as JSON lines.")
+	parser.add_argument("--host", default="127.0.0.1")
+	parser.add_argument("--port", type=int, default=8765)
+	parser.add_argument("--delay", type=float, default=0.002,
+	                    help="seconds to wait for calls to batch together")
+	parser.add_argument("--maxbatch", type=int, default=10000)
+	arguments = parser.parse_args()
+	asyncio.run(Serve(arguments.host, arguments.port, arguments.delay, arguments.maxbatch))
@@ -0,0 +1,121 @@
+import numpy
+from Settings import Dual
+from EC0 import Eq8_1
+from EC0.Combinations import Actions
+"""
+Sizes a member: finds the smallest parameter of a resistance for which every
+effect of actions passes Eq8_1 (or Eq8_2).
+
+	sizing = Sizing([E_d_1, E_d_2, E_d_3],
+	                lambda depth: DesignValue("R_{d}", 0.35 * depth**2, "kN"),
+	                lower=100, upper=1000, tolerance=0.01)
+	sizing.parameter, sizing.utilisation, sizing.iterations, sizing.evaluations
+
+E_d is a DesignValue, a DesignValueArray of load cases or a list of either, all
+with abbreviation 'E_{d}' and converted to the units of the first. resistance maps the parameter to the
+second input of the equation ('R_{d}' for Eq8_1, 'C_{d,ULS}' for Eq8_2), and
+the utilisation must fall as the parameter grows. Every evaluation runs the
+equation once over all load cases, and the largest utilisation governs.
+
+The root is bracketed by [lower, upper] and found by bisection, or with
+method="newton" by Newton steps on the governing case. Its derivative comes
+from a Dual parameter, with a bisection step whenever a Newton step would leave
+the bracket. If the resistance does not carry the Dual through, the search
+continues by bisection and method reports it. The result is
+the feasible end of the final bracket, within tolerance of the smallest
+parameter giving a utilisation of at most limit.
+"""
+
+methods = ("bisection", "newton")
+
+
+class Sizing(object):
+
+	def __init__(self, E_d, resistance, lower: float, upper: float, equation=Eq8_1,
+	             tolerance: float = 1e-6, method: str = "bisection", limit: float = 1.0,
+	             maxiter: int = 200):
+		if method not in methods:
+			raise ValueError(f"Argument 'method' must be one of {methods}; got '{method}'.")
+		if not lower < upper:
+			raise ValueError(
+			    f"Argument 'lower' must be below 'upper'; got {lower} and {upper}.")
+		if tolerance <= 0:
+			raise ValueError(f"Argument 'tolerance' must be positive; got {tolerance}.")
+
+		# The actions must have the abbreviation the equation expects of E_d
+		schema = equation.schema
+		self.E_d, _ = Actions(E_d, "E_d", schema.abbreviations[schema.inputs[0]])
+		self.resistance = resistance
+		self.equation = equation
+		self.method = method
+		self.limit = limit
+		# Equation evaluations, over all load cases or (for derivatives) one
+		self.iterations = 0
+		self.evaluations = 0
+
+		# The bracket: utilisation above the limit at low, within it at high
+		high = (upper, ) + self._excess(upper)
+		if high[1] > 0:
+			raise ValueError(
+			    f"No parameter up to {upper} keeps the utilisation within {limit}.")
+		current = (lower, ) + self._excess(lower)
+		low = current
+		if current[1] <= 0:
+			high = current
+		while high[0] - low[0] > tolerance and self.iterations < maxiter:
+			self.iterations += 1
+			step = None
+			if self.method == "newton":
+				step = self._newton(current, low[0], high[0])
+				if step is not None and abs(step - current[0]) < tolerance:
+					# Converged: test just across the root to close the bracket
+					step = current[0] + (tolerance if current[1] > 0 else -tolerance)
+					if not low[0] < step < high[0]:
+						step = None
+			if step is None:
+				step = (low[0] + high[0]) / 2
+			current = (step, ) + self._excess(step)
+			if current[1] > 0:
+				low = current
+			else:
+				high = current
+
+		self.converged = high[0] - low[0] <= tolerance
+		self.parameter, excess, self.governing = high
+		self.utilisation = excess + limit
+
+	def _excess(self, parameter: float) -> tuple:
+		"""(governing utilisation - limit, governing case) at a parameter."""
+		self.evaluations += 1
+		numbers = self.equation(self.E_d, self.resistance(parameter)).number
+		governing = int(numpy.argmax(numbers))
+		return float(numbers[governing]) - self.limit, governing
+
+	def _newton(self, current: tuple, low: float, high: float):
+		"""Newton step from (parameter, excess, governing case), or None to bisect."""
+		parameter, excess, governing = current
+		self.evaluations += 1
+		try:
+			resistance = self.resistance(Dual.Dual.variable(parameter, "parameter"))
+			number = self.equation(self.E_d[governing], resistance).number
+		except TypeError:
+			self.method = "bisection"
+			return None
+		if not isinstance(number, Dual.Dual):
+			# The resistance drops the derivative, so bisect from now on
+			self.method = "bisection"
+			return None
+		slope = number.derivative("parameter")
+		if slope >= 0:
+			return None
+		step = parameter - excess / slope
+		if not low < step < high:
+			return None
+		return step
+
+	def __str__(self):
+		output = f"Sizing by {self.method} with {self.equation.__name__}:\n"
+		output += f"\tparameter = {self.parameter:.6}, utilisation = {self.utilisation:.4}"
+		output += f" (case {self.governing})\n"
+		output += f"\t{self.iterations} iterations, {self.evaluations} evaluations\n"
+		return output
@@ -0,0 +1,40 @@
+import unittest
+import numpy
+from Settings import DesignValue
+from EC0 import Eq8_1
+from EC0.Batch import Batch
+
+
+class TestBatch(unittest.TestCase):
+
+    def inputs(self, count):
+        R_d = DesignValue("R_{d}", 1, "MN")
+        return [(DesignValue("E_{d}", index, "kN"), R_d) for index in range(count)]
+
+    def test_order_preserved(self):
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                results = Batch("Eq8_1", iter(self.inputs(25)), workers=workers,
+                                chunksize=4)
+                numpy.testing.assert_allclose(results, numpy.arange(25) / 1000)
+
+    def test_objects(self):
+        results = Batch(Eq8_1, self.inputs(5), workers=2, chunksize=2,
+                        output="objects")
+        self.assertEqual([type(result) for result in results], [Eq8_1] * 5)
+        self.assertEqual(results[3].E_d.number, 3.0)
+        self.assertEqual(results[3].E_d.description, "Design value of effect of actions")
+
+    def test_keywords(self):
+        R_d = DesignValue("R_{d}", 10, "kN")
+        inputs = [{"E_d": DesignValue("E_{d}", 5, "kN"), "R_d": R_d}]
+        numpy.testing.assert_allclose(Batch("EC0.Eq8_1", inputs, workers=1), [0.5])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            Batch("Eq9_9", [], workers=1)
+        self.assertEqual(len(Batch("Eq8_1", [], workers=1)), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+from math import isclose
+from Settings import DesignValue, DesignFactor, DesignValueArray, DesignFactorArray
+from EC0 import Combinations, Eq6_1, Eq8_10
+
+
+class TestCombinations(unittest.TestCase):
+
+    def setUp(self):
+        self.Q_k = [DesignValue("Q_{k}", 532, "kN", name="wind"),
+                    DesignValue("Q_{k}", 132, "kN", name="live"),
+                    DesignValue("Q_{k}", 0.032, "MN", name="heat")]
+        self.psi_0 = [DesignFactor("psi_{0}", 0.5), DesignFactor("psi_{0}", 0.7),
+                      DesignFactor("psi_{0}", 0.6)]
+        self.psi_1 = DesignFactor("psi_{1}", 0.5)
+        self.psi_2 = DesignFactor("psi_{2}", 0.3)
+        self.gamma_Q = DesignFactor("gamma_{Q}", 1.5)
+
+    def test_matches_equations(self):
+        combinations = Combinations(self.Q_k, self.psi_0, self.psi_1, self.psi_2,
+                                    self.gamma_Q)
+        for leading in range(3):
+            expected = 0.0
+            for index, (Q_k, psi_0) in enumerate(zip(self.Q_k, self.psi_0)):
+                Q_k = Q_k.Units("kN")
+                Q_rep = Q_k if index == leading else Eq6_1(psi_0, Q_k)
+                expected += Eq8_10(self.gamma_Q, Q_rep).number
+            with self.subTest(leading=leading):
+                self.assertTrue(isclose(combinations.ULS.number[leading], expected))
+
+    def test_governing(self):
+        combinations = Combinations(self.Q_k, self.psi_0, self.psi_1, self.psi_2,
+                                    self.gamma_Q)
+        governing = combinations.governing("ULS")
+        self.assertTrue(isclose(governing.number, 1.5 * (532 + 0.7 * 132 + 0.6 * 32)))
+        self.assertEqual(governing.units, "kN")
+        self.assertEqual(governing.name, "ULS,wind")
+        quasi = combinations.governing("quasi-permanent")
+        self.assertTrue(isclose(quasi.number, 0.3 * (532 + 132 + 32)))
+        frequent = combinations.governing("frequent")
+        self.assertTrue(isclose(frequent.number, 0.5 * 532 + 0.3 * (132 + 32)))
+
+    def test_arrays(self):
+        Q_k = DesignValueArray("Q_{k}", range(1, 51), "kN")
+        psi_0 = DesignFactorArray("psi_{0}", [0.7] * 50)
+        combinations = Combinations(Q_k, psi_0, self.psi_1, self.psi_2, self.gamma_Q)
+        leading, accompanying = combinations.contributions["ULS"]
+        self.assertEqual((leading.shape, accompanying.shape), ((50, ), (50, )))
+        self.assertTrue(isclose(combinations.governing().number,
+                                1.5 * (50 + 0.7 * (sum(range(1, 50))))))
+
+    def test_validation(self):
+        with self.assertRaises(ValueError):
+            Combinations(self.Q_k, self.psi_0[:2], self.psi_1, self.psi_2, self.gamma_Q)
+        with self.assertRaises(ValueError):
+            Combinations(self.Q_k, self.psi_1, self.psi_1, self.psi_2, self.gamma_Q)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+import numpy
+from Settings import DesignValue, DesignValueArray, DesignFactor
+from EC0 import Envelope, Eq8_1, Eq6_1
+
+
+class TestEnvelope(unittest.TestCase):
+
+    def test_batches(self):
+        R_d = DesignValue("R_{d}", 1, "MN")
+        envelope = Envelope(k=3)
+        cases = {
+            "A": [100, 900, 300, 50],
+            "B": [200, 400, 1200, 10],
+            "C": [150, 950, 250, 20],
+        }
+        for case, numbers in cases.items():
+            envelope.add(Eq8_1(DesignValueArray("E_{d}", numbers, "kN"), R_d), case=case)
+
+        numpy.testing.assert_allclose(envelope.maximum, [0.2, 0.95, 1.2, 0.05])
+        numpy.testing.assert_allclose(envelope.minimum, [0.1, 0.4, 0.25, 0.01])
+        self.assertEqual(envelope.maximumCase, ["B", "C", "B", "A"])
+        self.assertEqual(envelope.count, 12)
+
+        governing = envelope.governing()
+        self.assertEqual([(item.element, item.case) for item in governing],
+                         [(2, "B"), (1, "C"), (1, "A")])
+        self.assertAlmostEqual(governing[0].number, 1.2)
+        E_d = governing[0].inputs["E_d"]
+        self.assertEqual((E_d.abbreviation, E_d.number, E_d.units), ("E_{d}", 1200, "kN"))
+        self.assertIs(governing[0].inputs["R_d"], R_d)
+
+    def test_scalars_by_key(self):
+        envelope = Envelope(k=2)
+        psi_0 = DesignFactor("psi_{0}", 0.7)
+        for name, number, units in [("beam", 10, "kN"), ("column", 0.02, "MN"),
+                                    ("beam", 30, "kN")]:
+            envelope.add(Eq6_1(psi_0, DesignValue("Q_{k}", number, units, name)))
+        self.assertEqual(envelope.units, "kN")
+        self.assertEqual(envelope.elements, ["beam", "column"])
+        numpy.testing.assert_allclose(envelope.maximum, [21, 14])
+        numpy.testing.assert_allclose(envelope.minimum, [7, 14])
+        self.assertEqual(envelope.governing()[0].inputs["Q_k"].number, 30)
+        self.assertEqual(len(envelope.governing()), 2)
+
+    def test_mixed_elements(self):
+        envelope = Envelope()
+        envelope.add(DesignFactor("Utilisation", 0.5), elements=3)
+        self.assertEqual(len(envelope), 4)
+        with self.assertRaises(ValueError):
+            envelope.add(DesignFactor("Utilisation", 0.5), elements="beam")
+        with self.assertRaises(ValueError):
+            envelope.add(DesignValue("E_{d}", 1, "kN"), elements=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+from Settings import DesignValue, DesignFactor
+from EC0 import Eq6_1
+from EC0 import Glossary
+
+
+class TestGlossary(unittest.TestCase):
+
+    def setUp(self):
+        Glossary.Invalidate()
+
+    def test_resolved_on_first_access(self):
+        Q_comb = Eq6_1(DesignFactor("psi_{0}", 0.7), DesignValue("Q_{k}", 532, "kN"))
+        self.assertIsNone(Glossary._definitions)
+        self.assertEqual(Q_comb.Q_k.description,
+                         "Characteristic value of a variable action.")
+        self.assertIsNotNone(Glossary._definitions)
+
+    def test_explicit_description_kept(self):
+        Q_k = DesignValue("Q_{k}", 532, "kN", description="Wind load")
+        Eq6_1(DesignFactor("psi_{0}", 0.7), Q_k)
+        self.assertEqual(Q_k.description, "Wind load")
+
+    def test_first_match_wins(self):
+        # 'psi' precedes 'psi_{0}' in the table and matches it by prefix
+        self.assertEqual(Glossary.Lookup("psi_{0}"), Glossary.Dict()["psi"])
+        self.assertEqual(Glossary.Lookup("Q_{d}"), Glossary.Dict()["Q_{d}"])
+        self.assertEqual(Glossary.Lookup("Utilisation [FAIL]"),
+                         Glossary.Dict()["Utilisation"])
+        self.assertEqual(Glossary.Lookup("x_{unknown}"), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import csv
+import io
+import unittest
+from math import isclose
+from Settings import DesignValue, DesignFactor
+from EC0 import Eq6_1, Eq8_1, Eq8_10
+from EC0.Pipeline import Pipeline
+
+
+class TestPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.psi_0 = DesignFactor("psi_{0}", 0.7)
+        self.gamma_Q = DesignFactor("gamma_{Q}", 1.5)
+        self.pipeline = Pipeline(
+            columns={"Q_k": ("Q", "Q_{k}", "kN"), "R_d": ("R", "R_{d}", "MN")},
+            steps=[("Q_comb", Eq6_1, {"psi_0": self.psi_0, "Q_k": "Q_k"}),
+                   ("Q_d", Eq8_10, {"gamma_Q": self.gamma_Q, "Q_comb": "Q_comb"}),
+                   ("utilisation", Eq8_1, {"E_d": ("Q_d", "E_{d}"), "R_d": "R_d"})],
+            outputs=["Q_d", "utilisation"],
+            keep=["element"])
+
+    def test_streaming(self):
+        rows = [(f"B{index}", 100 + index, 0.5) for index in range(10)]
+        source = io.StringIO()
+        csv.writer(source).writerows([("element", "Q", "R")] + rows)
+        source.seek(0)
+        target = io.StringIO()
+        self.assertEqual(self.pipeline.run(source, target, chunksize=3), 10)
+
+        output = list(csv.reader(io.StringIO(target.getvalue())))
+        self.assertEqual(output[0], ["element", "Q_d [kN]", "utilisation"])
+        self.assertEqual(len(output), 11)
+        for (element, Q, R), result in zip(rows, output[1:]):
+            Q_d = Eq8_10(self.gamma_Q, Eq6_1(self.psi_0, DesignValue("Q_{k}", Q, "kN")))
+            utilisation = Eq8_1(DesignValue("E_{d}", Q_d.number, "kN"),
+                                DesignValue("R_{d}", R, "MN"))
+            with self.subTest(element=element):
+                self.assertEqual(result[0], element)
+                self.assertTrue(isclose(float(result[1]), Q_d.number))
+                self.assertTrue(isclose(float(result[2]), utilisation.number))
+
+    def test_unknown_input(self):
+        with self.assertRaises(ValueError):
+            Pipeline(columns={}, steps=[("Q_comb", Eq6_1, {"psi_0": self.psi_0,
+                                                             "Q_k": "Q_k"})])
+
+
+if __name__ == "__main__":
+    unittest.main()
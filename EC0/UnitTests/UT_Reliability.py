@@ -0,0 +1,52 @@
+import unittest
+import numpy
+from Settings import DesignValue, DesignFactor
+from EC0 import Reliability, Eq6_1, Eq8_10, Eq8_1
+from EC0.Reliability import Sample
+
+
+class TestReliability(unittest.TestCase):
+
+    def setUp(self):
+        psi_0 = DesignFactor("psi_{0}", 0.7)
+        gamma_Q = DesignFactor("gamma_{Q}", 1.5)
+        self.steps = [
+            ("Q_comb", Eq6_1, {"psi_0": psi_0, "Q_k": "Q_k"}),
+            ("Q_d", Eq8_10, {"gamma_Q": gamma_Q, "Q_comb": "Q_comb"}),
+            ("utilisation", Eq8_1, {"E_d": ("Q_d", "E_{d}"), "R_d": "R_d"}),
+        ]
+
+    def test_deterministic(self):
+        inputs = {"Q_k": DesignValue("Q_{k}", 500, "kN"), "R_d": DesignValue("R_{d}", 0.5, "MN")}
+        result = Reliability(self.steps, inputs, samples=10, chunksize=3)
+        self.assertAlmostEqual(result.mean, 1.05)
+        self.assertAlmostEqual(result.std, 0)
+        self.assertEqual(result.probability, 1.0)
+
+    def test_normal(self):
+        inputs = {
+            "Q_k": DesignValue("Q_{k}", 500, "kN", tolerance=50),
+            "R_d": DesignValue("R_{d}", 1.05, "MN"),
+        }
+        result = Reliability(self.steps, inputs, samples=200000, chunksize=30000, seed=3)
+        # utilisation = Q_k / 1000, normal with mean 0.5 and std 0.05
+        self.assertAlmostEqual(result.mean, 0.5, places=3)
+        self.assertAlmostEqual(result.std, 0.05, places=3)
+        self.assertEqual(result.histogram.sum(), 200000)
+        self.assertEqual(result.failures, 0)
+
+        same = Reliability(self.steps, inputs, samples=200000, chunksize=30000, seed=3)
+        self.assertEqual(same.mean, result.mean)
+
+    def test_truncated(self):
+        value = DesignValue("Q_{k}", 10, "kN", tolerance=5, lowerLimit=8, upperLimit=11)
+        numbers = Sample(value, 100000, numpy.random.default_rng(0))
+        self.assertGreaterEqual(numbers.min(), 8)
+        self.assertLessEqual(numbers.max(), 11)
+        with self.assertRaises(ValueError):
+            Sample(DesignValue("Q_{k}", 10, "kN", tolerance=1, lowerLimit=9, upperLimit=2),
+                   10, numpy.random.default_rng(0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import asyncio
+import json
+import unittest
+from Settings import DesignValue
+from EC0 import Eq8_1
+from EC0.Service import Service
+
+
+def value(abbreviation, number, units=None):
+    result = {"abbreviation": abbreviation, "number": number}
+    if units is not None:
+        result["units"] = units
+    return result
+
+
+def check(E_d, R_d):
+    return {"E_d": value("E_{d}", E_d, "kN"), "R_d": value("R_{d}", R_d, "MN")}
+
+
+class TestService(unittest.TestCase):
+
+    def exchange(self, requests, service=None):
+        service = service or Service(delay=0.01)
+
+        async def run():
+            server = await service.start("127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            for request in requests:
+                writer.write(json.dumps(request).encode() + b"\n")
+            await writer.drain()
+            responses = [json.loads(await reader.readline()) for _ in requests]
+            writer.close()
+            server.close()
+            await server.wait_closed()
+            return {response["id"]: response for response in responses}
+
+        return asyncio.run(run())
+
+    def test_batched_matches_scalar(self):
+        service = Service(delay=0.01)
+        numbers = [(100, 0.5), (600, 0.5), (300, 1)]
+        responses = self.exchange(
+            [{"id": index, "equation": "Eq8_1", "calls": [check(*pair)]}
+             for index, pair in enumerate(numbers)] +
+            [{"id": "psi", "equation": "Eq6_1", "reference": True, "calls": [
+                {"psi_0": value("psi_{0}", 0.7), "Q_k": value("Q_{k}", number, "kN")}
+                for number in (1, 2, 3)]}], service)
+
+        for index, (E_d, R_d) in enumerate(numbers):
+            expected = Eq8_1(DesignValue("E_{d}", E_d, "kN"), DesignValue("R_{d}", R_d, "MN"))
+            result = responses[index]["results"][0]
+            self.assertAlmostEqual(result["number"], expected.number)
+            self.assertEqual(result["abbreviation"], expected.abbreviation)
+        self.assertEqual([result["number"] for result in responses["psi"]["results"]],
+                         [0.7, 1.4, 2.0999999999999996])
+        self.assertEqual(responses["psi"]["results"][0]["units"], "kN")
+        self.assertEqual(responses["psi"]["reference"]["equation"], "(6.1)")
+        self.assertNotIn("reference", responses[0])
+        self.assertEqual(service.calls, 6)
+
+    def test_errors(self):
+        responses = self.exchange([
+            {"id": 1, "equation": "Eq9_9", "calls": []},
+            {"id": 2, "equation": "Eq8_1", "calls": [check(1, 0), check(1, 1)]},
+            {"id": 3, "equation": "Eq8_1", "calls": [{"E_d": value("E_{d}", 1, "kN")}]},
+        ])
+        self.assertIn("ValueError", responses[1]["error"])
+        self.assertIn("ZeroDivisionError", responses[2]["results"][0]["error"])
+        self.assertAlmostEqual(responses[2]["results"][1]["number"], 0.001)
+        self.assertIn("R_d", responses[3]["error"])
+
+    def test_non_numeric_numbers_not_batched(self):
+        text = check(300, 0.5)
+        text["E_d"]["number"] = "300"
+        service = Service(delay=0.01)
+        response = self.exchange(
+            [{"id": 1, "equation": "Eq8_1", "calls": [check(100, 0.5), text, check(200, 0.5)]}],
+            service)[1]
+        numbers, error, numbers2 = response["results"]
+        self.assertAlmostEqual(numbers["number"], 0.2)
+        self.assertIn("'number' must be a float, int or Dual", error["error"])
+        self.assertAlmostEqual(numbers2["number"], 0.4)
+        self.assertEqual(service.batches, 1)
+
+    def test_bad_call_queues_none(self):
+        service = Service(delay=0.01)
+        responses = self.exchange([
+            {"id": 1, "equation": "Eq8_1", "calls": [check(1, 1), {"E_d": value("E_{d}", 1, "kN")}]},
+            {"id": 2, "equation": "Eq8_1", "calls": [check(1, 1), {"E_d": 5, "R_d": 5}]},
+        ], service)
+        self.assertIn("R_d", responses[1]["error"])
+        self.assertIn("'E_d' must be an object", responses[2]["error"])
+        self.assertEqual(service.calls, 0)
+
+    def test_non_object_request(self):
+        service = Service(delay=0.01)
+
+        async def run():
+            server = await service.start("127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            lines = [b"[1,2]", b"5", b'"x"', b"null"]
+            writer.write(b"\n".join(lines) + b"\n")
+            await writer.drain()
+            responses = [
+                json.loads(await asyncio.wait_for(reader.readline(), 5)) for _ in lines
+            ]
+            writer.close()
+            server.close()
+            await server.wait_closed()
+            return responses
+
+        for response in asyncio.run(run()):
+            self.assertIsNone(response["id"])
+            self.assertIn("JSON object", response["error"])
+
+
+if __name__ == '__main__':
+    unittest.main()
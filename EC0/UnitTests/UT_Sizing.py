@@ -0,0 +1,64 @@
+import math
+import unittest
+import numpy
+from Settings import DesignValue, DesignValueArray
+from EC0 import Sizing, Eq8_2
+
+
+def resistance(depth):
+    # 0.35 depth^2 in N, depth in mm
+    return DesignValue("R_{d}", 0.35 * depth**2, "N")
+
+
+class TestSizing(unittest.TestCase):
+
+    def setUp(self):
+        self.E_d = [DesignValue("E_{d}", 120, "kN"),
+                    DesignValueArray("E_{d}", numpy.linspace(0.01, 0.3, 100), "MN")]
+        self.depth = math.sqrt(300000 / 0.35)
+
+    def test_bisection(self):
+        sizing = Sizing(self.E_d, resistance, 10, 5000, tolerance=1e-6)
+        self.assertTrue(sizing.converged)
+        self.assertAlmostEqual(sizing.parameter, self.depth, places=5)
+        self.assertGreaterEqual(sizing.parameter, self.depth)
+        self.assertLessEqual(sizing.utilisation, 1.0)
+        self.assertEqual(sizing.governing, 100)
+        self.assertEqual(sizing.evaluations, sizing.iterations + 2)
+
+    def test_newton(self):
+        bisection = Sizing(self.E_d, resistance, 10, 5000, tolerance=1e-6)
+        sizing = Sizing(self.E_d, resistance, 10, 5000, tolerance=1e-6, method="newton")
+        self.assertEqual(sizing.method, "newton")
+        self.assertAlmostEqual(sizing.parameter, self.depth, places=5)
+        self.assertLessEqual(sizing.utilisation, 1.0)
+        self.assertLess(sizing.iterations, bisection.iterations)
+
+    def test_newton_without_derivative(self):
+        sizing = Sizing(self.E_d, lambda depth: resistance(float(depth)), 10, 5000,
+                        method="newton")
+        self.assertEqual(sizing.method, "bisection")
+        self.assertAlmostEqual(sizing.parameter, self.depth, places=5)
+
+    def test_eq8_2(self):
+        sizing = Sizing(DesignValue("E_{d}", 30, "mm"),
+                        lambda c: DesignValue("C_{d,ULS}", c, "cm"), 0.1, 100,
+                        equation=Eq8_2, method="newton")
+        self.assertAlmostEqual(sizing.parameter, 3.0, places=5)
+
+    def test_infeasible(self):
+        with self.assertRaises(ValueError):
+            Sizing(self.E_d, resistance, 10, 100)
+        sizing = Sizing(self.E_d, resistance, 1000, 5000)
+        self.assertEqual((sizing.parameter, sizing.iterations), (1000, 0))
+
+
+    def test_actions_validated(self):
+        with self.assertRaisesRegex(ValueError, "'E_d' must have abbreviation 'E_\\{d\\}'"):
+            Sizing(DesignValue("Q_{d}", 120, "kN"), resistance, 10, 5000)
+        with self.assertRaises(TypeError):
+            Sizing([1.0], resistance, 10, 5000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,9 @@
 # Package initialization for EC0
-from .Eq6_1 import Eq6_1
-from .Eq6_2 import Eq6_2
-from .Eq6_3 import Eq6_3
-from .Eq8_1 import Eq8_1
-from .Eq8_2 import Eq8_2
-from .Eq8_10 import Eq8_10
+from Settings.Lazy import Install
 
-__all__ = ["Eq6_1", "Eq6_2", "Eq6_3", "Eq8_1", "Eq8_2", "Eq8_10", "Glossary"]
+__all__ = ["Eq6_1", "Eq6_2", "Eq6_3", "Eq8_1", "Eq8_2", "Eq8_10", "Combinations",
+           "Batch", "Pipeline", "Service", "Envelope", "Reliability", "Sizing",
+           "Glossary"]
+
+# Equations and tools are imported on first use, Glossary is the module itself
+Install(__name__, {name: (name, None if name == "Glossary" else name) for name in __all__})
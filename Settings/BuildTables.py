@@ -0,0 +1,17 @@
+"""
+Build step compiling the CSV tables of Settings and EC0 into generated modules,
+Settings/UnitTable.py and EC0/DefinitionTable.py. Run after editing a table:
+
+	python -m Settings.BuildTables
+"""
+from Settings import UnitConversion
+from EC0 import Glossary
+
+
+def Build():
+	UnitConversion.Compile()
+	Glossary.Compile()
+
+
+if __name__ == "__main__":
+	Build()
@@ -0,0 +1,98 @@
+from collections import OrderedDict, namedtuple
+"""
+Opt-in LRU cache of equation results, keyed on the equation class and a
+snapshot of its inputs.
+
+	from Settings import Cache
+	Cache.Enable(maxsize=10000)
+	...
+	Cache.Statistics()    # CacheInfo(hits=..., misses=..., maxsize=..., currsize=...)
+	Cache.Clear()
+
+While enabled, constructing an equation whose inputs match an earlier call
+returns the earlier equation object; validation, calculation, tracing and
+glossary work are all skipped. Inputs are matched on their type, abbreviation,
+number, units and name. Calls with array inputs are never cached. Cached
+results are shared, so they must not be modified in place.
+"""
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+# Global switch, read on every equation construction
+enabled = False
+maxsize = 4096
+hits = 0
+misses = 0
+
+_results = OrderedDict()
+
+
+def Enable(size: int = 4096):
+	global enabled, maxsize
+	if size < 1:
+		raise ValueError(f"Argument 'size' must be at least 1; got {size}.")
+	enabled = True
+	maxsize = size
+	while len(_results) > maxsize:
+		_results.popitem(last=False)
+
+
+def Disable():
+	global enabled
+	enabled = False
+
+
+def Clear():
+	"""Empties the cache and resets the statistics."""
+	global hits, misses
+	_results.clear()
+	hits = 0
+	misses = 0
+
+
+def Statistics() -> CacheInfo:
+	return CacheInfo(hits, misses, maxsize, len(_results))
+
+
+def _snapshot(value):
+	number = getattr(value, "number", None)
+	if type(number) is not float:
+		# Arrays and other number types are not cached
+		return None
+	return (type(value), value.abbreviation, number, getattr(value, "units", None),
+	        value.name)
+
+
+def Key(equation, args: tuple, kwargs: dict):
+	"""Returns the cache key of a call, or None if it cannot be cached."""
+	key = [equation]
+	for value in args:
+		snapshot = _snapshot(value)
+		if snapshot is None:
+			return None
+		key.append(snapshot)
+	for name in sorted(kwargs):
+		snapshot = _snapshot(kwargs[name])
+		if snapshot is None:
+			return None
+		key.append((name, snapshot))
+	return tuple(key)
+
+
+def Evaluate(equation, args: tuple, kwargs: dict, construct):
+	"""Returns the cached result of a call, constructing it on a miss."""
+	global hits, misses
+	key = Key(equation, args, kwargs)
+	if key is None:
+		return construct(*args, **kwargs)
+	result = _results.get(key)
+	if result is not None:
+		hits += 1
+		_results.move_to_end(key)
+		return result
+	misses += 1
+	result = construct(*args, **kwargs)
+	_results[key] = result
+	if len(_results) > maxsize:
+		_results.popitem(last=False)
+	return result
@@ -0,0 +1,156 @@
+"""
+A graph of equations whose results are recomputed only when their inputs change.
+
+	graph = CalculationGraph()
+	graph.input("psi_0", psi_0)
+	graph.input("gamma_Q", gamma_Q)
+	graph.input("Q_k", Q_k_wind)
+	graph.add("Q_comb", EC0.Eq6_1, psi_0="psi_0", Q_k="Q_k")
+	graph.add("Q_d", EC0.Eq8_10, gamma_Q="gamma_Q", Q_comb="Q_comb")
+	graph["Q_d"].number
+
+	graph.set("Q_k", DesignValue("Q_{k}", 600, "kN", name="wind"))
+	graph["Q_d"].number    # Q_comb and Q_d are recomputed, nothing else
+
+Results are evaluated lazily and cached. Replacing an input with set(), or
+calling touch() after changing it in place, invalidates only the equations
+downstream of it. refresh() detects in-place changes to any input.
+
+A graph can also be recovered from equations already chained by hand, since
+each equation stores the inputs it was built from:
+
+	graph = CalculationGraph.fromEquations(Q_comb=Q_comb_wind, Q_d=Q_d_wind)
+"""
+
+
+_fields = ("abbreviation", "number", "units", "name")
+
+
+def _snapshot(value) -> tuple:
+	fields = [getattr(value, field, None) for field in _fields]
+	# Array numbers are copied, so that changes to their elements are seen
+	if hasattr(fields[1], "copy"):
+		fields[1] = fields[1].copy()
+	return tuple(fields)
+
+
+def _changed(value, snapshot: tuple) -> bool:
+	for field, before in zip(_fields, snapshot):
+		after = getattr(value, field, None)
+		if hasattr(after, "ndim") or hasattr(before, "ndim"):
+			import numpy
+			if not numpy.array_equal(after, before, equal_nan=True):
+				return True
+		elif after != before:
+			return True
+	return False
+
+
+class CalculationGraph(object):
+
+	def __init__(self):
+		self.inputs = {}
+		self.equations = {}
+		self.results = {}
+		self.dependents = {}
+		self.evaluations = 0
+		self._snapshots = {}
+
+	def __contains__(self, name: str) -> bool:
+		return name in self.inputs or name in self.equations
+
+	def input(self, name: str, value):
+		"""Declares an input node holding a DesignValue or DesignFactor."""
+		if name in self.equations:
+			raise ValueError(f"'{name}' is already an equation of the graph.")
+		self.dependents.setdefault(name, set())
+		self.set(name, value)
+
+	def add(self, name: str, equation, **arguments):
+		"""Declares an equation node, mapping each argument to an input or equation."""
+		if name in self:
+			raise ValueError(f"'{name}' is already a node of the graph.")
+		for parameter, source in arguments.items():
+			if source not in self:
+				raise ValueError(
+				    f"Argument '{parameter}' of '{name}' refers to unknown node '{source}'.")
+		self.equations[name] = (equation, dict(arguments))
+		self.dependents[name] = set()
+		for source in arguments.values():
+			self.dependents[source].add(name)
+
+	def set(self, name: str, value):
+		"""Replaces an input and invalidates everything downstream of it."""
+		if name in self.equations:
+			raise ValueError(f"'{name}' is an equation of the graph, not an input.")
+		if name not in self.dependents:
+			raise KeyError(name)
+		self.inputs[name] = value
+		self.touch(name)
+
+	def touch(self, name: str):
+		"""Invalidates everything downstream of a node, e.g. after an in-place change."""
+		self._snapshots[name] = _snapshot(self.inputs[name]) if name in self.inputs else None
+		pending = [name]
+		while pending:
+			for dependent in self.dependents[pending.pop()]:
+				if self.results.pop(dependent, None) is not None:
+					pending.append(dependent)
+
+	def refresh(self) -> list:
+		"""Invalidates the dependents of inputs changed in place; returns their names."""
+		changed = [
+		    name for name, value in self.inputs.items() if _changed(value, self._snapshots[name])
+		]
+		for name in changed:
+			self.touch(name)
+		return changed
+
+	def __getitem__(self, name: str):
+		if name in self.inputs:
+			return self.inputs[name]
+		result = self.results.get(name)
+		if result is None:
+			equation, arguments = self.equations[name]
+			result = equation(**{
+			    parameter: self[source]
+			    for parameter, source in arguments.items()
+			})
+			self.evaluations += 1
+			self.results[name] = result
+		return result
+
+	@classmethod
+	def fromEquations(cls, **equations):
+		"""Builds a graph from named equation objects, following their stored inputs.
+
+		Stored inputs that are one of the named equations become edges; any other
+		value becomes an input node named '<equation>.<argument>'.
+		"""
+		graph = cls()
+		names = {id(equation): name for name, equation in equations.items()}
+		inputs = {}
+
+		def visit(name, equation):
+			if name in graph:
+				return
+			arguments = {}
+			schema = type(equation).schema
+			if schema is None:
+				raise ValueError(f"'{name}' must be an equation with a schema.")
+			for parameter in schema.inputs:
+				value = vars(equation)[parameter]
+				if id(value) in names:
+					visit(names[id(value)], value)
+					arguments[parameter] = names[id(value)]
+				else:
+					if id(value) not in inputs:
+						inputs[id(value)] = f"{name}.{parameter}"
+						graph.input(inputs[id(value)], value)
+					arguments[parameter] = inputs[id(value)]
+			graph.add(name, type(equation), **arguments)
+			graph.results[name] = equation
+
+		for name, equation in equations.items():
+			visit(name, equation)
+		return graph
@@ -1,57 +1,137 @@
-from dataclasses import dataclass
-from Settings import DesignValue, DesignFactor
+from operator import attrgetter
+from Settings import DesignValue, DesignFactor, Cache, Profile
+from Settings.Schema import Schema
 
 
-class DesignEquation(object):
+class DesignEquationMeta(type):
+
+	def __init__(cls, name, bases, namespace):
+		super().__init__(name, bases, namespace)
+		# Equations declaring their result get a schema, derived once here
+		if "output" in namespace:
+			cls.schema = Schema.fromClass(cls)
+			# Expose the result's fields directly rather than through __getattr__
+			fields = getattr(cls.schema.outputType, "_fields", ())
+			for field in fields:
+				if field not in namespace:
+					setattr(cls, field, property(attrgetter(f"{cls.schema.output}.{field}")))
+
+	def __call__(cls, *args, **kwargs):
+		start = Profile.Clock() if Profile.enabled else None
+		if Cache.enabled:
+			result = Cache.Evaluate(cls, args, kwargs, super().__call__)
+		else:
+			result = super().__call__(*args, **kwargs)
+		if start is not None:
+			Profile.Add(cls.__name__, start)
+		return result
+
+
+class DesignEquation(object, metaclass=DesignEquationMeta):
 	standard: str
 	section: str
 	subsection: str
 	clause: str
 	equation: str
+	schema = None
+	# Every instance stores the same attributes, so isinstance verdicts are cached
+	_fixedAttributes = True
+
+	@staticmethod
+	def _designValue(abbreviation, number, units, name=""):
+		# Batch inputs produce batch outputs
+		if getattr(number, "ndim", 0):
+			from Settings import DesignValueArray
+			return DesignValueArray(abbreviation, number, units, name)
+		return DesignValue(abbreviation, number, units, name)
+
+	@staticmethod
+	def _designFactor(abbreviation, number, name=""):
+		if getattr(number, "ndim", 0):
+			from Settings import DesignFactorArray
+			return DesignFactorArray(abbreviation, number, name)
+		return DesignFactor(abbreviation, number, name)
+
+	@staticmethod
+	def _exceeds(number, limit) -> bool:
+		# True if any value in the batch exceeds the limit
+		if getattr(number, "ndim", 0):
+			return bool((number > limit).any())
+		return number > limit
+
+	# Forward attribute access to the calculated value
+	def __getattr__(self, name):
+		# Read through __dict__ so that a partly built or unpickled object
+		# cannot recurse back into __getattr__
+		if self.schema is not None:
+			output = self.__dict__.get(self.schema.output)
+			if output is not None and hasattr(output, name):
+				return getattr(output, name)
+		raise AttributeError(
+			f"{self.__class__.__name__} has no attribute '{name}'.")
 
-		
 	def __format__(self, format_spec):
+		if format_spec == "value":
+			return str(self.__dict__[self.schema.output])
 		if format_spec == "short":
 			return self.parameters()
+		return str(self)
+
+	def _parameterNames(self) -> tuple:
+		#Returns the names of the attributes holding a DesignFactor or DesignValue.
+		if self.schema is not None:
+			return self.schema.parameters
+		#Equations without a schema always store the same attributes, so the layout
+		#is worked out from the first instance and kept on the class.
+		names = type(self).__dict__.get("_parameterLayout")
+		if names is None:
+			exclude = {"standard", "section", "subsection", "clause", "equation"}
+			names = tuple(
+			    key for key, value in vars(self).items()
+			    if key not in exclude and isinstance(value, (DesignFactor, DesignValue)))
+			type(self)._parameterLayout = names
+		return names
 
 	def _getEquationParameters(self):
 		#Returns a list of explicitly defined objects that are of type DesignFactor or DesignValue.
-		exclude = {"standard", "section", "subsection", "clause", "equation"}
+		attributes = vars(self)
+		return [attributes[name] for name in self._parameterNames()]
 
-		# Get all instance attributes excluding defaults and retrieve their values
-		parameters = [
-			getattr(self, key) for key in vars(self).keys()
-			if key not in exclude and isinstance(getattr(self, key), (DesignFactor,
-																	  DesignValue))
-		]
-		return parameters
+	def _header(self) -> str:
+		# The reference block is the same for every instance of a class
+		header = type(self).__dict__.get("_referenceHeader")
+		if header is None:
+			header = "".join([
+			    self.standard, ":\n  ",
+			    "Section: ", self.section, "\n  ",
+			    "Subsection: ", self.subsection, "\n  ",
+			    "Clause: ", self.clause, "\n  ",
+			    "Equation: ", self.equation, "\n  ",
+			    "Where:\n",
+			    "  ", self.formula, "\n  ",
+			])
+			type(self)._referenceHeader = header
+		return header
 
 	def reference(self, equation) -> str:
-		output = self.standard + ":\n  "
-		output += "Section: " + self.section + "\n  "
-		output += "Subsection: " + self.subsection + "\n  "
-		output += "Clause: " + self.clause + "\n  "
-		output += "Equation: " + self.equation + "\n  "
-		output += "Where:\n"
-		output += "  " + self.formula + "\n  "
-		parameters = self._getEquationParameters()
-		for parameter in parameters:
-			output += "	" + parameter.abbreviation + ", " + parameter.description + "\n  "
-		output += self._params()
-		return output
-		
+		output = [self._header()]
+		for parameter in self._getEquationParameters():
+			output += ["	", parameter.abbreviation, ", ", parameter.description, "\n  "]
+		output.append(self._params())
+		return "".join(output)
+
 	def parameters(self) -> str:
-			output = "  " + self.formula + "\t" + self.equation + "\n  "
-			output += self._params()
-			return output
-		
+		return "".join(["  ", self.formula, "\t", self.equation, "\n  ", self._params()])
+
+	def _values(self) -> list:
+		# Printable value of each parameter; equations print their result only
+		return [
+		    f"{parameter:value}" if isinstance(parameter, DesignEquation) else str(parameter)
+		    for parameter in self._getEquationParameters()
+		]
+
 	def _params(self) -> str:
-		output = "Parameters:\n"
-		parameters = self._getEquationParameters()
-		for parameter in parameters:
-			if isinstance(parameter, DesignEquation):
-				output += "	" + f"{parameter:value}"
-			else:
-				output += "	" + str(parameter)
-			output += "\n"
-		return output
\ No newline at end of file
+		output = ["Parameters:\n"]
+		for value in self._values():
+			output += ["	", value, "\n"]
+		return "".join(output)
@@ -0,0 +1,68 @@
+from dataclasses import dataclass
+import numpy
+from Settings.DesignFactor import DesignFactor
+
+
+@dataclass(eq=False)
+class DesignFactorArray:
+	"""A batch of design factors sharing one abbreviation and name.
+
+	Structurally it satisfies isinstance(x, DesignFactor), so every equation
+	that accepts a DesignFactor evaluates the whole batch in one operation.
+	"""
+	abbreviation: str
+	number: numpy.ndarray
+	name: str = ""
+	description: str = ""
+	# Every instance has the same attributes, so isinstance verdicts are cached
+	_fixedAttributes = True
+
+	def __post_init__(self):
+		if not isinstance(self.abbreviation, str):
+			raise TypeError(
+			    f"'abbreviation' must be a string, not {type(self.abbreviation).__name__}"
+			)
+
+		number = numpy.asarray(self.number)
+		if number.dtype.kind not in "iuf":
+			raise TypeError(
+			    f"'number' must be an array of floats or ints, not {number.dtype}")
+
+		# Ensure ints are converted to floats
+		self.number = number.astype(float, copy=False)
+
+	def __len__(self):
+		return len(self.number)
+
+	def __getitem__(self, index) -> DesignFactor:
+		return DesignFactor(self.abbreviation, float(self.number[index]), self.name,
+		                    self.description)
+
+	# Glossary lookup used to resolve an empty description on first access
+	_glossary = None
+
+	def _getDescription(self) -> str:
+		if self._description == "" and self._glossary is not None:
+			self._description = self._glossary(self.abbreviation)
+		return self._description
+
+	def _setDescription(self, description: str):
+		self._description = description
+
+	def __str__(self):
+		output = self.abbreviation
+		if self.name != "":
+			output = output.replace("}", "," + self.name + "}")
+		if self.number.size == 0:
+			return f"{output} = [] []"
+		low = str.format('{0:.3}', self.number.min())
+		high = str.format('{0:.3}', self.number.max())
+		return f"{output} = [{low} .. {high}] (n={self.number.size}) []"
+
+	def __format__(self, format_spec):
+		return str(self)
+
+
+# Declared after the dataclass so that 'description' remains an __init__ field
+DesignFactorArray.description = property(DesignFactorArray._getDescription,
+                                         DesignFactorArray._setDescription)
@@ -1,39 +1,96 @@
-from dataclasses import dataclass
 from Settings.UnitConversion import UnitConversion
+from Settings.Dual import Dual
 
 class DesignValueMeta(type):
 
+	def __init__(cls, name, bases, namespace):
+		super().__init__(name, bases, namespace)
+		# isinstance verdicts by type(instance), kept only for types whose instances
+		# all have the same attributes: nominal design types and those declaring
+		# _fixedAttributes, such as equations and the batch types
+		cls._instanceTypes = {}
+
 	def __instancecheck__(cls, instance):
+		kind = type(instance)
+		verdict = cls._instanceTypes.get(kind)
+		if verdict is None:
+			verdict = cls._check(instance)
+			if getattr(kind, "_nominal", False) or getattr(kind, "_fixedAttributes", False):
+				cls._instanceTypes[kind] = verdict
+		return verdict
+
+	def _check(cls, instance) -> bool:
+		# Nominal check first. Instances of another nominal design type are
+		# rejected without probing; anything else is checked structurally so that
+		# duck-typed values (e.g. equations forwarding to their result) still pass.
+		if type.__instancecheck__(cls, instance):
+			return True
+		if getattr(type(instance), "_nominal", False):
+			return False
 		return hasattr(instance, "abbreviation") and hasattr(
 		    instance, "number") and hasattr(instance, "description") and hasattr(
 		        instance, "units")
 
 
-@dataclass
 class DesignValue(metaclass=DesignValueMeta):
-	abbreviation: str
-	number: float
-	units: str
-	name: str = ""
-	description: str = ""
-	tolerance: float = 0
-	upperLimit: float = 0
-	lowerLimit: float = 0
-
-	def __post_init__(self):
-		if not isinstance(self.abbreviation, str):
+	__slots__ = ("abbreviation", "number", "units", "name", "_description",
+	             "tolerance", "upperLimit", "lowerLimit", "_glossary")
+	_fields = ("abbreviation", "number", "units", "name", "description",
+	           "tolerance", "upperLimit", "lowerLimit")
+	_nominal = True
+
+	def __init__(self,
+	             abbreviation: str,
+	             number: float,
+	             units: str,
+	             name: str = "",
+	             description: str = "",
+	             tolerance: float = 0,
+	             upperLimit: float = 0,
+	             lowerLimit: float = 0):
+		if not isinstance(abbreviation, str):
 			raise TypeError(
-			    f"'abbreviation' must be a string, not {type(self.abbreviation).__name__}"
+			    f"'abbreviation' must be a string, not {type(abbreviation).__name__}"
 			)
-		if not isinstance(self.number, (float, int)):
+		if not isinstance(number, (float, int, Dual)):
 			raise TypeError(
-			    f"'number' must be a float or int, not {type(self.number).__name__}")
-		if not isinstance(self.units, str):
+			    f"'number' must be a float, int or Dual, not {type(number).__name__}")
+		if not isinstance(units, str):
 			raise TypeError(
-			    f"'units' must be a string, not {type(self.units).__name__}")
+			    f"'units' must be a string, not {type(units).__name__}")
+
+		self.abbreviation = abbreviation
+		# Ensure ints are converted to floats; a Dual keeps its derivatives
+		self.number = number if isinstance(number, Dual) else float(number)
+		self.units = units
+		self.name = name
+		self._description = description
+		self.tolerance = tolerance
+		self.upperLimit = upperLimit
+		self.lowerLimit = lowerLimit
+		# Glossary lookup used to resolve an empty description on first access
+		self._glossary = None
+
+	@property
+	def description(self) -> str:
+		if self._description == "" and self._glossary is not None:
+			self._description = self._glossary(self.abbreviation)
+		return self._description
 
-		# Ensure ints are converted to floats
-		self.number = float(self.number)
+	@description.setter
+	def description(self, description: str):
+		self._description = description
+
+	def __repr__(self):
+		fields = ", ".join(f"{field}={getattr(self, field)!r}" for field in self._fields)
+		return f"{type(self).__name__}({fields})"
+
+	def __eq__(self, other):
+		if other.__class__ is not self.__class__:
+			return NotImplemented
+		return all(getattr(self, field) == getattr(other, field) for field in self._fields)
+
+	__hash__ = None
 
 	def __str__(self):
 		output = self.abbreviation
@@ -44,5 +101,14 @@ class DesignValue(metaclass=DesignValueMeta):
 	def __format__(self, format_spec):
 		return str(self)
 
+	def _converted(self, number, units: str):
+		# Cheap copy for UnitConversion; the inputs were validated on construction
+		output = object.__new__(type(self))
+		for field in self.__slots__:
+			setattr(output, field, getattr(self, field))
+		output.number = number
+		output.units = units
+		return output
+
 	def Units(self, units: str):
-		return UnitConversion(self, units)
\ No newline at end of file
+		return UnitConversion(self, units)
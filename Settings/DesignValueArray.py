@@ -0,0 +1,88 @@
+from dataclasses import dataclass
+import numpy
+from Settings.DesignValue import DesignValue
+from Settings.UnitConversion import UnitConversion
+
+
+@dataclass(eq=False)
+class DesignValueArray:
+	"""A batch of design values sharing one abbreviation, units and name.
+
+	Structurally it satisfies isinstance(x, DesignValue), so every equation
+	that accepts a DesignValue evaluates the whole batch in one operation.
+	"""
+	abbreviation: str
+	number: numpy.ndarray
+	units: str
+	name: str = ""
+	description: str = ""
+	tolerance: float = 0
+	upperLimit: float = 0
+	lowerLimit: float = 0
+	# Every instance has the same attributes, so isinstance verdicts are cached
+	_fixedAttributes = True
+
+	def __post_init__(self):
+		if not isinstance(self.abbreviation, str):
+			raise TypeError(
+			    f"'abbreviation' must be a string, not {type(self.abbreviation).__name__}"
+			)
+		if not isinstance(self.units, str):
+			raise TypeError(
+			    f"'units' must be a string, not {type(self.units).__name__}")
+
+		number = numpy.asarray(self.number)
+		if number.dtype.kind not in "iuf":
+			raise TypeError(
+			    f"'number' must be an array of floats or ints, not {number.dtype}")
+
+		# Ensure ints are converted to floats
+		self.number = number.astype(float, copy=False)
+
+	def __len__(self):
+		return len(self.number)
+
+	def __getitem__(self, index) -> DesignValue:
+		return DesignValue(self.abbreviation, float(self.number[index]), self.units,
+		                   self.name, self.description, self.tolerance,
+		                   self.upperLimit, self.lowerLimit)
+
+	# Glossary lookup used to resolve an empty description on first access
+	_glossary = None
+
+	def _getDescription(self) -> str:
+		if self._description == "" and self._glossary is not None:
+			self._description = self._glossary(self.abbreviation)
+		return self._description
+
+	def _setDescription(self, description: str):
+		self._description = description
+
+	def __str__(self):
+		output = self.abbreviation
+		if self.name != "":
+			output = output.replace("}", "," + self.name + "}")
+		if self.number.size == 0:
+			return f"{output} = [] [{self.units}]"
+		low = str.format('{0:.4}', self.number.min())
+		high = str.format('{0:.4}', self.number.max())
+		return f"{output} = [{low} .. {high}] (n={self.number.size}) [{self.units}]"
+
+	def __format__(self, format_spec):
+		return str(self)
+
+	def _converted(self, number, units: str):
+		# Cheap copy for UnitConversion; the inputs were validated on construction
+		output = object.__new__(type(self))
+		output.__dict__.update(self.__dict__)
+		output.number = number
+		output.units = units
+		return output
+
+	def Units(self, units: str):
+		return UnitConversion(self, units)
+
+
+# Declared after the dataclass so that 'description' remains an __init__ field
+DesignValueArray.description = property(DesignValueArray._getDescription,
+                                        DesignValueArray._setDescription)
@@ -0,0 +1,156 @@
+"""
+Dual numbers for forward-mode sensitivities.
+
+A Dual carries a value and its partial derivatives with respect to any number
+of tagged inputs. Tag the inputs of a calculation, run it once, and read every
+partial derivative from the result:
+
+	from Settings import Dual
+	E_d = Dual.Tag(DesignValue("E_{d}", 400, "kN"))
+	R_d = Dual.Tag(DesignValue("R_{d}", 0.5, "MN"))
+	utilisation = Eq8_1(E_d, R_d)
+	utilisation.number.value                 # 0.8
+	utilisation.number.derivative("R_{d}")   # d(utilisation)/d(R_d), per MN
+
+DesignValue and DesignFactor accept a Dual as their number, and the equations
+and unit conversions only use the arithmetic and comparisons defined here, so
+derivatives pass through a whole chain of equations. Derivatives are with
+respect to the tagged number in the units it was tagged in. Equations with
+Dual inputs are never cached.
+"""
+
+
+class Dual(object):
+	__slots__ = ("value", "derivatives")
+
+	def __init__(self, value: float, derivatives: dict = None):
+		if not isinstance(value, (float, int)):
+			raise TypeError(f"'value' must be a float or int, not {type(value).__name__}")
+		self.value = float(value)
+		# tag -> partial derivative; tags not present have a derivative of 0
+		self.derivatives = derivatives if derivatives is not None else {}
+
+	@classmethod
+	def variable(cls, value: float, tag):
+		"""An independent input: its derivative with respect to tag is 1."""
+		return cls(value, {tag: 1.0})
+
+	def derivative(self, tag) -> float:
+		return self.derivatives.get(tag, 0.0)
+
+	@staticmethod
+	def _combine(a: dict, scaleA: float, b: dict, scaleB: float) -> dict:
+		# scaleA * a + scaleB * b, over the union of their tags
+		result = {tag: scaleA * derivative for tag, derivative in a.items()}
+		for tag, derivative in b.items():
+			result[tag] = result.get(tag, 0.0) + scaleB * derivative
+		return result
+
+	def __add__(self, other):
+		if isinstance(other, Dual):
+			return Dual(self.value + other.value,
+			            self._combine(self.derivatives, 1.0, other.derivatives, 1.0))
+		if isinstance(other, (float, int)):
+			return Dual(self.value + other, dict(self.derivatives))
+		return NotImplemented
+
+	__radd__ = __add__
+
+	def __neg__(self):
+		return Dual(-self.value, {tag: -derivative for tag, derivative in self.derivatives.items()})
+
+	def __sub__(self, other):
+		if isinstance(other, (Dual, float, int)):
+			return self + -other
+		return NotImplemented
+
+	def __rsub__(self, other):
+		if isinstance(other, (float, int)):
+			return -self + other
+		return NotImplemented
+
+	def __mul__(self, other):
+		if isinstance(other, Dual):
+			return Dual(self.value * other.value,
+			            self._combine(self.derivatives, other.value, other.derivatives,
+			                          self.value))
+		if isinstance(other, (float, int)):
+			return Dual(self.value * other,
+			            {tag: derivative * other for tag, derivative in self.derivatives.items()})
+		return NotImplemented
+
+	__rmul__ = __mul__
+
+	def __truediv__(self, other):
+		if isinstance(other, Dual):
+			value = self.value / other.value
+			return Dual(value,
+			            self._combine(self.derivatives, 1.0 / other.value, other.derivatives,
+			                          -value / other.value))
+		if isinstance(other, (float, int)):
+			return self * (1.0 / other)
+		return NotImplemented
+
+	def __rtruediv__(self, other):
+		if isinstance(other, (float, int)):
+			return Dual(other) / self
+		return NotImplemented
+
+	def __pow__(self, exponent):
+		if not isinstance(exponent, (float, int)):
+			return NotImplemented
+		scale = exponent * self.value**(exponent - 1)
+		return Dual(self.value**exponent,
+		            {tag: scale * derivative for tag, derivative in self.derivatives.items()})
+
+	def __abs__(self):
+		return -self if self.value < 0 else self
+
+	# Comparisons are on the value, e.g. for the utilisation > 1.0 checks
+	@staticmethod
+	def _value(other):
+		return other.value if isinstance(other, Dual) else other
+
+	def __eq__(self, other):
+		return self.value == self._value(other)
+
+	def __lt__(self, other):
+		return self.value < self._value(other)
+
+	def __le__(self, other):
+		return self.value <= self._value(other)
+
+	def __gt__(self, other):
+		return self.value > self._value(other)
+
+	def __ge__(self, other):
+		return self.value >= self._value(other)
+
+	def __hash__(self):
+		return hash(self.value)
+
+	def __float__(self):
+		return self.value
+
+	def __format__(self, format_spec):
+		# Reports show the value, formatted as a float would be
+		return format(self.value, format_spec)
+
+	def __str__(self):
+		return str(self.value)
+
+	def __repr__(self):
+		return f"Dual({self.value!r}, {self.derivatives!r})"
+
+
+def Tag(value, tag=None):
+	"""Returns a copy of a DesignValue or DesignFactor whose number is an
+	independent Dual, tagged by default with its abbreviation (and name)."""
+	if tag is None:
+		tag = value.abbreviation
+		if value.name != "":
+			tag = tag.replace("}", "," + value.name + "}")
+	import copy
+	output = copy.copy(value)
+	output.number = Dual.variable(value.number, tag)
+	return output
@@ -0,0 +1,51 @@
+import importlib
+import sys
+import types
+"""
+Lazy package namespaces: names are imported from their submodules on first
+access through the package's module-level __getattr__.
+
+	# EC0/__init__.py
+	from Settings.Lazy import Install
+	Install(__name__, {"Eq6_1": ("Eq6_1", "Eq6_1"), "Glossary": ("Glossary", None)})
+
+Each name maps to (submodule, attribute); an attribute of None exports the
+submodule itself. Most names here are also the name of their submodule, and
+the import system sets every loaded submodule on its package, so the package
+module keeps the exported object in place of the submodule whichever way it
+was first imported.
+"""
+
+
+class LazyPackage(types.ModuleType):
+
+	def __setattr__(self, name, value):
+		lazy = self.__dict__.get("_lazy", {})
+		if name in lazy and isinstance(value, types.ModuleType):
+			submodule, attribute = lazy[name]
+			if attribute is not None and value.__name__ == f"{self.__name__}.{submodule}":
+				value = getattr(value, attribute)
+		super().__setattr__(name, value)
+
+
+def Install(package: str, lazy: dict):
+	"""Makes the names in lazy, name -> (submodule, attribute), load on first use."""
+	module = sys.modules[package]
+
+	def __getattr__(name):
+		if name not in lazy:
+			raise AttributeError(f"module '{package}' has no attribute '{name}'")
+		submodule, attribute = lazy[name]
+		value = importlib.import_module(f"{package}.{submodule}")
+		if attribute is not None:
+			value = getattr(value, attribute)
+		setattr(module, name, value)
+		return value
+
+	def __dir__():
+		return sorted(set(module.__dict__) | set(lazy))
+
+	module._lazy = lazy
+	module.__getattr__ = __getattr__
+	module.__dir__ = __dir__
+	module.__class__ = LazyPackage
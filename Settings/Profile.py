@@ -0,0 +1,95 @@
+import time
+from collections import namedtuple
+"""
+Opt-in counters and cumulative timings of the calculation hot paths.
+
+	from Settings import Profile
+	with Profile.Session():
+		...
+	print(Profile.Summary())
+
+or switched globally with Profile.Enable() and Profile.Disable(). While on,
+every equation construction is counted and timed under its class name (cache
+hits included), as are its input validation ('Eq6_1.validate'), unit
+conversions ('UnitConversion', 'UnitRatio'), glossary attachment ('Glossary')
+and report rendering ('Report.Render'). Times are inclusive: an equation's time
+contains the validation and conversions it performs.
+
+Every hook is guarded by 'if Profile.enabled:', so nothing is timed or counted
+while profiling is off. Statistics accumulate across sessions until Reset().
+"""
+
+Stat = namedtuple("Stat", ["calls", "seconds"])
+
+# Global switch, read on every hooked call
+enabled = False
+
+# name -> [calls, seconds]
+_stats = {}
+
+Clock = time.perf_counter
+
+
+def Enable(on: bool = True):
+	global enabled
+	enabled = on
+
+
+def Disable():
+	Enable(False)
+
+
+def Reset():
+	_stats.clear()
+
+
+def Add(name: str, start: float):
+	"""Counts one call of name which started at Clock() time start."""
+	seconds = Clock() - start
+	stat = _stats.get(name)
+	if stat is None:
+		_stats[name] = [1, seconds]
+	else:
+		stat[0] += 1
+		stat[1] += seconds
+
+
+class Session(object):
+	"""Context manager profiling its block, restoring the previous switch on exit."""
+
+	def __init__(self, reset: bool = True):
+		self.reset = reset
+		self.previous = None
+
+	def __enter__(self):
+		self.previous = enabled
+		if self.reset:
+			Reset()
+		Enable()
+		return self
+
+	def __exit__(self, *exception):
+		Enable(self.previous)
+		return False
+
+
+def Statistics() -> dict:
+	"""Returns name -> Stat(calls, seconds), slowest first."""
+	ordered = sorted(_stats.items(), key=lambda item: item[1][1], reverse=True)
+	return {name: Stat(calls, seconds) for name, (calls, seconds) in ordered}
+
+
+def Summary() -> str:
+	"""Returns the statistics as a text table."""
+	rows = [f"{'Name':30}{'Calls':>10}{'Total (s)':>14}{'Per call (us)':>16}"]
+	for name, stat in Statistics().items():
+		rows.append(f"{name:30}{stat.calls:>10}{stat.seconds:>14.6f}"
+		            f"{stat.seconds / stat.calls * 1e6:>16.3f}")
+	return "\n".join(rows)
+
+
+def Json(indent: int = None) -> str:
+	"""Returns the statistics as a JSON object of name -> {calls, seconds}."""
+	import json
+	return json.dumps(
+	    {name: stat._asdict() for name, stat in Statistics().items()}, indent=indent)
@@ -0,0 +1,99 @@
+import html
+from Settings import Profile
+"""
+Renders calculation reports for many equations, streaming them to a file.
+
+	with open("report.md", "w") as file:
+		Report(equations, file, format="markdown")
+
+Formats are "text" (the layout of DesignEquation.reference()), "markdown" and
+"html". The heading of each equation class is rendered once and reused; each
+equation then only adds its own rows, which are joined and written straight
+away so that no more than one equation's report is held in memory.
+"""
+
+formats = ("text", "markdown", "html")
+
+# (equation class, format) -> rendered heading
+_headers = {}
+
+
+def _header(equation, format: str) -> str:
+	key = (type(equation), format)
+	header = _headers.get(key)
+	if header is None:
+		if format == "markdown":
+			header = "".join([
+			    "### ", type(equation).__name__, ": ", equation.standard, " ",
+			    equation.equation, "\n\n",
+			    "Section: ", equation.section, "  \n",
+			    "Subsection: ", equation.subsection, "  \n",
+			    "Clause: ", equation.clause, "\n\n",
+			    "`", equation.formula, "`\n\n",
+			    "| Parameter | Description | Value |\n",
+			    "| --- | --- | --- |\n",
+			])
+		elif format == "html":
+			header = "".join([
+			    "<section>\n<h3>", html.escape(type(equation).__name__), ": ",
+			    html.escape(equation.standard), " ", html.escape(equation.equation),
+			    "</h3>\n<p>Section: ", html.escape(equation.section),
+			    "<br>\nSubsection: ", html.escape(equation.subsection),
+			    "<br>\nClause: ", html.escape(equation.clause), "</p>\n",
+			    "<p><code>", html.escape(equation.formula), "</code></p>\n",
+			    "<table>\n<tr><th>Parameter</th><th>Description</th><th>Value</th></tr>\n",
+			])
+		else:
+			header = equation._header()
+		_headers[key] = header
+	return header
+
+
+def Render(equation, format: str = "text") -> str:
+	"""Returns the report of one equation in the given format."""
+	if format not in formats:
+		raise ValueError(f"Argument 'format' must be one of {formats}; got '{format}'.")
+	start = Profile.Clock() if Profile.enabled else None
+	if format == "text":
+		output = equation.reference(equation.formula)
+	else:
+		output = _render(equation, format)
+	if start is not None:
+		Profile.Add("Report.Render", start)
+	return output
+
+
+def _render(equation, format: str) -> str:
+	output = [_header(equation, format)]
+	parameters = equation._getEquationParameters()
+	for parameter, value in zip(parameters, equation._values()):
+		if format == "markdown":
+			output += [
+			    "| ", parameter.abbreviation, " | ", parameter.description, " | ", value,
+			    " |\n"
+			]
+		else:
+			output += [
+			    "<tr><td>", html.escape(parameter.abbreviation), "</td><td>",
+			    html.escape(parameter.description), "</td><td>",
+			    html.escape(value), "</td></tr>\n"
+			]
+	output.append("\n" if format == "markdown" else "</table>\n</section>\n")
+	return "".join(output)
+
+
+def Report(equations, file, format: str = "text") -> int:
+	"""Writes the report of every equation to an open file, returning the count."""
+	if format not in formats:
+		raise ValueError(f"Argument 'format' must be one of {formats}; got '{format}'.")
+	count = 0
+	if format == "html":
+		file.write("<!DOCTYPE html>\n<html>\n<body>\n")
+	for equation in equations:
+		file.write(Render(equation, format))
+		if format == "text":
+			file.write("\n")
+		count += 1
+	if format == "html":
+		file.write("</body>\n</html>\n")
+	return count
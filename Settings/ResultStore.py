@@ -0,0 +1,235 @@
+import json
+import os
+import numpy
+"""
+Append-only columnar store of equation results on disk.
+
+	with ResultStore("results", mode="w") as store:
+		for chunk in chunks:
+			store.append(Eq8_1(E_d[chunk], R_d), elements=chunk)
+
+	store = ResultStore("results")
+	rows = store.select("Eq8_1", above=0.9)      # structured array of matches
+	store.inputs[rows["inputs"][:, 0]]           # their E_d input rows
+
+A store is a directory of three files:
+	results.bin  one record per result: equation code, element id, output
+	             number, units code and the input rows it was computed from
+	inputs.bin   one record per input value: abbreviation code, number, units code
+	codes.json   the code tables of equation names, abbreviations and units
+
+Records are NumPy structured arrays written straight to the end of their file,
+so batches are appended without reading what is already stored. Reads map the
+files into memory (numpy.memmap), so results and inputs are zero-copy views,
+and select() scans them chunksize records at a time, keeping only the matches.
+
+An input shared by a whole batch, such as a single R_d, is stored once and
+referenced by every result of the batch. Results with fewer inputs than arity
+refer to input row -1 for the missing ones.
+"""
+
+modes = ("r", "a", "w")
+
+
+class ResultStore(object):
+
+	def __init__(self, path: str, mode: str = "a", arity: int = 2):
+		if mode not in modes:
+			raise ValueError(f"Argument 'mode' must be one of {modes}; got '{mode}'.")
+		self.path = path
+		self.mode = mode
+		self.resultType = numpy.dtype([
+		    ("equation", numpy.uint16),
+		    ("element", numpy.int64),
+		    ("number", numpy.float64),
+		    ("units", numpy.uint16),
+		    ("inputs", numpy.int64, (arity, )),
+		])
+		self.inputType = numpy.dtype([
+		    ("abbreviation", numpy.uint16),
+		    ("number", numpy.float64),
+		    ("units", numpy.uint16),
+		])
+		self.arity = arity
+
+		codes = self._file("codes.json")
+		if mode == "w" or not os.path.exists(codes):
+			if mode == "r":
+				raise FileNotFoundError(f"No result store at '{path}'.")
+			os.makedirs(path, exist_ok=True)
+			self.codes = {"arity": arity, "equations": [], "abbreviations": [], "units": []}
+			for name in ("results.bin", "inputs.bin"):
+				open(self._file(name), "wb").close()
+			self._saveCodes()
+		else:
+			with open(codes, encoding="utf-8") as file:
+				self.codes = json.load(file)
+			if self.codes["arity"] != arity:
+				raise ValueError(
+				    f"Argument 'arity' must match the store's arity {self.codes['arity']}; got {arity}."
+				)
+		self._index = {
+		    table: {value: code for code, value in enumerate(self.codes[table])}
+		    for table in ("equations", "abbreviations", "units")
+		}
+		self._results = None
+		self._inputs = None
+		# Open append handles by file name, kept between batches
+		self._files = {}
+		self._inputCount = os.path.getsize(self._file("inputs.bin")) // self.inputType.itemsize
+
+	def _file(self, name: str) -> str:
+		return os.path.join(self.path, name)
+
+	def _saveCodes(self):
+		with open(self._file("codes.json"), "w", encoding="utf-8") as file:
+			json.dump(self.codes, file)
+
+	def code(self, table: str, value: str) -> int:
+		"""Returns the code of a value in a code table, adding it if new."""
+		code = self._index[table].get(value)
+		if code is None:
+			if self.mode == "r":
+				raise ValueError(f"'{value}' is not in the '{table}' table.")
+			code = self._index[table][value] = len(self.codes[table])
+			self.codes[table].append(value)
+			self._saveCodes()
+		return code
+
+	# Writing
+
+	def _write(self, name: str, records: numpy.ndarray):
+		if self.mode == "r":
+			raise ValueError(f"Result store '{self.path}' is open read-only.")
+		# Cached maps of the file would not see the new records
+		self._results = None
+		self._inputs = None
+		file = self._files.get(name)
+		if file is None:
+			file = self._files[name] = open(self._file(name), "ab")
+		file.write(records.tobytes())
+
+	def flush(self):
+		"""Writes any buffered records to disk."""
+		for file in self._files.values():
+			file.flush()
+
+	def close(self):
+		self.flush()
+		for file in self._files.values():
+			file.close()
+		self._files.clear()
+		self._results = None
+		self._inputs = None
+
+	def _appendInput(self, value, size: int) -> numpy.ndarray:
+		"""Stores an input, returning its row for each of size results."""
+		number = numpy.atleast_1d(numpy.asarray(getattr(value.number, "value", value.number),
+		                                        float))
+		records = numpy.empty(len(number), self.inputType)
+		records["abbreviation"] = self.code("abbreviations", value.abbreviation)
+		records["number"] = number
+		records["units"] = self.code("units", getattr(value, "units", ""))
+		self._write("inputs.bin", records)
+		rows = numpy.arange(self._inputCount, self._inputCount + len(number))
+		self._inputCount += len(number)
+		return numpy.broadcast_to(rows, size) if len(number) == 1 else rows
+
+	def append(self, equation, elements=None) -> int:
+		"""Stores a scalar or batch equation result, returning the number of rows.
+
+		elements gives the element id of each result; by default a batch is
+		numbered by position and a scalar result gets -1.
+		"""
+		schema = equation.schema
+		output = getattr(equation, schema.output)
+		number = numpy.atleast_1d(
+		    numpy.asarray(getattr(output.number, "value", output.number), float))
+		size = len(number)
+		if len(schema.inputs) > self.arity:
+			raise ValueError(
+			    f"{type(equation).__name__} has {len(schema.inputs)} inputs, more than the store's arity {self.arity}."
+			)
+		if elements is None:
+			elements = numpy.arange(size) if getattr(output.number, "ndim", 0) else -1
+
+		records = numpy.empty(size, self.resultType)
+		records["equation"] = self.code("equations", type(equation).__name__)
+		records["element"] = elements
+		records["number"] = number
+		records["units"] = self.code("units", getattr(output, "units", ""))
+		records["inputs"] = -1
+		for column, name in enumerate(schema.inputs):
+			records["inputs"][:, column] = self._appendInput(getattr(equation, name), size)
+		self._write("results.bin", records)
+		return size
+
+	# Reading
+
+	def _map(self, name: str, dtype: numpy.dtype) -> numpy.ndarray:
+		self.flush()
+		count = os.path.getsize(self._file(name)) // dtype.itemsize
+		if count == 0:
+			return numpy.empty(0, dtype)
+		return numpy.memmap(self._file(name), dtype, mode="r", shape=(count, ))
+
+	@property
+	def results(self) -> numpy.ndarray:
+		"""Every result record, mapped from disk without reading it."""
+		if self._results is None:
+			self._results = self._map("results.bin", self.resultType)
+		return self._results
+
+	@property
+	def inputs(self) -> numpy.ndarray:
+		"""Every input record, mapped from disk without reading it."""
+		if self._inputs is None:
+			self._inputs = self._map("inputs.bin", self.inputType)
+		return self._inputs
+
+	def __len__(self):
+		return len(self.results)
+
+	def select(self, equation: str = None, above: float = None, below: float = None,
+	           elements=None, chunksize: int = 10**6) -> numpy.ndarray:
+		"""Returns the result records matching every filter given.
+
+		equation is an equation name, above and below bound the output number
+		(exclusive) and elements is a list of element ids. The store is scanned
+		chunksize records at a time, so only the matches are held in memory.
+		"""
+		if equation is not None:
+			if equation not in self._index["equations"]:
+				return numpy.empty(0, self.resultType)
+			equation = self._index["equations"][equation]
+		if elements is not None:
+			elements = numpy.asarray(elements)
+		results = self.results
+		matches = []
+		for start in range(0, len(results), chunksize):
+			chunk = results[start:start + chunksize]
+			mask = numpy.ones(len(chunk), bool)
+			if equation is not None:
+				mask &= chunk["equation"] == equation
+			if above is not None:
+				mask &= chunk["number"] > above
+			if below is not None:
+				mask &= chunk["number"] < below
+			if elements is not None:
+				mask &= numpy.isin(chunk["element"], elements)
+			matches.append(numpy.array(chunk[mask]))
+		if not matches:
+			return numpy.empty(0, self.resultType)
+		return numpy.concatenate(matches)
+
+	def decode(self, table: str, codes) -> list:
+		"""Returns the values of codes from a code table, e.g. the units of rows."""
+		values = self.codes[table]
+		return [values[code] for code in numpy.atleast_1d(codes)]
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exception):
+		self.close()
+		return False
@@ -0,0 +1,106 @@
+from Settings import Profile
+from Settings.UnitConversion import UnitRatio
+"""
+Static description of an equation class, derived once when the class is created.
+
+Equations declare their result and expected abbreviations as class attributes:
+
+	class Eq6_1(DesignEquation):
+		output = "Q_comb"
+		Q_comb: DesignValue
+		abbreviations = {"psi_0": "psi_{0}", "Q_k": "Q_{k}", "Q_comb": "Q_{comb}"}
+		unitsFrom = "Q_k"
+
+The inputs and their types come from the signature and annotations of
+__init__. An expected abbreviation given as a tuple lists the allowed
+prefixes instead, as for Eq8_10.valid_prefixes. unitsFrom names the input
+whose units the result carries (None for a dimensionless result) and
+conversions maps an input to the input whose units it is converted to.
+Equations take their result units from units() and their ratios from
+ratio(), so the declared behaviour is the behaviour.
+"""
+
+
+class Schema(object):
+	__slots__ = ("inputs", "types", "abbreviations", "output", "outputType",
+	             "unitsFrom", "conversions", "parameters", "name", "_unitsIndex", "_ratio")
+
+	def __init__(self, inputs: tuple, types: dict, abbreviations: dict, output: str,
+	             outputType: type, unitsFrom: str = None, conversions: dict = None,
+	             name: str = ""):
+		self.inputs = tuple(inputs)
+		self.types = dict(types)
+		self.abbreviations = dict(abbreviations)
+		self.output = output
+		self.outputType = outputType
+		self.unitsFrom = unitsFrom
+		self.conversions = dict(conversions or {})
+		declared = [("unitsFrom", unitsFrom)] if unitsFrom is not None else []
+		declared += [("conversions", input) for pair in self.conversions.items() for input in pair]
+		for argument, input in declared:
+			if input not in self.inputs:
+				raise ValueError(
+				    f"Argument '{argument}' of {name} must name inputs of {self.inputs}; got '{input}'."
+				)
+		# Positions of the inputs, as the values are given in __init__ order
+		self._unitsIndex = self.inputs.index(unitsFrom) if unitsFrom is not None else None
+		self._ratio = None
+		if len(self.conversions) == 1:
+			(denominator, numerator), = self.conversions.items()
+			self._ratio = (self.inputs.index(numerator), self.inputs.index(denominator))
+		# Attributes listed in reports, in the order they are stored
+		self.parameters = self.inputs + (output,)
+		# Profiled validations are counted as '<name>.validate'
+		self.name = name
+
+	@classmethod
+	def fromClass(cls, equation: type):
+		# Read from the code object rather than inspect.signature(), which would
+		# import inspect on start-up
+		code = equation.__init__.__code__
+		inputs = code.co_varnames[1:code.co_argcount]
+		annotations = equation.__init__.__annotations__
+		types = {name: annotations[name] for name in inputs if name in annotations}
+		output = equation.output
+		return cls(inputs, types, getattr(equation, "abbreviations", {}), output,
+		           equation.__annotations__.get(output),
+		           getattr(equation, "unitsFrom", None),
+		           getattr(equation, "conversions", None), equation.__name__)
+
+	def validate(self, *values):
+		"""Checks the type and abbreviation of each input, given in __init__ order."""
+		start = Profile.Clock() if Profile.enabled else None
+		for name, value in zip(self.inputs, values):
+			expected = self.types.get(name)
+			if expected is not None and not isinstance(value, expected):
+				raise TypeError(
+				    f"Argument '{name}' must be of type {expected.__name__}, not {type(value).__name__}."
+				)
+			abbreviation = self.abbreviations.get(name)
+			if abbreviation is None:
+				continue
+			if isinstance(abbreviation, tuple):
+				if not value.abbreviation.startswith(abbreviation):
+					raise ValueError(
+					    f"Argument '{name}' must start with one of {abbreviation}; got '{value.abbreviation}'."
+					)
+			elif value.abbreviation != abbreviation:
+				raise ValueError(
+				    f"Argument '{name}' must have abbreviation '{abbreviation}'; got '{value.abbreviation}'."
+				)
+		if start is not None:
+			Profile.Add(self.name + ".validate", start)
+
+	def units(self, *values) -> str:
+		"""Units of the result: those of the unitsFrom input, given in __init__ order."""
+		if self._unitsIndex is None:
+			raise ValueError(f"{self.name} has a dimensionless result.")
+		return values[self._unitsIndex].units
+
+	def ratio(self, *values):
+		"""Divides the input of the conversion target by the converted input, given
+		in __init__ order, e.g. E_d / R_d with R_d in the units of E_d."""
+		if self._ratio is None:
+			raise ValueError(f"{self.name} must declare exactly one conversion for a ratio.")
+		numerator, denominator = self._ratio
+		return UnitRatio(values[numerator], values[denominator])
@@ -0,0 +1,92 @@
+import importlib
+import os
+import sys
+"""
+Precompiled data tables.
+
+The CSV tables shipped with the packages are compiled into generated Python
+modules, which the interpreter caches as bytecode, so that loading a table is a
+single module import instead of parsing CSV. Rebuild them after editing a table:
+
+	python -m Settings.BuildTables
+
+Read() only uses a compiled table while it is up to date: it must exist and
+record the same source files with the same size and CRC-32 checksum as they
+have now. File times are not used, as checkouts and installs set them in any
+order. Otherwise it returns None and the caller falls back to the CSVs.
+"""
+
+
+def _directory(package: str) -> str:
+	return os.path.dirname(sys.modules[package].__file__)
+
+
+def _signature(package: str, sources) -> tuple:
+	"""(source, size, CRC-32) of each source file, or None if one is missing."""
+	import zlib
+	directory = _directory(package)
+	signature = []
+	try:
+		for source in sources:
+			with open(os.path.join(directory, source), "rb") as file:
+				data = file.read()
+			signature.append((source, len(data), zlib.crc32(data)))
+	except OSError:
+		return None
+	return tuple(signature)
+
+
+def _compiled(package: str, module: str):
+	name = f"{package}.{module}"
+	try:
+		return sys.modules.get(name) or importlib.import_module(name)
+	except ImportError:
+		return None
+
+
+def Read(package: str, module: str, sources):
+	"""Returns the compiled table of the sources, or None if it is stale."""
+	signature = _signature(package, sources)
+	if signature is None:
+		return None
+	compiled = _compiled(package, module)
+	if compiled is None:
+		return None
+	if getattr(compiled, "signature", None) != signature:
+		# It may have been rebuilt since it was imported
+		try:
+			compiled = importlib.reload(compiled)
+		except ImportError:
+			return None
+		if getattr(compiled, "signature", None) != signature:
+			return None
+	return dict(compiled.TABLE)
+
+
+def Stale(package: str, module: str, sources) -> bool:
+	"""True if the compiled module is missing or was built from other sources."""
+	return Read(package, module, sources) is None
+
+
+def Write(package: str, module: str, table: dict, sources):
+	"""Writes table as the module package.module, compiled from sources."""
+	sources = tuple(sources)
+	signature = _signature(package, sources)
+	lines = [
+	    f"# Generated by 'python -m Settings.BuildTables' from {', '.join(sources)}.",
+	    "# Do not edit; rebuild after changing the tables.",
+	    "# (source, size, CRC-32) of each source when built",
+	    f"signature = {signature!r}",
+	    "TABLE = {",
+	]
+	lines += [f"\t{key!r}: {value!r}," for key, value in table.items()]
+	lines.append("}\n")
+	path = os.path.join(_directory(package), module + ".py")
+	with open(path, "w", encoding="utf-8") as file:
+		file.write("\n".join(lines))
+	# Bytecode is checked by time and size, which a rebuild may leave unchanged
+	import importlib.util
+	try:
+		os.remove(importlib.util.cache_from_source(path))
+	except OSError:
+		pass
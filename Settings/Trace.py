@@ -0,0 +1,69 @@
+import logging
+from collections import namedtuple
+"""
+Deferred tracing of equation inputs and outputs.
+
+Equations guard every trace with 'if Trace.enabled:', so no record is built and
+no string is formatted while tracing is off. When on, each evaluation produces a
+TraceRecord which is passed to the equation module's logger at DEBUG level and
+to any registered sinks. The record is only formatted if a handler emits it.
+
+Tracing is off by default and never configures the root logger:
+
+	from Settings import Trace
+	Trace.Enable()
+	logging.basicConfig(level=logging.DEBUG)
+"""
+
+# Global switch, read on every equation evaluation
+enabled = False
+
+_sinks = []
+
+
+class TraceRecord(namedtuple("TraceRecord", ["equation", "inputs", "outputs"])):
+	"""Structured trace of one evaluation: equation id, named inputs and outputs."""
+
+	__slots__ = ()
+
+	def __str__(self):
+		inputs = ", ".join(f"{name}={_format(value)}" for name, value in self.inputs.items())
+		outputs = ", ".join(
+		    f"{name}={_format(value)}" for name, value in self.outputs.items())
+		return f"{self.equation} input: {inputs}; result: {outputs}"
+
+
+def _format(value) -> str:
+	# Design values and equations print their short form for the "value" spec;
+	# anything else, such as a ratio that is an array or a Dual, prints as str()
+	if hasattr(value, "abbreviation"):
+		return format(value, "value")
+	return str(value)
+
+
+def Enable(on: bool = True):
+	global enabled
+	enabled = on
+
+
+def Disable():
+	Enable(False)
+
+
+def AddSink(sink):
+	"""Registers a callable receiving every TraceRecord while tracing is enabled."""
+	_sinks.append(sink)
+
+
+def RemoveSink(sink):
+	_sinks.remove(sink)
+
+
+def Record(logger: logging.Logger, equation: str, inputs: dict,
+           outputs: dict) -> TraceRecord:
+	record = TraceRecord(equation, inputs, outputs)
+	# Formatting is deferred to the logging handler
+	logger.debug("%s", record)
+	for sink in _sinks:
+		sink(record)
+	return record
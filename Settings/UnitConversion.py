@@ -1,39 +1,233 @@
 import logging
-import csv
-import importlib.resources
-import copy
-from Settings import DesignValue
+import os
+import re
+from collections import namedtuple
+from Settings import DesignValue, Trace, Profile, Tables
 
-# Configure basic logging
-logging.basicConfig(level=logging.DEBUG)
+# Traces are emitted here when Settings.Trace is enabled
 logger = logging.getLogger(__name__)
 
-def UnitConversion(input: DesignValue, units: str) -> DesignValue: 
-	factor = Factor(input.units) / Factor(units)
-	output = copy.deepcopy(input)
-	output.number = input.number * factor
-	output.units = units
-	logger.debug(
-			f"{input.abbreviation} Conversion from {input.units} to {output.units} "
-			f"factored by {factor}."
-			)
-			
+# Process-wide unit registry: symbol -> (dimension, factor).
+# Built once from every '*Units.csv' table shipped with the package, where the
+# dimension is taken from the file name (e.g. 'forceUnits.csv' -> 'force').
+_registry = None
+
+# Parsed unit expressions, interned by their text, e.g. 'kN/m2'.
+_units = {}
+
+# A parsed unit: factor to the base units and a sorted tuple of
+# (dimension, power) pairs, e.g. 'kN/m2' -> (1000.0, (('force', 1), ('length', -2))).
+Unit = namedtuple("Unit", ["factor", "dimensions"])
+
+_superscripts = str.maketrans("⁻¹²³⁴⁵⁶⁷⁸⁹⁰", "-1234567890")
+_separators = re.compile(r"\s*([*/·.])\s*")
+_exponent = re.compile(r"\^?(-?\d+)")
+
+
+def UnitConversion(input: DesignValue, units: str) -> DesignValue:
+	start = Profile.Clock() if Profile.enabled else None
+	factor = None
+	if input.units == units:
+		# Nothing to convert, but callers may assign to the output, so copy it
+		number = input.number
+		if hasattr(number, "copy"):
+			number = number.copy()
+	else:
+		factor = Scale(input.units, units)
+		number = input.number * factor
+	if hasattr(input, "_converted"):
+		output = input._converted(number, units)
+	else:
+		import copy
+		output = copy.copy(input)
+		output.number = number
+		output.units = units
+	if factor is not None and Trace.enabled:
+		Trace.Record(logger, "UnitConversion", {"input": input, "units": units},
+		             {"output": output, "factor": factor})
+	if start is not None:
+		Profile.Add("UnitConversion", start)
+
 	return output
 
+
+def UnitRatio(numerator: DesignValue, denominator: DesignValue):
+	"""Returns numerator / denominator with the denominator converted to the
+	numerator's units, without building the converted value."""
+	start = Profile.Clock() if Profile.enabled else None
+	if numerator.units == denominator.units:
+		factor = 1.0
+		number = numerator.number / denominator.number
+	else:
+		factor = Scale(denominator.units, numerator.units)
+		number = numerator.number / (denominator.number * factor)
+	if Trace.enabled:
+		Trace.Record(logger, "UnitRatio", {
+		    "numerator": numerator,
+		    "denominator": denominator
+		}, {
+		    "ratio": number,
+		    "factor": factor
+		})
+	if start is not None:
+		Profile.Add("UnitRatio", start)
+
+	return number
+
+
+def _tableNames() -> list:
+	# Sorted so that the lookup order is stable, 'force' before 'length'.
+	try:
+		names = os.listdir(os.path.dirname(__file__))
+	except OSError:  # Not installed as plain files, e.g. in a zip
+		import importlib.resources
+		names = [entry.name for entry in importlib.resources.files(__package__).iterdir()]
+	return sorted(name for name in names if name.endswith("Units.csv"))
+
+
+def _readTable(name: str) -> list:
+	import csv
+	import importlib.resources
+	try:
+		file = importlib.resources.files(__package__).joinpath(name).open(
+		    "r", encoding="utf-8-sig")
+	except AttributeError:  # Python < 3.9
+		file = importlib.resources.open_text(__package__, name, encoding="utf-8-sig")
+	with file:
+		return [row for row in csv.reader(file) if len(row) >= 2]
+
+
+def Load() -> dict:
+	"""Builds the unit index, from the compiled table while it is up to date."""
+	registry = Tables.Read(__package__, "UnitTable", _tableNames())
+	if registry is None:
+		registry = _readTables()
+	return registry
+
+
+def Compile():
+	"""Rebuilds the compiled table, Settings/UnitTable.py, from the CSV tables."""
+	Tables.Write(__package__, "UnitTable", _readTables(), _tableNames())
+
+
+def _readTables() -> dict:
+	"""Builds the unit index from the '*Units.csv' tables.
+
+	The first table to define a symbol wins, matching the historical lookup
+	order of Factor().
+	"""
+	registry = {}
+	for name in _tableNames():
+		dimension = name[:-len("Units.csv")]
+		for row in _readTable(name):
+			key = row[0].strip()
+			if key not in registry:
+				registry[key] = (dimension, float(row[1].strip()))
+	return registry
+
+
+def Registry() -> dict:
+	"""Returns the process-wide unit index, loading it on first use."""
+	global _registry
+	if _registry is None:
+		_registry = Load()
+	return _registry
+
+
+def Invalidate():
+	"""Drops the cached unit index; it is rebuilt on the next lookup."""
+	global _registry
+	_registry = None
+	_units.clear()
+
+
+def Reload() -> dict:
+	"""Rebuilds the unit index immediately from the tables on disk."""
+	Invalidate()
+	return Registry()
+
+
 def Dict(unit_type: str) -> dict:
-    result = {}
-    with importlib.resources.open_text('Settings', unit_type + 'Units.csv') as file:
-        reader = csv.reader(file)
-        for row in reader:
-            if len(row) >= 2:
-                key = row[0].strip()
-                value = float(row[1].strip())
-                result[key] = value
-    return result
+	return {
+	    key: factor
+	    for key, (dimension, factor) in Registry().items()
+	    if dimension == unit_type
+	}
+
+
+def _symbols(term: str, registry: dict) -> list:
+	"""Splits a run of symbols such as 'kNm' into [('kN', 1), ('m', 1)].
+
+	Longer symbols are tried first, backtracking when the remainder cannot be
+	split, so 'mm' is millimetres and 'Nmm' is newton millimetres.
+	"""
+	if term == "":
+		return []
+	for length in range(len(term), 0, -1):
+		symbol = term[:length]
+		if symbol not in registry:
+			continue
+		power = 1
+		rest = term[length:]
+		exponent = _exponent.match(rest)
+		if exponent:
+			power = int(exponent.group(1))
+			rest = rest[exponent.end():]
+		remainder = _symbols(rest, registry)
+		if remainder is not None:
+			return [(symbol, power)] + remainder
+	return None
+
+
+def Parse(unit: str) -> Unit:
+	"""Returns the parsed unit expression, parsing it on first use.
+
+	Expressions are products and quotients of registered symbols with integer
+	powers, e.g. 'kN', 'kNm', 'Nmm', 'kN/m2', 'kN*m^2', 'N/mm²'. Each '/'
+	divides by the term that follows it only.
+	"""
+	parsed = _units.get(unit)
+	if parsed is not None:
+		return parsed
+
+	registry = Registry()
+	factor = 1.0
+	powers = {}
+	sign = 1
+	terms = _separators.split(unit.strip().translate(_superscripts))
+	for term in terms:
+		if term in ("*", "·", "."):
+			continue
+		if term == "/":
+			sign = -1
+			continue
+		symbols = _symbols(term, registry)
+		if symbols is None or (term == "" and len(terms) > 1):
+			raise ValueError(f"Unit '{unit}' not found.")
+		for symbol, power in symbols:
+			dimension, scale = registry[symbol]
+			factor *= scale**(sign * power)
+			powers[dimension] = powers.get(dimension, 0) + sign * power
+		sign = 1
+
+	dimensions = tuple(sorted((key, power) for key, power in powers.items() if power))
+	parsed = _units[unit] = Unit(factor, dimensions)
+	return parsed
+
+
+def Scale(source: str, target: str) -> float:
+	"""Returns the factor converting a number in source units to target units."""
+	source_unit = Parse(source)
+	target_unit = Parse(target)
+	if source_unit.dimensions != target_unit.dimensions:
+		raise ValueError(
+		    f"Cannot convert '{source}' to '{target}'; the dimensions differ.")
+	return source_unit.factor / target_unit.factor
+
+
+def Dimension(unit: str) -> tuple:
+	return Parse(unit).dimensions
+
 
 def Factor(unit: str) -> float:
-    for unit_type in ["force", "length"]:
-        units_dict = Dict(unit_type)
-        if unit in units_dict:
-            return units_dict[unit]
-    raise ValueError(f"Unit '{unit}' not found.")
\ No newline at end of file
+	return Parse(unit).factor
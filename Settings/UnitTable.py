@@ -0,0 +1,26 @@
+# Generated by 'python -m Settings.BuildTables' from forceUnits.csv, lengthUnits.csv.
+# Do not edit; rebuild after changing the tables.
+# (source, size, CRC-32) of each source when built
+signature = (('forceUnits.csv', 114, 1214452163), ('lengthUnits.csv', 106, 81840455))
+TABLE = {
+	'mN': ('force', 0.001),
+	'cN': ('force', 0.01),
+	'N': ('force', 1.0),
+	'daN': ('force', 10.0),
+	'kN': ('force', 1000.0),
+	'MN': ('force', 1000000.0),
+	'gf': ('force', 0.00980665),
+	'kgf': ('force', 9.80665),
+	'ozf': ('force', 0.278013),
+	'lbf': ('force', 4.44822),
+	'klbf': ('force', 4448.22),
+	'in': ('length', 0.025399986),
+	'ft': ('length', 0.30479999),
+	'yd': ('length', 0.914402758),
+	'mi': ('length', 1609.344498),
+	'ml': ('length', 1609.344498),
+	'mm': ('length', 0.001),
+	'cm': ('length', 0.01),
+	'km': ('length', 1000.0),
+	'm': ('length', 1.0),
+}
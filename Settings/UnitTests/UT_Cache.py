@@ -0,0 +1,51 @@
+import unittest
+from Settings import DesignValue, DesignFactor, DesignValueArray, Cache
+from EC0 import Eq6_1, Eq8_10
+
+
+class TestCache(unittest.TestCase):
+
+    def setUp(self):
+        Cache.Clear()
+        Cache.Enable(2)
+
+    def tearDown(self):
+        Cache.Disable()
+        Cache.Clear()
+
+    def test_hits(self):
+        psi_0 = DesignFactor("psi_{0}", 0.7)
+        first = Eq6_1(psi_0, DesignValue("Q_{k}", 532, "kN"))
+        second = Eq6_1(DesignFactor("psi_{0}", 0.7), DesignValue("Q_{k}", 532, "kN"))
+        third = Eq6_1(psi_0, DesignValue("Q_{k}", 532, "MN"))
+        self.assertIs(first, second)
+        self.assertIsNot(first, third)
+        self.assertEqual(Cache.Statistics(), Cache.CacheInfo(1, 2, 2, 2))
+
+    def test_keyword_and_chained_inputs(self):
+        Q_comb = Eq6_1(psi_0=DesignFactor("psi_{0}", 0.7),
+                       Q_k=DesignValue("Q_{k}", 532, "kN"))
+        gamma_Q = DesignFactor("gamma_{Q}", 1.5)
+        self.assertIs(Eq8_10(gamma_Q, Q_comb), Eq8_10(gamma_Q, Q_comb))
+
+    def test_bounded(self):
+        psi_0 = DesignFactor("psi_{0}", 0.7)
+        for number in (1, 2, 3, 1):
+            Eq6_1(psi_0, DesignValue("Q_{k}", number, "kN"))
+        self.assertEqual(Cache.Statistics(), Cache.CacheInfo(0, 4, 2, 2))
+
+    def test_arrays_not_cached(self):
+        psi_0 = DesignFactor("psi_{0}", 0.7)
+        Q_k = DesignValueArray("Q_{k}", [1, 2], "kN")
+        self.assertIsNot(Eq6_1(psi_0, Q_k), Eq6_1(psi_0, Q_k))
+        self.assertEqual(Cache.Statistics().currsize, 0)
+
+    def test_disabled(self):
+        Cache.Disable()
+        psi_0 = DesignFactor("psi_{0}", 0.7)
+        Q_k = DesignValue("Q_{k}", 532, "kN")
+        self.assertIsNot(Eq6_1(psi_0, Q_k), Eq6_1(psi_0, Q_k))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+from math import isclose
+import numpy
+from Settings import DesignValue, DesignFactor, DesignValueArray, CalculationGraph
+from EC0 import Eq6_1, Eq6_2, Eq8_10
+
+
+class TestCalculationGraph(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = CalculationGraph()
+        self.graph.input("psi_0", DesignFactor("psi_{0}", 0.7))
+        self.graph.input("gamma_Q", DesignFactor("gamma_{Q}", 1.5))
+        self.graph.input("wind", DesignValue("Q_{k}", 532, "kN", name="wind"))
+        self.graph.input("live", DesignValue("Q_{k}", 132, "kN", name="live"))
+        for load in ("wind", "live"):
+            self.graph.add(f"Q_comb_{load}", Eq6_1, psi_0="psi_0", Q_k=load)
+            self.graph.add(f"Q_d_{load}", Eq8_10, gamma_Q="gamma_Q",
+                           Q_comb=f"Q_comb_{load}")
+
+    def test_incremental(self):
+        self.assertTrue(isclose(self.graph["Q_d_wind"].number, 1.5 * 0.7 * 532))
+        self.graph["Q_d_live"]
+        self.assertEqual(self.graph.evaluations, 4)
+
+        self.graph.set("wind", DesignValue("Q_{k}", 600, "kN", name="wind"))
+        self.assertTrue(isclose(self.graph["Q_d_wind"].number, 1.5 * 0.7 * 600))
+        self.graph["Q_d_live"]
+        self.assertEqual(self.graph.evaluations, 6)
+
+        self.graph.set("gamma_Q", DesignFactor("gamma_{Q}", 1.35))
+        self.graph["Q_d_wind"], self.graph["Q_d_live"]
+        self.assertEqual(self.graph.evaluations, 8)
+
+    def test_refresh(self):
+        self.graph["Q_d_live"]
+        self.graph.inputs["live"].number = 200.0
+        self.assertEqual(self.graph.refresh(), ["live"])
+        self.assertTrue(isclose(self.graph["Q_d_live"].number, 1.5 * 0.7 * 200))
+        self.assertEqual(self.graph.refresh(), [])
+
+    def test_refresh_arrays(self):
+        graph = CalculationGraph()
+        graph.input("psi_0", DesignFactor("psi_{0}", 0.5))
+        graph.input("Q_k", DesignValueArray("Q_{k}", [10, 20], "kN"))
+        graph.add("Q_comb", Eq6_1, psi_0="psi_0", Q_k="Q_k")
+        graph["Q_comb"]
+        self.assertEqual(graph.refresh(), [])
+
+        graph.inputs["Q_k"].number[0] = 30
+        self.assertEqual(graph.refresh(), ["Q_k"])
+        self.assertEqual(list(graph["Q_comb"].number), [15, 10])
+
+        graph.inputs["Q_k"].number = numpy.array([1.0, 2.0, 3.0])
+        self.assertEqual(graph.refresh(), ["Q_k"])
+        self.assertEqual(list(graph["Q_comb"].number), [0.5, 1, 1.5])
+        self.assertEqual(graph.refresh(), [])
+
+    def test_validation(self):
+        with self.assertRaises(ValueError):
+            self.graph.add("Q_freq", Eq6_2, psi_1="psi_1", Q_k="wind")
+        with self.assertRaises(ValueError):
+            self.graph.set("Q_d_wind", DesignValue("Q_{k}", 1, "kN"))
+
+    def test_from_equations(self):
+        Q_k = DesignValue("Q_{k}", 532, "kN")
+        Q_comb = Eq6_1(DesignFactor("psi_{0}", 0.7), Q_k)
+        Q_d = Eq8_10(DesignFactor("gamma_{Q}", 1.5), Q_comb)
+        graph = CalculationGraph.fromEquations(Q_comb=Q_comb, Q_d=Q_d)
+        self.assertIs(graph["Q_d"], Q_d)
+        self.assertEqual(graph.equations["Q_d"][1]["Q_comb"], "Q_comb")
+
+        graph.set("Q_comb.Q_k", DesignValue("Q_{k}", 100, "kN"))
+        self.assertTrue(isclose(graph["Q_d"].number, 105.0))
+        self.assertEqual(graph.evaluations, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+from types import SimpleNamespace
+from Settings import DesignValue, DesignFactor
+from EC0 import Eq6_1, Eq8_1
+
+
+class DuckValue:
+
+    def __init__(self):
+        self.abbreviation = "E_{d}"
+        self.number = 10.0
+        self.units = "kN"
+        self.name = ""
+        self.description = ""
+
+
+class TestDesignValue(unittest.TestCase):
+
+    def test_slots(self):
+        value = DesignValue("Q_{k}", 532, "kN")
+        self.assertFalse(hasattr(value, "__dict__"))
+        with self.assertRaises(AttributeError):
+            value.unknown = 1
+
+    def test_nominal_types(self):
+        value = DesignValue("Q_{k}", 532, "kN")
+        factor = DesignFactor("psi_{0}", 0.7)
+        self.assertIsInstance(value, DesignValue)
+        self.assertNotIsInstance(value, DesignFactor)
+        self.assertIsInstance(factor, DesignFactor)
+        self.assertNotIsInstance(factor, DesignValue)
+
+    def test_duck_typed(self):
+        self.assertIsInstance(DuckValue(), DesignValue)
+        self.assertNotIsInstance(DuckValue(), DesignFactor)
+        equation = Eq6_1(DesignFactor("psi_{0}", 0.7), DesignValue("Q_{k}", 532, "kN"))
+        self.assertIsInstance(equation, DesignValue)
+        utilisation = Eq8_1(DuckValue(), DesignValue("R_{d}", 20, "kN"))
+        self.assertEqual(utilisation.number, 0.5)
+
+    def test_duck_type_checked_per_instance(self):
+        value = SimpleNamespace(abbreviation="E_{d}", number=1.0, description="", units="kN")
+        factor = SimpleNamespace(abbreviation="psi_{0}", number=0.7, description="")
+        for _ in range(2):
+            self.assertIsInstance(value, DesignValue)
+            self.assertNotIsInstance(value, DesignFactor)
+            self.assertIsInstance(factor, DesignFactor)
+            self.assertNotIsInstance(factor, DesignValue)
+            self.assertNotIsInstance(SimpleNamespace(), DesignValue)
+        with self.assertRaises(TypeError):
+            Eq6_1(DesignFactor("psi_{0}", 0.7), SimpleNamespace())
+
+    def test_dataclass_behaviour(self):
+        value = DesignValue("Q_{k}", 532, "kN", name="wind")
+        self.assertEqual(value, DesignValue("Q_{k}", 532.0, "kN", "wind"))
+        self.assertNotEqual(value, DesignValue("Q_{k}", 532, "MN", "wind"))
+        self.assertEqual(
+            repr(value),
+            "DesignValue(abbreviation='Q_{k}', number=532.0, units='kN', name='wind', "
+            "description='', tolerance=0, upperLimit=0, lowerLimit=0)")
+        self.assertIsInstance(DesignFactor("psi_{0}", 1).number, float)
+        with self.assertRaises(TypeError):
+            DesignValue("Q_{k}", "532", "kN")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+import numpy
+from Settings import DesignValue, DesignFactor, DesignValueArray, DesignFactorArray
+from EC0 import Eq6_1, Eq8_1, Eq8_10
+
+
+class TestDesignValueArray(unittest.TestCase):
+
+    def test_structural_types(self):
+        Q_k = DesignValueArray("Q_{k}", [1, 2, 3], "kN")
+        psi_0 = DesignFactorArray("psi_{0}", [0.7, 0.7, 0.7])
+        self.assertIsInstance(Q_k, DesignValue)
+        self.assertIsInstance(psi_0, DesignFactor)
+        self.assertNotIsInstance(psi_0, DesignValue)
+        self.assertEqual(Q_k.number.dtype, numpy.float64)
+
+    def test_invalid_number(self):
+        with self.assertRaises(TypeError):
+            DesignValueArray("Q_{k}", ["a", "b"], "kN")
+
+    def test_matches_scalar(self):
+        numbers = [120231, 5343, 6745, 32.1]
+        psi_0 = DesignFactor("psi_{0}", 0.75)
+        gamma_Q = DesignFactor("gamma_{Q}", 1.5)
+        batch = Eq8_10(gamma_Q, Eq6_1(psi_0, DesignValueArray("Q_{k}", numbers, "kN")))
+        self.assertIsInstance(batch.Q_d, DesignValueArray)
+        self.assertEqual(batch.units, "kN")
+        for index, number in enumerate(numbers):
+            with self.subTest(number=number):
+                scalar = Eq8_10(gamma_Q, Eq6_1(psi_0, DesignValue("Q_{k}", number, "kN")))
+                self.assertAlmostEqual(batch.number[index], scalar.number)
+                self.assertEqual(batch.Q_d[index].number, scalar.number)
+
+    def test_unit_conversion(self):
+        E_d = DesignValueArray("E_{d}", [3532, 6000], "kN")
+        R_d = DesignValue("R_{d}", 5.241, "MN")
+        utilisation = Eq8_1(E_d, R_d)
+        numpy.testing.assert_allclose(utilisation.number, [3532 / 5241, 6000 / 5241])
+        self.assertEqual(utilisation.abbreviation, "Utilisation [FAIL]")
+
+    def test_validation(self):
+        Q_k = DesignValueArray("Q_{d}", [1.0, 2.0], "kN")
+        with self.assertRaises(ValueError):
+            Eq6_1(DesignFactor("psi_{0}", 0.7), Q_k)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+from Settings import DesignValue, DesignFactor, Dual, Cache
+from EC0 import Eq6_1, Eq8_10, Eq8_1, Eq8_2
+
+
+class TestDual(unittest.TestCase):
+
+    def test_arithmetic(self):
+        x = Dual.Dual.variable(3.0, "x")
+        y = Dual.Dual.variable(2.0, "y")
+        z = (x * y - 1) / y + 2 / x + x**2
+        self.assertAlmostEqual(z.value, 2.5 + 2 / 3 + 9)
+        self.assertAlmostEqual(z.derivative("x"), 1 - 2 / 9 + 6)
+        self.assertAlmostEqual(z.derivative("y"), 1 / 4)
+        self.assertEqual(z.derivative("w"), 0)
+        self.assertTrue(x > 2.5 and x <= 3 and x == 3.0 and y < x)
+        self.assertEqual(f"{z:.3}", "12.2")
+
+    def test_validation(self):
+        Q_k = DesignValue("Q_{k}", Dual.Dual(5), "kN")
+        self.assertIsInstance(Q_k.number, Dual.Dual)
+        with self.assertRaises(TypeError):
+            DesignFactor("psi_{0}", "0.7")
+
+    def test_chain(self):
+        psi_0 = Dual.Tag(DesignFactor("psi_{0}", 0.7))
+        Q_k = Dual.Tag(DesignValue("Q_{k}", 500, "kN"))
+        gamma_Q = DesignFactor("gamma_{Q}", 1.5)
+        R_d = Dual.Tag(DesignValue("R_{d}", 0.5, "MN"))
+        Q_d = Eq8_10(gamma_Q, Eq6_1(psi_0, Q_k))
+        utilisation = Eq8_1(DesignValue("E_{d}", Q_d.number, Q_d.units), R_d).number
+
+        # utilisation = 1.5 * psi_0 * Q_k / (1000 * R_d)
+        self.assertAlmostEqual(utilisation.value, 1.05)
+        self.assertAlmostEqual(utilisation.derivative("psi_{0}"), 1.5)
+        self.assertAlmostEqual(utilisation.derivative("Q_{k}"), 1.5 * 0.7 / 500)
+        self.assertAlmostEqual(utilisation.derivative("R_{d}"), -1.05 / 0.5)
+
+        fail = Eq8_1(DesignValue("E_{d}", Q_d.number, Q_d.units), R_d)
+        self.assertTrue(fail.abbreviation.endswith("[FAIL]"))
+        self.assertIn("1.05", str(fail))
+
+    def test_conversion(self):
+        E_d = Dual.Tag(DesignValue("E_{d}", 0.242, "m"))
+        C_d = Dual.Tag(DesignValue("C_{d,ULS}", 24, "cm"))
+        utilisation = Eq8_2(E_d, C_d).number
+        self.assertAlmostEqual(utilisation.derivative("E_{d}"), 1 / 0.24)
+        self.assertAlmostEqual(utilisation.derivative("C_{d,ULS}"), -0.242 / 0.24**2 / 100)
+        converted = E_d.Units("mm").number
+        self.assertAlmostEqual(converted.derivative("E_{d}"), 1000)
+
+    def test_not_cached(self):
+        Cache.Clear()
+        Cache.Enable()
+        try:
+            Q_k = Dual.Tag(DesignValue("Q_{k}", 500, "kN"))
+            psi_0 = DesignFactor("psi_{0}", 0.7)
+            self.assertIsNot(Eq6_1(psi_0, Q_k), Eq6_1(psi_0, Q_k))
+        finally:
+            Cache.Disable()
+            Cache.Clear()
+
+
+if __name__ == '__main__':
+    unittest.main()
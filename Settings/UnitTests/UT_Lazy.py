@@ -0,0 +1,34 @@
+import subprocess
+import sys
+import unittest
+
+
+def run(statement):
+    return subprocess.run([sys.executable, "-c", statement], capture_output=True,
+                          text=True, check=True).stdout.strip()
+
+
+class TestLazy(unittest.TestCase):
+
+    def test_numpy_not_imported(self):
+        self.assertEqual(run("import sys, EC0\n"
+                             "from Settings import DesignValue, DesignFactor\n"
+                             "EC0.Eq8_1(DesignValue('E_{d}', 1, 'kN'), DesignValue('R_{d}', 2, 'kN'))\n"
+                             "print('numpy' in sys.modules)"), "False")
+
+    def test_names_are_objects(self):
+        self.assertEqual(run("from EC0.Eq6_1 import Eq6_1\n"
+                             "from Settings.Report import Render\n"
+                             "import EC0, Settings\n"
+                             "print(EC0.Eq6_1 is Eq6_1, callable(Settings.Report),\n"
+                             "      EC0.Glossary.__name__, Settings.DesignValueArray.__name__)"),
+                         "True True EC0.Glossary DesignValueArray")
+
+    def test_missing(self):
+        import EC0
+        with self.assertRaises(AttributeError):
+            EC0.Eq9_9
+
+
+if __name__ == '__main__':
+    unittest.main()
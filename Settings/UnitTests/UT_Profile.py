@@ -0,0 +1,42 @@
+import io
+import json
+import unittest
+from Settings import DesignValue, DesignFactor, Profile, Report
+from EC0 import Eq6_1, Eq8_1
+
+
+class TestProfile(unittest.TestCase):
+
+    def tearDown(self):
+        Profile.Disable()
+        Profile.Reset()
+
+    def test_disabled(self):
+        Profile.Reset()
+        Eq6_1(DesignFactor("psi_{0}", 0.7), DesignValue("Q_{k}", 532, "kN"))
+        self.assertEqual(Profile.Statistics(), {})
+
+    def test_session(self):
+        psi_0 = DesignFactor("psi_{0}", 0.7)
+        with Profile.Session():
+            for number in (1, 2, 3):
+                Q_comb = Eq6_1(psi_0, DesignValue("Q_{k}", number, "kN"))
+            Eq8_1(DesignValue("E_{d}", 400, "kN"), DesignValue("R_{d}", 0.5, "MN"))
+            Report([Q_comb], io.StringIO(), format="markdown")
+        self.assertFalse(Profile.enabled)
+
+        statistics = Profile.Statistics()
+        self.assertEqual(statistics["Eq6_1"].calls, 3)
+        self.assertEqual(statistics["Eq6_1.validate"].calls, 3)
+        self.assertEqual(statistics["Eq8_1"].calls, 1)
+        self.assertEqual(statistics["UnitRatio"].calls, 1)
+        self.assertEqual(statistics["Glossary"].calls, 4)
+        self.assertEqual(statistics["Report.Render"].calls, 1)
+        self.assertGreater(statistics["Eq6_1"].seconds, 0)
+
+        self.assertEqual(json.loads(Profile.Json())["Eq8_1"]["calls"], 1)
+        self.assertIn("Eq6_1.validate", Profile.Summary())
+
+
+if __name__ == '__main__':
+    unittest.main()
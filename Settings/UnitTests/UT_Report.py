@@ -0,0 +1,42 @@
+import io
+import unittest
+from Settings import DesignValue, DesignFactor, Report
+from Settings.Report import Render
+from EC0 import Eq6_1, Eq8_1
+
+
+class TestReport(unittest.TestCase):
+
+    def setUp(self):
+        self.equations = [
+            Eq6_1(DesignFactor("psi_{0}", 0.7), DesignValue("Q_{k}", number, "kN"))
+            for number in (532, 132)
+        ] + [Eq8_1(DesignValue("E_{d}", 3532, "kN"), DesignValue("R_{d}", 5.241, "MN"))]
+
+    def test_text(self):
+        file = io.StringIO()
+        self.assertEqual(Report(iter(self.equations), file), 3)
+        self.assertEqual(file.getvalue(),
+                         "".join(str(equation) + "\n" for equation in self.equations))
+
+    def test_markdown(self):
+        output = Render(self.equations[0], "markdown")
+        self.assertTrue(output.startswith("### Eq6_1: BS EN 1990:2023 (6.1)\n"))
+        self.assertIn("| Q_{comb} | Combination value of a variable action. | "
+                      "Q_{comb} = 372.4 [kN] |\n", output)
+
+    def test_html(self):
+        file = io.StringIO()
+        Report(self.equations, file, format="html")
+        output = file.getvalue()
+        self.assertEqual(output.count("<section>"), 3)
+        self.assertIn("<code>E_{d} &lt;= R_{d}</code>", output)
+        self.assertTrue(output.endswith("</html>\n"))
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            Report(self.equations, io.StringIO(), format="pdf")
+
+
+if __name__ == "__main__":
+    unittest.main()
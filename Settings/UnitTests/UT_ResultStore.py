@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+import numpy
+from Settings import DesignValue, DesignValueArray, DesignFactor, ResultStore
+from EC0 import Eq8_1, Eq6_1
+
+
+class TestResultStore(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "store")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_append_and_select(self):
+        R_d = DesignValue("R_{d}", 1, "MN")
+        with ResultStore(self.path, mode="w") as store:
+            store.append(Eq8_1(DesignValueArray("E_{d}", [500, 950, 980], "kN"), R_d),
+                         elements=[10, 11, 12])
+            store.append(Eq6_1(DesignFactor("psi_{0}", 0.7), DesignValue("Q_{k}", 2, "kN")))
+            store.append(Eq8_1(DesignValue("E_{d}", 0.99, "MN"), R_d), elements=13)
+
+        store = ResultStore(self.path, mode="r")
+        self.assertEqual(len(store), 5)
+        self.assertIsInstance(store.results, numpy.memmap)
+
+        rows = store.select("Eq8_1", above=0.9)
+        numpy.testing.assert_allclose(rows["number"], [0.95, 0.98, 0.99])
+        numpy.testing.assert_array_equal(rows["element"], [11, 12, 13])
+        self.assertEqual(store.decode("units", rows["units"][0]), [""])
+
+        # The batch shares one R_d row; the scalar inputs have their own
+        E_d = store.inputs[rows["inputs"][:, 0]]
+        numpy.testing.assert_allclose(E_d["number"], [950, 980, 0.99])
+        self.assertEqual(store.decode("units", E_d["units"]), ["kN", "kN", "MN"])
+        self.assertEqual(rows["inputs"][0, 1], rows["inputs"][1, 1])
+        self.assertEqual(store.decode("abbreviations", store.inputs[rows["inputs"][0, 1]]["abbreviation"]),
+                         ["R_{d}"])
+
+        psi = store.select("Eq6_1")
+        self.assertEqual((psi["element"][0], store.decode("units", psi["units"])[0]), (-1, "kN"))
+        self.assertEqual(len(store.select("Eq8_2")), 0)
+        self.assertEqual(len(store.select(elements=[10, 13], below=0.9, chunksize=2)), 1)
+        with self.assertRaises(ValueError):
+            store.append(Eq8_1(DesignValue("E_{d}", 1, "kN"), R_d))
+
+    def test_reopen_appends(self):
+        psi_0 = DesignFactor("psi_{0}", 0.7)
+        for mode in ("w", "a"):
+            with ResultStore(self.path, mode=mode) as store:
+                store.append(Eq6_1(psi_0, DesignValueArray("Q_{k}", [1, 2], "kN")))
+        store = ResultStore(self.path)
+        numpy.testing.assert_allclose(store.results["number"], [0.7, 1.4, 0.7, 1.4])
+        self.assertEqual(len(store.inputs), 6)
+        numpy.testing.assert_array_equal(store.results["inputs"][2:], [[3, 4], [3, 5]])
+        with self.assertRaises(ValueError):
+            ResultStore(self.path, arity=3)
+
+
+if __name__ == '__main__':
+    unittest.main()
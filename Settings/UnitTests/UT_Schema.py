@@ -0,0 +1,69 @@
+import unittest
+from Settings import DesignValue, DesignFactor, DesignEquation
+from EC0 import Eq6_1, Eq8_1, Eq8_10
+
+
+class TestSchema(unittest.TestCase):
+
+    def test_derived(self):
+        schema = Eq8_10.schema
+        self.assertEqual(schema.inputs, ("gamma_Q", "Q_comb"))
+        self.assertEqual(schema.types, {"gamma_Q": DesignFactor, "Q_comb": DesignValue})
+        self.assertEqual(schema.abbreviations["Q_comb"], Eq8_10.valid_prefixes)
+        self.assertEqual(schema.parameters, ("gamma_Q", "Q_comb", "Q_d"))
+        self.assertIs(Eq8_1.schema.outputType, DesignFactor)
+        self.assertIsNone(Eq8_1.schema.unitsFrom)
+        self.assertEqual(Eq8_1.schema.conversions, {"R_d": "E_d"})
+        self.assertEqual(Eq6_1.schema.unitsFrom, "Q_k")
+
+    def test_units_behaviour(self):
+        psi_0 = DesignFactor("psi_{0}", 0.5)
+        Q_k = DesignValue("Q_{k}", 10, "kN")
+        self.assertEqual(Eq6_1.schema.units(psi_0, Q_k), "kN")
+        E_d = DesignValue("E_{d}", 400, "kN")
+        R_d = DesignValue("R_{d}", 0.5, "MN")
+        self.assertAlmostEqual(Eq8_1.schema.ratio(E_d, R_d), 0.8)
+        with self.assertRaises(ValueError):
+            Eq8_1.schema.units(E_d, R_d)
+        with self.assertRaises(ValueError):
+            Eq6_1.schema.ratio(psi_0, Q_k)
+
+    def test_undeclared_input(self):
+        with self.assertRaisesRegex(ValueError, "'unitsFrom' of Bad must name inputs"):
+
+            class Bad(DesignEquation):
+                output = "Q_d"
+                Q_d: DesignValue
+                unitsFrom = "Q_x"
+
+                def __init__(self, Q_k: DesignValue):
+                    pass
+
+    def test_validation(self):
+        psi_0 = DesignFactor("psi_{0}", 0.7)
+        with self.assertRaisesRegex(TypeError, "'Q_k' must be of type DesignValue"):
+            Eq6_1(psi_0, psi_0)
+        with self.assertRaisesRegex(ValueError, "'psi_0' must have abbreviation 'psi_\\{0\\}'"):
+            Eq6_1(DesignFactor("psi_{1}", 0.7), DesignValue("Q_{k}", 1, "kN"))
+        with self.assertRaisesRegex(ValueError, "'Q_comb' must start with one of"):
+            Eq8_10(DesignFactor("gamma_{Q}", 1.5), DesignValue("E_{d}", 1, "kN"))
+
+    def test_forwarding(self):
+        Q_comb = Eq6_1(DesignFactor("psi_{0}", 0.5), DesignValue("Q_{k}", 10, "kN"))
+        self.assertEqual((Q_comb.number, Q_comb.units), (5.0, "kN"))
+        self.assertEqual(f"{Q_comb:value}", "Q_{comb} = 5.0 [kN]")
+        with self.assertRaises(AttributeError):
+            Q_comb.unknown
+
+    def test_result_properties(self):
+        self.assertIsInstance(Eq6_1.__dict__["number"], property)
+        self.assertNotIn("units", Eq8_1.__dict__)
+        utilisation = Eq8_1(DesignValue("E_{d}", 5, "kN"), DesignValue("R_{d}", 10, "kN"))
+        self.assertEqual((utilisation.number, utilisation.abbreviation),
+                         (0.5, "Utilisation"))
+        self.assertIsInstance(utilisation, DesignFactor)
+        self.assertNotIsInstance(utilisation, DesignValue)
+
+
+if __name__ == "__main__":
+    unittest.main()
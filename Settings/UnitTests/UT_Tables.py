@@ -0,0 +1,53 @@
+import importlib
+import os
+import sys
+import tempfile
+import unittest
+from Settings import Tables, UnitConversion
+from EC0 import Glossary
+
+
+class TestTables(unittest.TestCase):
+
+    def test_compiled_matches_csv(self):
+        self.assertEqual(Tables.Read("Settings", "UnitTable", UnitConversion._tableNames()),
+                         UnitConversion._readTables())
+        self.assertEqual(Tables.Read("EC0", "DefinitionTable", ["definitions.csv"]),
+                         Glossary._readTable())
+
+    def test_stale(self):
+        # A package of its own, so that its table can be edited
+        with tempfile.TemporaryDirectory() as directory:
+            os.mkdir(os.path.join(directory, "tablepackage"))
+            open(os.path.join(directory, "tablepackage", "__init__.py"), "w").close()
+            source = os.path.join(directory, "tablepackage", "table.csv")
+            with open(source, "w") as file:
+                file.write("a,1\n")
+            sys.path.insert(0, directory)
+            try:
+                importlib.import_module("tablepackage")
+                Tables.Write("tablepackage", "Table", {"a": 1}, ["table.csv"])
+                self.assertEqual(Tables.Read("tablepackage", "Table", ["table.csv"]), {"a": 1})
+
+                # Edited to the same size, with the compiled table made newer
+                with open(source, "w") as file:
+                    file.write("a,2\n")
+                module = os.path.join(directory, "tablepackage", "Table.py")
+                os.utime(module, (os.path.getmtime(source) + 10, ) * 2)
+                self.assertTrue(Tables.Stale("tablepackage", "Table", ["table.csv"]))
+                self.assertIsNone(Tables.Read("tablepackage", "Table", ["table.csv"]))
+
+                Tables.Write("tablepackage", "Table", {"a": 2}, ["table.csv"])
+                self.assertEqual(Tables.Read("tablepackage", "Table", ["table.csv"]), {"a": 2})
+            finally:
+                sys.path.remove(directory)
+                for name in ("tablepackage", "tablepackage.Table"):
+                    sys.modules.pop(name, None)
+
+    def test_sources_differ(self):
+        self.assertIsNone(Tables.Read("Settings", "UnitTable", ["forceUnits.csv"]))
+        self.assertTrue(Tables.Stale("Settings", "Missing", ["forceUnits.csv"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import logging
+import subprocess
+import sys
+import unittest
+from Settings import DesignValue, DesignFactor, DesignValueArray, Dual, Trace
+from EC0 import Eq6_1, Eq8_1
+
+
+class TestTrace(unittest.TestCase):
+
+    def setUp(self):
+        self.records = []
+        Trace.AddSink(self.records.append)
+
+    def tearDown(self):
+        Trace.RemoveSink(self.records.append)
+        Trace.Disable()
+
+    def test_disabled(self):
+        Eq6_1(DesignFactor("psi_{0}", 0.7), DesignValue("Q_{k}", 532, "kN"))
+        self.assertEqual(self.records, [])
+
+    def test_record(self):
+        Trace.Enable()
+        psi_0 = DesignFactor("psi_{0}", 0.7)
+        Q_k = DesignValue("Q_{k}", 532, "kN")
+        Q_comb = Eq6_1(psi_0, Q_k)
+        record, = self.records
+        self.assertEqual(record.equation, "Eq6_1")
+        self.assertIs(record.inputs["Q_k"], Q_k)
+        self.assertIs(record.outputs["Q_comb"], Q_comb.Q_comb)
+        self.assertEqual(
+            str(record),
+            "Eq6_1 input: psi_0=psi_{0} = 0.7 [], Q_k=Q_{k} = 532.0 [kN]; "
+            "result: Q_comb=Q_{comb} = 372.4 [kN]")
+
+    def test_unit_conversion(self):
+        Trace.Enable()
+        Eq8_1(DesignValue("E_{d}", 3532, "kN"), DesignValue("R_{d}", 5.241, "MN"))
+        self.assertEqual([record.equation for record in self.records],
+                         ["UnitRatio", "Eq8_1"])
+        self.assertEqual(self.records[0].outputs["factor"], 1000.0)
+
+    def test_array_and_dual_ratios(self):
+        Trace.Enable()
+        E_d = DesignValueArray("E_{d}", [100, 200], "kN")
+        with self.assertLogs("Settings.UnitConversion", logging.DEBUG) as logs:
+            Eq8_1(E_d, DesignValue("R_{d}", 0.5, "MN"))
+            Eq8_1(Dual.Tag(DesignValue("E_{d}", 400, "kN")), DesignValue("R_{d}", 0.5, "MN"))
+        self.assertIn("ratio=[0.2 0.4]", logs.output[0])
+        self.assertIn("ratio=0.8", logs.output[1])
+
+    def test_root_logger_untouched(self):
+        # In a fresh interpreter, so that importing Trace is covered too
+        statement = ("import logging\n"
+                     "root = logging.getLogger()\n"
+                     "before = (root.level, list(root.handlers))\n"
+                     "from Settings import DesignValue, Trace\n"
+                     "from EC0 import Eq8_1\n"
+                     "Trace.Enable()\n"
+                     "Eq8_1(DesignValue('E_{d}', 1, 'kN'), DesignValue('R_{d}', 2, 'MN'))\n"
+                     "print(before == (root.level, list(root.handlers)))")
+        output = subprocess.run([sys.executable, "-c", statement], capture_output=True,
+                                text=True, check=True).stdout.strip()
+        self.assertEqual(output, "True")
+
+    def test_enable_keeps_logging_configuration(self):
+        root = logging.getLogger()
+        before = (root.level, list(root.handlers))
+        Trace.Enable()
+        Eq8_1(DesignValue("E_{d}", 1, "kN"), DesignValue("R_{d}", 2, "MN"))
+        self.assertEqual((root.level, list(root.handlers)), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+from math import isclose
+from Settings import DesignValue
+from Settings import UnitConversion
+
+
+class TestUnitConversion(unittest.TestCase):
+
+    def setUp(self):
+        UnitConversion.Invalidate()
+
+    def test_registry_is_loaded_once(self):
+        registry = UnitConversion.Registry()
+        self.assertIs(UnitConversion.Registry(), registry)
+        self.assertEqual(registry["kN"], ("force", 1000.0))
+        self.assertEqual(registry["mm"], ("length", 0.001))
+
+    def test_first_row_symbols(self):
+        # The tables start with a byte order mark which must not leak into keys.
+        self.assertEqual(UnitConversion.Factor("mN"), 0.001)
+        self.assertEqual(UnitConversion.Factor("in"), 0.025399986)
+
+    def test_reload(self):
+        registry = UnitConversion.Registry()
+        self.assertIsNot(UnitConversion.Reload(), registry)
+        self.assertEqual(UnitConversion.Reload(), registry)
+
+    def test_dict(self):
+        self.assertEqual(UnitConversion.Dict("length")["cm"], 0.01)
+        self.assertNotIn("kN", UnitConversion.Dict("length"))
+
+    def test_unknown_unit(self):
+        with self.assertRaises(ValueError):
+            UnitConversion.Factor("furlong")
+
+    def test_examples(self):
+        test_cases = [(5.241, "MN", "kN", 5241.0),
+                      (24, "cm", "m", 0.24),
+                      (1, "klbf", "N", 4448.22)]
+        for number, units, target, expected in test_cases:
+            with self.subTest(number=number, units=units, target=target):
+                value = DesignValue("R_{d}", number, units).Units(target)
+                self.assertTrue(isclose(value.number, expected, rel_tol=1e-9))
+                self.assertEqual(value.units, target)
+
+    def test_compound_units(self):
+        test_cases = [(9876, "kN/m2", "N/mm2", 9.876),
+                      (567, "kNm", "Nmm", 567e6),
+                      (32.1, "Nmm", "kN.m", 32.1e-6),
+                      (1, "m^2", "cm²", 1e4),
+                      (2, "kN/m/m", "kN/m2", 2)]
+        for number, units, target, expected in test_cases:
+            with self.subTest(units=units, target=target):
+                value = DesignValue("Q_{k}", number, units).Units(target)
+                self.assertTrue(isclose(value.number, expected, rel_tol=1e-9))
+        self.assertIs(UnitConversion.Parse("kN/m2"), UnitConversion.Parse("kN/m2"))
+        self.assertEqual(UnitConversion.Dimension("Nmm"),
+                         (("force", 1), ("length", 1)))
+
+    def test_incompatible_units(self):
+        for units, target in [("kN", "m"), ("kNm", "kN"), ("kN/m2", "kN/m")]:
+            with self.subTest(units=units, target=target):
+                with self.assertRaises(ValueError):
+                    DesignValue("Q_{k}", 1, units).Units(target)
+        for units in ["kNx", "kN/", "kN^"]:
+            with self.subTest(units=units):
+                with self.assertRaises(ValueError):
+                    UnitConversion.Parse(units)
+
+    def test_same_units(self):
+        value = DesignValue("R_{d}", 5.241, "MN")
+        same = value.Units("MN")
+        self.assertIsNot(same, value)
+        self.assertEqual(same, value)
+        same.number = 99
+        self.assertEqual(value.number, 5.241)
+
+    def test_conversion_copies_fields(self):
+        value = DesignValue("R_{d}", 5.241, "MN", name="beam", tolerance=0.1)
+        converted = value.Units("kN")
+        self.assertIsNot(converted, value)
+        self.assertEqual(value.number, 5.241)
+        self.assertEqual((converted.name, converted.tolerance), ("beam", 0.1))
+
+    def test_ratio(self):
+        E_d = DesignValue("E_{d}", 3532, "kN")
+        R_d = DesignValue("R_{d}", 5.241, "MN")
+        self.assertTrue(isclose(UnitConversion.UnitRatio(E_d, R_d), 3532 / 5241))
+        self.assertEqual(UnitConversion.UnitRatio(E_d, E_d), 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,24 @@
+from . import Trace
+from . import Cache
+from . import Profile
+from . import Tables
+from . import Dual
 from .DesignFactor import DesignFactor
 from .DesignValue import DesignValue
 from .DesignEquation import DesignEquation
+from .Lazy import Install
 
-__all__ = ["DesignFactor", "DesignValue", "DesignEquation"]
+__all__ = [
+    "DesignFactor", "DesignValue", "DesignFactorArray", "DesignValueArray",
+    "DesignEquation", "CalculationGraph", "Report", "ResultStore",
+    "Trace", "Cache", "Profile", "Dual"
+]
+
+# Loaded on first use; the array classes and ResultStore import numpy
+Install(__name__, {
+    "DesignFactorArray": ("DesignFactorArray", "DesignFactorArray"),
+    "DesignValueArray": ("DesignValueArray", "DesignValueArray"),
+    "CalculationGraph": ("CalculationGraph", "CalculationGraph"),
+    "Report": ("Report", "Report"),
+    "ResultStore": ("ResultStore", "ResultStore"),
+})
@@ -0,0 +1,51 @@
+"""
+Micro-benchmark of reading an equation's result, e.g. eq.number, through the
+properties derived from the equation schema against the previous __getattr__
+forwarding.
+
+Run from the repository root:
+
+	python -m benchmarks.bench_attribute_access
+"""
+import timeit
+from Settings import DesignValue, DesignFactor
+from EC0 import Eq6_1, Eq8_1
+
+
+class LegacyForwarding(object):
+	"""Reproduces the per-class __getattr__ the equations used before."""
+
+	def __init__(self, equation):
+		self.Q_comb = equation.Q_comb
+
+	def __getattr__(self, name):
+		if hasattr(self.Q_comb, name):
+			return getattr(self.Q_comb, name)
+		raise AttributeError(
+			f"{self.__class__.__name__} has no attribute '{name}'.")
+
+
+def Time(statement, number: int = 1000000) -> float:
+	"""Best of three, in nanoseconds per access."""
+	return min(timeit.repeat(statement, number=number, repeat=3)) / number * 1e9
+
+
+def Run() -> list:
+	equation = Eq6_1(DesignFactor("psi_{0}", 0.7), DesignValue("Q_{k}", 532, "kN"))
+	legacy = LegacyForwarding(equation)
+	utilisations = [
+	    Eq8_1(DesignValue("E_{d}", index, "kN"), DesignValue("R_{d}", 1, "MN"))
+	    for index in range(10000)
+	]
+	return [
+	    ("equation.Q_comb.number", Time(lambda: equation.Q_comb.number)),
+	    ("equation.number (property)", Time(lambda: equation.number)),
+	    ("equation.number (__getattr__)", Time(lambda: legacy.number)),
+	    ("max utilisation of 10^4 checks [us]",
+	     Time(lambda: max(check.number for check in utilisations), number=100) / 1000),
+	]
+
+
+if __name__ == "__main__":
+	for label, nanoseconds in Run():
+		print(f"{label:45}{nanoseconds:10.1f}")
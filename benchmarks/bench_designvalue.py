@@ -0,0 +1,123 @@
+"""
+Micro-benchmark of the slotted DesignValue/DesignFactor against the previous
+dataclass implementation with purely structural isinstance checks.
+
+Run from the repository root:
+
+	python -m benchmarks.bench_designvalue
+"""
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from Settings import DesignValue, DesignFactor
+from EC0 import Eq6_1
+
+
+class LegacyDesignValueMeta(type):
+
+	def __instancecheck__(cls, instance):
+		return hasattr(instance, "abbreviation") and hasattr(
+		    instance, "number") and hasattr(instance, "description") and hasattr(
+		        instance, "units")
+
+
+@dataclass
+class LegacyDesignValue(metaclass=LegacyDesignValueMeta):
+	abbreviation: str
+	number: float
+	units: str
+	name: str = ""
+	description: str = ""
+	tolerance: float = 0
+	upperLimit: float = 0
+	lowerLimit: float = 0
+
+	def __post_init__(self):
+		if not isinstance(self.abbreviation, str):
+			raise TypeError
+		if not isinstance(self.number, (float, int)):
+			raise TypeError
+		if not isinstance(self.units, str):
+			raise TypeError
+		self.number = float(self.number)
+
+
+class LegacyDesignFactorMeta(type):
+
+	def __instancecheck__(cls, instance):
+		return hasattr(
+		    instance, "abbreviation") and hasattr(instance, "number") and hasattr(
+		        instance, "description") and not hasattr(instance, "units")
+
+
+@dataclass
+class LegacyDesignFactor(metaclass=LegacyDesignFactorMeta):
+	abbreviation: str
+	number: float
+	name: str = ""
+	description: str = ""
+
+	def __post_init__(self):
+		if not isinstance(self.abbreviation, str):
+			raise TypeError
+		if not isinstance(self.number, (float, int)):
+			raise TypeError
+		self.number = float(self.number)
+
+
+def Memory(factory, count: int = 10000) -> float:
+	"""Average bytes allocated per object."""
+	tracemalloc.start()
+	objects = [factory(index) for index in range(count)]
+	size, peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	del objects
+	return size / count
+
+
+def Time(statement, number: int = 200000) -> float:
+	"""Best of three, in nanoseconds per call."""
+	return min(timeit.repeat(statement, number=number, repeat=3)) / number * 1e9
+
+
+def Run() -> list:
+	value = DesignValue("Q_{k}", 532, "kN")
+	legacyValue = LegacyDesignValue("Q_{k}", 532, "kN")
+	factor = DesignFactor("psi_{0}", 0.7)
+	legacyFactor = LegacyDesignFactor("psi_{0}", 0.7)
+	equation = Eq6_1(factor, value)
+	rows = [
+	    ("construct DesignValue",
+	     Time(lambda: LegacyDesignValue("Q_{k}", 532, "kN")),
+	     Time(lambda: DesignValue("Q_{k}", 532, "kN"))),
+	    ("construct DesignFactor",
+	     Time(lambda: LegacyDesignFactor("psi_{0}", 0.7)),
+	     Time(lambda: DesignFactor("psi_{0}", 0.7))),
+	    ("isinstance(value, (DesignFactor, DesignValue))",
+	     Time(lambda: isinstance(legacyValue, (LegacyDesignFactor, LegacyDesignValue))),
+	     Time(lambda: isinstance(value, (DesignFactor, DesignValue)))),
+	    ("isinstance(factor, DesignValue)",
+	     Time(lambda: isinstance(legacyFactor, LegacyDesignValue)),
+	     Time(lambda: isinstance(factor, DesignValue))),
+	    ("isinstance(equation, DesignValue) (duck-typed)",
+	     Time(lambda: isinstance(equation, LegacyDesignValue)),
+	     Time(lambda: isinstance(equation, DesignValue))),
+	]
+	memory = [
+	    ("bytes per DesignValue",
+	     Memory(lambda index: LegacyDesignValue("Q_{k}", index, "kN")),
+	     Memory(lambda index: DesignValue("Q_{k}", index, "kN"))),
+	    ("bytes per DesignFactor",
+	     Memory(lambda index: LegacyDesignFactor("psi_{0}", index)),
+	     Memory(lambda index: DesignFactor("psi_{0}", index))),
+	]
+	return rows, memory
+
+
+if __name__ == "__main__":
+	rows, memory = Run()
+	print(f"{'':50}{'dataclass':>12}{'slots':>12}")
+	for label, legacy, current in rows:
+		print(f"{label + ' [ns]':50}{legacy:12.0f}{current:12.0f}")
+	for label, legacy, current in memory:
+		print(f"{label:50}{legacy:12.0f}{current:12.0f}")
@@ -0,0 +1,65 @@
+"""
+Start-up benchmark: the cost of a cold 'import EC0' plus one equation, as paid
+by a fresh interpreter, measured with 'python -X importtime'.
+
+Run from the repository root:
+
+	python -m benchmarks.bench_import                 # exit 1 above 30 ms
+	python -m benchmarks.bench_import --budget 20
+
+The import time is the best of several fresh interpreters, summed over the
+top-level imports only. The run also fails if the statement imports numpy,
+which only the array classes, Combinations, Batch and Pipeline need.
+"""
+import argparse
+import subprocess
+import sys
+
+STATEMENT = ("import EC0\n"
+             "from Settings import DesignValue, DesignFactor\n"
+             "EC0.Eq6_1(DesignFactor('psi_{0}', 0.7), DesignValue('Q_{k}', 532, 'kN'))\n")
+
+
+def Measure(statement: str = STATEMENT) -> tuple:
+	"""Returns (milliseconds, modules) of one fresh interpreter running statement."""
+	process = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+	                         capture_output=True, text=True, check=True)
+	microseconds = 0
+	modules = []
+	for line in process.stderr.splitlines():
+		if not line.startswith("import time:") or "self [us]" in line:
+			continue
+		_, cumulative, name = line.split("|")
+		modules.append(name.strip())
+		# Nested imports are indented below their importer
+		if not name[1:].startswith(" "):
+			microseconds += int(cumulative)
+	return microseconds / 1000, modules
+
+
+def Run(repeat: int = 5) -> tuple:
+	"""Best of repeat fresh interpreters: (milliseconds, modules)."""
+	return min(Measure() for _ in range(repeat))
+
+
+def main(argv=None) -> int:
+	parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+	parser.add_argument("--budget", type=float, default=30.0,
+	                    help="maximum import time in ms (default: 30)")
+	parser.add_argument("--repeat", type=int, default=5)
+	arguments = parser.parse_args(argv)
+
+	milliseconds, modules = Run(arguments.repeat)
+	print(f"import time: {milliseconds:.1f} ms, {len(modules)} modules")
+	status = 0
+	if "numpy" in modules:
+		print("FAIL: numpy is imported at start-up")
+		status = 1
+	if milliseconds > arguments.budget:
+		print(f"FAIL: over the budget of {arguments.budget:.1f} ms")
+		status = 1
+	return status
+
+
+if __name__ == "__main__":
+	sys.exit(main())
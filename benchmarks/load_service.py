@@ -0,0 +1,99 @@
+"""
+Load test of the EC0 JSON-lines service: many concurrent single-call requests
+spread over a number of connections, reporting throughput and latency.
+
+Run from the repository root, against an in-process service:
+
+	python -m benchmarks.load_service --requests 20000 --connections 50
+
+or against a running instance (python -m EC0.Service --port 8765):
+
+	python -m benchmarks.load_service --port 8765
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from EC0.Service import Service
+
+
+def Request(index: int) -> bytes:
+	E_d = random.uniform(10, 900)
+	return json.dumps({
+	    "id": index,
+	    "equation": "Eq8_1",
+	    "calls": [{
+	        "E_d": {"abbreviation": "E_{d}", "number": E_d, "units": "kN"},
+	        "R_d": {"abbreviation": "R_{d}", "number": 1.0, "units": "MN"}
+	    }]
+	}).encode() + b"\n"
+
+
+async def _client(host: str, port: int, indices: range, latencies: list):
+	reader, writer = await asyncio.open_connection(host, port, limit=2**24)
+	sent = {}
+	# Every request of the connection is in flight at once
+	for index in indices:
+		sent[index] = time.perf_counter()
+		writer.write(Request(index))
+	await writer.drain()
+	for _ in indices:
+		response = json.loads(await reader.readline())
+		latencies.append(time.perf_counter() - sent[response["id"]])
+		if "error" in response or "error" in response["results"][0]:
+			raise RuntimeError(f"Request {response['id']} failed: {response}")
+	writer.close()
+
+
+async def Run(requests: int, connections: int, host: str = "127.0.0.1", port: int = None,
+              delay: float = 0.002) -> dict:
+	server = service = None
+	if port is None:
+		service = Service(delay)
+		server = await service.start(host, 0)
+		port = server.sockets[0].getsockname()[1]
+
+	latencies = []
+	start = time.perf_counter()
+	await asyncio.gather(*[
+	    _client(host, port, range(client, requests, connections), latencies)
+	    for client in range(connections)
+	])
+	elapsed = time.perf_counter() - start
+
+	if server is not None:
+		server.close()
+		await server.wait_closed()
+	latencies.sort()
+	result = {
+	    "requests": requests,
+	    "seconds": elapsed,
+	    "throughput": requests / elapsed,
+	    "latency_p50_ms": statistics.median(latencies) * 1000,
+	    "latency_p99_ms": latencies[int(0.99 * (len(latencies) - 1))] * 1000,
+	}
+	if service is not None:
+		result["batches"] = service.batches
+	return result
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+	parser.add_argument("--requests", type=int, default=20000)
+	parser.add_argument("--connections", type=int, default=50)
+	parser.add_argument("--host", default="127.0.0.1")
+	parser.add_argument("--port", type=int, help="port of a running service")
+	parser.add_argument("--delay", type=float, default=0.002,
+	                    help="batching delay of the in-process service")
+	arguments = parser.parse_args(argv)
+	result = asyncio.run(
+	    Run(arguments.requests, arguments.connections, arguments.host, arguments.port,
+	        arguments.delay))
+	for key, value in result.items():
+		print(f"{key:20}{value:.6g}")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,221 @@
+"""
+Benchmark suite for the EC0 and Settings hot paths.
+
+Run from the repository root:
+
+	python -m benchmarks.run                              # all cases, all scales
+	python -m benchmarks.run --scales 1 1000 --output now.json
+	python -m benchmarks.run --baseline base.json --threshold 0.2
+
+Every case is timed at each scale (1, 10^3 and 10^6 items by default) and
+reported as the best time over a few repeats and the resulting throughput in
+items per second. Equations at 10^6 run through DesignValueArray batches; the
+other scales build one equation object per item. With --baseline the run is
+compared with an earlier JSON output and exits with status 1 if any case
+loses more than --threshold of its baseline throughput.
+"""
+import argparse
+import io
+import json
+import logging
+import platform
+import sys
+import time
+import numpy
+from Settings import DesignValue, DesignFactor, DesignValueArray, DesignFactorArray
+from Settings import UnitConversion
+from Settings.Report import Report
+import EC0
+from EC0 import Glossary
+
+# Scales at or above this evaluate equations over arrays
+BATCH = 100000
+
+cases = {}
+
+
+def case(function):
+	"""Registers a case: function(n) returns a callable processing n items."""
+	cases[function.__name__] = function
+	return function
+
+
+def _factor(abbreviation, n):
+	if n >= BATCH:
+		return DesignFactorArray(abbreviation, numpy.full(n, 0.7))
+	return DesignFactor(abbreviation, 0.7)
+
+
+def _values(abbreviation, n, units="kN"):
+	if n >= BATCH:
+		return [DesignValueArray(abbreviation, numpy.arange(1, n + 1), units)]
+	return [DesignValue(abbreviation, index + 1, units) for index in range(n)]
+
+
+def _equation(equation, factor, abbreviation):
+	def setup(n):
+		psi = _factor(factor, n)
+		values = _values(abbreviation, n)
+		return lambda: [equation(psi, value) for value in values]
+	return setup
+
+
+def _check(equation, resistance):
+	def setup(n):
+		capacity = DesignValue(resistance, 5.0, "MN")
+		values = _values("E_{d}", n)
+		return lambda: [equation(value, capacity) for value in values]
+	return setup
+
+
+@case
+def DesignValue_construct(n):
+	return lambda: [DesignValue("Q_{k}", index, "kN") for index in range(n)]
+
+
+@case
+def DesignFactor_construct(n):
+	return lambda: [DesignFactor("psi_{0}", index) for index in range(n)]
+
+
+for _name, _setup in [
+    ("Eq6_1", _equation(EC0.Eq6_1, "psi_{0}", "Q_{k}")),
+    ("Eq6_2", _equation(EC0.Eq6_2, "psi_{1}", "Q_{k}")),
+    ("Eq6_3", _equation(EC0.Eq6_3, "psi_{2}", "Q_{k}")),
+    ("Eq8_10", _equation(EC0.Eq8_10, "gamma_{Q}", "Q_{comb}")),
+    ("Eq8_1", _check(EC0.Eq8_1, "R_{d}")),
+    ("Eq8_2", _check(EC0.Eq8_2, "C_{d,ULS}")),
+]:
+	_setup.__name__ = _name
+	case(_setup)
+
+
+@case
+def UnitConversion_convert(n):
+	values = _values("R_{d}", n, "MN")
+	return lambda: [value.Units("kN") for value in values]
+
+
+@case
+def UnitConversion_compound(n):
+	values = _values("Q_{k}", n, "kN/m2")
+	return lambda: [value.Units("N/mm2") for value in values]
+
+
+@case
+def Glossary_lookup(n):
+	abbreviations = ["psi_{0}", "Q_{k}", "Q_{comb}", "E_{d}", "Utilisation"]
+
+	def run():
+		Glossary.Lookup.cache_clear()
+		for index in range(n):
+			Glossary.Lookup(abbreviations[index % len(abbreviations)])
+	return run
+
+
+@case
+def Glossary_load(n):
+	def run():
+		for index in range(n):
+			Glossary.Invalidate()
+			Glossary.Definitions()
+	return run if n <= 1000 else None
+
+
+@case
+def Equation_str(n):
+	psi_0 = DesignFactor("psi_{0}", 0.7)
+	equations = [EC0.Eq6_1(psi_0, value) for value in _values("Q_{k}", min(n, BATCH - 1))]
+	repeat = max(1, n // len(equations))
+	return lambda: [str(equation) for _ in range(repeat) for equation in equations]
+
+
+@case
+def Report_markdown(n):
+	psi_0 = DesignFactor("psi_{0}", 0.7)
+	equations = [EC0.Eq6_1(psi_0, value) for value in _values("Q_{k}", min(n, BATCH - 1))]
+	repeat = max(1, n // len(equations))
+	return lambda: Report(equations * repeat, io.StringIO(), format="markdown")
+
+
+def Measure(run, minimum: float = 0.2, repeats: int = 3) -> float:
+	"""Best time of a few repeats, repeating quick runs until minimum seconds pass."""
+	best = float("inf")
+	total = 0.0
+	count = 0
+	while count < repeats or total < minimum:
+		start = time.perf_counter()
+		run()
+		elapsed = time.perf_counter() - start
+		best = min(best, elapsed)
+		total += elapsed
+		count += 1
+		if count >= repeats and elapsed > minimum:
+			break
+	return best
+
+
+def Run(names=None, scales=(1, 1000, 1000000)) -> dict:
+	results = {}
+	for name, setup in cases.items():
+		if names and name not in names:
+			continue
+		for n in scales:
+			run = setup(n)
+			if run is None:
+				continue
+			seconds = Measure(run)
+			results[f"{name}@{n}"] = {"seconds": seconds, "throughput": n / seconds}
+	return results
+
+
+def Compare(results: dict, baseline: dict, threshold: float) -> list:
+	"""Returns (case, baseline, current) for every case slower than the threshold."""
+	regressions = []
+	for key, result in results.items():
+		reference = baseline.get(key)
+		if reference is None:
+			continue
+		if result["throughput"] < reference["throughput"] * (1 - threshold):
+			regressions.append((key, reference["throughput"], result["throughput"]))
+	return regressions
+
+
+def main(argv=None) -> int:
+	parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+	parser.add_argument("cases", nargs="*", help="cases to run (default: all)")
+	parser.add_argument("--scales", nargs="+", type=int, default=[1, 1000, 1000000])
+	parser.add_argument("--output", help="write the results as JSON to this file")
+	parser.add_argument("--baseline", help="JSON output of an earlier run to compare with")
+	parser.add_argument("--threshold", type=float, default=0.2,
+	                    help="allowed fractional loss of throughput (default: 0.2)")
+	arguments = parser.parse_args(argv)
+
+	logging.disable(logging.CRITICAL)
+	UnitConversion.Registry()
+	Glossary.Definitions()
+	results = Run(arguments.cases, arguments.scales)
+	for key, result in results.items():
+		print(f"{key:35}{result['seconds']:12.6f} s{result['throughput']:16.0f} /s")
+
+	if arguments.output:
+		with open(arguments.output, "w") as file:
+			json.dump({
+			    "python": platform.python_version(),
+			    "machine": platform.machine(),
+			    "results": results
+			}, file, indent=1)
+
+	if arguments.baseline:
+		with open(arguments.baseline) as file:
+			baseline = json.load(file)["results"]
+		regressions = Compare(results, baseline, arguments.threshold)
+		for key, reference, current in regressions:
+			print(f"REGRESSION {key}: {current:.0f} /s against {reference:.0f} /s")
+		if regressions:
+			return 1
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
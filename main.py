@@ -78,6 +78,15 @@ print(f"{Utilisation_1}")
 print(f"{Utilisation_2:short}")
 
 
-total = max(Utilisation_1.number, Utilisation_2.number) * 100
+#The governing check, kept without holding on to every result
+envelope = EC0.Envelope(k=1)
+envelope.add(Utilisation_1, "resistance")
+envelope.add(Utilisation_2, "deflection")
+total = envelope.governing()[0].number * 100
 print(f"Overall Utilisation: {total:.2f} [%]")
-print("")
\ No newline at end of file
+print("")
+
+#Example of how to enumerate the combinations of many actions at once
+combinations = EC0.Combinations([Q_k_wind, Q_k_live, Q_k_heat], psi_0, psi_1,
+                                psi_2, gamma_Q)
+print(combinations)
\ No newline at end of file
@@ -10,10 +10,9 @@ setup(
     include_package_data=True,
     package_data={
         "EC0": ["definitions.csv"],
-		"Settings": ["forceUnits.csv"],
-		"Settings": ["lengthUnits.csv"],
+		"Settings": ["*Units.csv"],
     },
-    install_requires=[],
+    install_requires=["numpy"],
     license="Fair Source License",
     classifiers=[
         "Programming Language :: Python :: 3",